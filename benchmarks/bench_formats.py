@@ -0,0 +1,111 @@
+"""
+Output format comparison: JSON vs the compact binary catalog.
+
+Generates both formats from the same synthetic corpus and reports file size
+and load time. JSON has to be parsed in full before any lookup; the binary
+reader only maps the file, so a single lookup touches one record.
+
+Usage:
+    uv run python benchmarks/bench_formats.py
+    uv run python benchmarks/bench_formats.py --scales 1 10 --repeat 5
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+from icarus_consumables.generators.binary import BinaryCatalogReader, BinaryGenerator
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+CORPUS_SEED = 0
+LOOKUPS = 100
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Runs func repeat times and returns the fastest wall time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, (time.perf_counter() - start) * 1000.0)
+    return best
+
+def _load_json(paths: list[Path]) -> list[dict]:
+    docs = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            docs.append(json.load(f))
+    return docs
+
+def _json_lookups(paths: list[Path], names: list[str]) -> list[dict]:
+    items = {item["name"]: item for item in _load_json(paths[:1])[0]["items"]}
+    return [items[name] for name in names]
+
+def _binary_open(path: Path) -> int:
+    with BinaryCatalogReader(path) as reader:
+        return len(reader)
+
+def _binary_lookups(path: Path, names: list[str]) -> list[dict]:
+    with BinaryCatalogReader(path) as reader:
+        return [reader.get(name) for name in names]
+
+def _binary_decode_all(path: Path) -> list[dict]:
+    with BinaryCatalogReader(path) as reader:
+        return list(reader)
+
+def bench_scale(scale: float, repeat: int) -> None:
+    """Generates both formats for one corpus and prints sizes and load times."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        corpus_dir = write_corpus(tmp_dir / "corpus", scale, CORPUS_SEED)
+        items, _ = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {}).process()
+
+        json_generator = JsonGenerator("consumables_data.json")
+        json_generator.output_path = tmp_dir / "consumables_data.json"
+        json_generator.generate(items)
+        json_paths = json_generator.artifact_paths()
+
+        binary_generator = BinaryGenerator("consumables.icb")
+        binary_generator.output_path = tmp_dir / "consumables.icb"
+        binary_generator.generate(items)
+        binary_path = binary_generator.output_path
+
+        with BinaryCatalogReader(binary_path) as reader:
+            all_names = reader.keys()
+        names = random.Random(CORPUS_SEED).choices(all_names, k=LOOKUPS)
+
+        json_size = sum(p.stat().st_size for p in json_paths)
+        binary_size = binary_path.stat().st_size
+        print(f"📦 {scale:g}x corpus: {len(all_names)} items")
+        print(f"   {'Size':<34}  {'JSON':>10}  {'binary':>10}  {'ratio':>6}")
+        print(f"   {'bytes on disk':<34}  {json_size:10,d}  {binary_size:10,d}  {binary_size / json_size:6.1%}")
+
+        timings = [
+            ("open (ms)", lambda: _load_json(json_paths), lambda: _binary_open(binary_path)),
+            (f"{LOOKUPS} random item lookups (ms)", lambda: _json_lookups(json_paths, names), lambda: _binary_lookups(binary_path, names)),
+            ("decode every item (ms)", lambda: _load_json(json_paths[:1]), lambda: _binary_decode_all(binary_path))
+        ]
+        print(f"   {'Load':<34}  {'JSON':>10}  {'binary':>10}  {'speedup':>7}")
+        for label, json_func, binary_func in timings:
+            json_ms = _best_of(json_func, repeat)
+            binary_ms = _best_of(binary_func, repeat)
+            print(f"   {label:<34}  {json_ms:10.2f}  {binary_ms:10.2f}  {json_ms / binary_ms:6.1f}x")
+
+def main():
+    """Runs the format comparison."""
+    parser = argparse.ArgumentParser(description="Compare JSON and binary catalog size and load time")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 10.0], help="Corpus scale factors to compare")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest is kept")
+    args = parser.parse_args()
+
+    for scale in args.scales:
+        bench_scale(scale, args.repeat)
+
+if __name__ == "__main__":
+    main()
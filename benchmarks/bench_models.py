@@ -0,0 +1,120 @@
+"""
+Model footprint benchmark: memory per parsed item and object creation time.
+
+Parses a synthetic catalog and reports the deep size of the model graph
+(every unique object reachable from the parsed items: models, containers,
+strings and numbers, shared objects counted once) divided by the item count,
+plus the time to construct each model class and to run parse_all.
+
+Usage:
+    uv run python benchmarks/bench_models.py
+    uv run python benchmarks/bench_models.py --scales 1 10 --repeat 5
+"""
+import argparse
+import dataclasses
+import sys
+import time
+from typing import Any, Callable
+from icarus_consumables.models.consumable import ConsumableData
+from icarus_consumables.models.item import IcarusItem
+from icarus_consumables.models.modifier import ModifierEffect, StatEffect, StatType
+from icarus_consumables.models.recipe import Ingredient, Recipe
+from icarus_consumables.models.tier import TierInfo
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.synthetic_corpus import build_corpus
+
+CORPUS_SEED = 0
+CONSTRUCTIONS = 20000
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Runs func repeat times and returns the fastest wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def deep_size(roots: list[Any]) -> tuple[int, int]:
+    """
+    Returns (bytes, object count) of every unique object reachable from roots
+    through dataclass fields and container contents.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or obj is None or isinstance(obj, (bool, type)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if dataclasses.is_dataclass(obj):
+            if hasattr(obj, "__dict__"):
+                # Counted separately from the instance itself
+                stack.append(obj.__dict__)
+            stack.extend(getattr(obj, f.name) for f in dataclasses.fields(obj))
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total, len(seen)
+
+def bench_creation(repeat: int) -> dict[str, float]:
+    """
+    Times constructing each model class; returns nanoseconds per object.
+    """
+    tier = TierInfo(2, 0.3, 2.3, "Crafting_Bench", False)
+    effect = StatEffect("BaseStaminaRegen", StatType.PERCENTAGE, 20)
+    modifier = ModifierEffect("Stew_Buff", "Well Fed", "", 600, [effect])
+    item = IcarusItem("meat", "Meat", "")
+    ingredient = Ingredient(item=item, count=2)
+    recipe = Recipe("Recipe_Stew", ["Kitchen Stove"], [ingredient], [ingredient])
+    n = range(CONSTRUCTIONS)
+    cases = {
+        "TierInfo": lambda: [TierInfo(2, 0.3, 2.3, "Crafting_Bench", False) for _ in n],
+        "StatEffect": lambda: [StatEffect("BaseStaminaRegen", StatType.PERCENTAGE, 20) for _ in n],
+        "ModifierEffect": lambda: [ModifierEffect("Stew_Buff", "Well Fed", "", 600, [effect]) for _ in n],
+        "IcarusItem": lambda: [IcarusItem("meat", "Meat", "") for _ in n],
+        "Ingredient": lambda: [Ingredient(item=item, count=2) for _ in n],
+        "Recipe": lambda: [Recipe("Recipe_Stew", ["Kitchen Stove"], [ingredient], [ingredient]) for _ in n],
+        "ConsumableData": lambda: [
+            ConsumableData("stew", "Stew", "", category="Food", base_stats={"Food": 40.0}, modifiers=[modifier], recipes=[recipe], tier_info=tier)
+            for _ in n
+        ]
+    }
+    return {name: _best_of(func, repeat) / CONSTRUCTIONS * 1e9 for name, func in cases.items()}
+
+def bench_scale(scale: float, repeat: int) -> None:
+    """Parses one corpus and prints the per-item footprint and parse time."""
+    data = build_corpus(scale, CORPUS_SEED)
+    app = IcarusFoodParserApp(IcarusDataLoader(), {})
+    item_index = app._build_item_index(data)
+    services = app._build_services(data, item_index)
+
+    parse_s = _best_of(lambda: app._parse(data, services, item_index), repeat)
+    items = app._parse(data, services, item_index)
+    size, objects = deep_size(items)
+    print(f"📦 {scale:g}x corpus: {len(items)} items")
+    print(f"   model graph         {size / 1024:10.1f} KiB  ({size / len(items):,.0f} B/item, {objects / len(items):.1f} objects/item)")
+    print(f"   parse_all           {parse_s * 1000:10.2f} ms")
+
+def main():
+    """Runs the model benchmark."""
+    parser = argparse.ArgumentParser(description="Measure model memory per item and construction time")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 10.0], help="Corpus scale factors to parse")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the fastest is kept")
+    args = parser.parse_args()
+
+    print(f"⏱  Construction time ({CONSTRUCTIONS} objects, best of {args.repeat})")
+    for name, ns in bench_creation(args.repeat).items():
+        print(f"   {name:<18}  {ns:8.0f} ns/object")
+    for scale in args.scales:
+        bench_scale(scale, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Service-level benchmark suite with baseline regression gating.
+
+Times each pipeline service on fixed synthetic corpora (same seed every run)
+and compares the best-of-N wall time per stage against benchmarks/baseline.json.
+Exits with status 1 when any stage is slower than the baseline by more than
+the threshold.
+
+Usage:
+    uv run python benchmarks/bench_services.py                      # compare against baseline
+    uv run python benchmarks/bench_services.py --update-baseline    # record a new baseline
+    uv run python benchmarks/bench_services.py --threshold 0.5 --scales 1 10
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.services.tier_mapper import IcarusTierMapper
+from icarus_consumables.services.recipe_service import RecipeService
+from icarus_consumables.utils.path_resolver import resolve_path
+from icarus_consumables.utils.synthetic_corpus import build_corpus
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+CORPUS_SEED = 0
+
+def _best_of(func: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """
+    Runs func repeat times and returns the fastest wall time in milliseconds with the last result.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, (time.perf_counter() - start) * 1000.0)
+    return best, result
+
+def bench_corpus(scale: float, repeat: int, config: dict[str, Any]) -> dict[str, float]:
+    """
+    Times every stage on one corpus. Each stage reuses the previous stage's
+    output, so only the stage under test is inside the timed call.
+    """
+    data = build_corpus(scale, CORPUS_SEED)
+    app = IcarusFoodParserApp(IcarusDataLoader(), config)
+    results: dict[str, float] = {}
+
+    results["ItemIndexService.build"], item_index = _best_of(lambda: app._build_item_index(data), repeat)
+    services = app._build_services(data, item_index)
+
+    results["RecipeService.init"], _ = _best_of(
+        lambda: RecipeService(data["recipes"], data["items_static"], services["tag"], item_index), repeat
+    )
+
+    static_item_dict = {str(r.get("Name")): r for r in data["items_static"]}
+    results["IcarusTierMapper.init"], tier_mapper = _best_of(
+        lambda: IcarusTierMapper(
+            static_item_dict, data["talents"], services["recipe"], data["workshop_items"],
+            data["item_templates"], data["consumables"], item_index
+        ),
+        repeat
+    )
+
+    tier_inputs = []
+    for row in data["consumables"]:
+        name = str(row.get("Name"))
+        recipe_rows = services["recipe"].get_recipe_rows_for_item(name)
+        tier_inputs.append((name, recipe_rows[0] if recipe_rows else None))
+    results["IcarusTierMapper.calculate_tier"], _ = _best_of(
+        lambda: [tier_mapper.calculate_tier(name, row) for name, row in tier_inputs], repeat
+    )
+
+    results["ConsumableDataParser.parse_all"], items = _best_of(lambda: app._parse(data, services, item_index), repeat)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        generator = JsonGenerator("consumables_data.json")
+        generator.output_path = Path(tmp_dir) / "consumables_data.json"
+        results["JsonGenerator.generate"], _ = _best_of(lambda: generator.generate(items), repeat)
+
+    return results
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float, min_ms: float) -> list[str]:
+    """
+    Prints a comparison table and returns a description of every regression.
+    Stages faster than min_ms in both runs are reported but never gated, since
+    their timings are dominated by noise.
+    """
+    regressions = []
+    print(f"   {'Corpus':<6}  {'Stage':<34}  {'baseline ms':>11}  {'current ms':>10}  {'change':>8}")
+    for corpus, stages in results.items():
+        for stage, ms in stages.items():
+            base_ms = baseline.get(corpus, {}).get(stage)
+            if base_ms is None:
+                print(f"   {corpus:<6}  {stage:<34}  {'-':>11}  {ms:10.2f}  {'new':>8}")
+                continue
+
+            change = (ms - base_ms) / base_ms if base_ms else 0.0
+            flag = ""
+            if change > threshold and max(ms, base_ms) >= min_ms:
+                flag = " ❌"
+                regressions.append(f"{corpus} {stage}: {base_ms:.2f} ms -> {ms:.2f} ms ({change:+.0%})")
+            print(f"   {corpus:<6}  {stage:<34}  {base_ms:11.2f}  {ms:10.2f}  {change:+8.0%}{flag}")
+    return regressions
+
+def main():
+    """Runs the benchmark suite and gates on the stored baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark pipeline services against a stored baseline")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 10.0], help="Corpus scale factors to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the fastest is kept")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown as a fraction of the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="Ignore regressions in stages faster than this")
+    parser.add_argument("--baseline", type=str, default=str(BASELINE_PATH), help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the current results as the new baseline")
+    args = parser.parse_args()
+
+    with open(resolve_path("src/icarus_consumables/config/processing_config.json"), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    results: dict[str, dict[str, float]] = {}
+    for scale in args.scales:
+        corpus = f"{scale:g}x"
+        print(f"⏱  Benchmarking {corpus} corpus...")
+        results[corpus] = {stage: round(ms, 3) for stage, ms in bench_corpus(scale, args.repeat, config).items()}
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline or not baseline_path.exists():
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "metadata": {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "seed": CORPUS_SEED,
+                    "repeat": args.repeat
+                },
+                "results": results
+            }, f, indent=4)
+        print(f"✅ Baseline written to {baseline_path}")
+        return
+
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f).get("results", {})
+
+    regressions = compare(results, baseline, args.threshold, args.min_ms)
+    if regressions:
+        print(f"❌ {len(regressions)} stage(s) regressed by more than {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"   - {line}")
+        sys.exit(1)
+    print("✅ No regressions against baseline.")
+
+if __name__ == "__main__":
+    main()
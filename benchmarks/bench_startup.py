@@ -0,0 +1,111 @@
+"""
+CLI startup benchmark with a time budget.
+
+Runs each lightweight CLI entry path in a fresh interpreter and reports its
+best-of-N wall time over a bare `python -c pass`, plus the package modules it
+imported and their cumulative import time (from `python -X importtime`).
+Exits with status 1 when a command exceeds the startup budget or imports a
+module it should not need (the pipeline, services or generators).
+
+Usage:
+    uv run python benchmarks/bench_startup.py
+    uv run python benchmarks/bench_startup.py --budget-ms 30 --repeat 10 --top 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Command name -> interpreter arguments; each should only import argparse and app.py
+COMMANDS = {
+    "import app": ["-c", "import icarus_consumables.app"],
+    "--help": [str(ROOT / "main.py"), "--help"],
+    "--version": [str(ROOT / "main.py"), "--version"]
+}
+
+# Package modules none of the commands above may import
+FORBIDDEN_PREFIXES = (
+    "icarus_consumables.parser",
+    "icarus_consumables.services.",
+    "icarus_consumables.generators.",
+    "icarus_consumables.server",
+    "icarus_consumables.watcher"
+)
+
+def _env() -> dict[str, str]:
+    """Returns an environment in which the child interpreter can import the package from src/."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    return env
+
+def _best_of(args: list[str], repeat: int) -> float:
+    """
+    Runs the interpreter with args repeat times and returns the fastest wall time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=_env(), cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+def import_times(args: list[str]) -> dict[str, float]:
+    """
+    Runs the interpreter once under -X importtime and returns the cumulative
+    import time in milliseconds of every icarus_consumables module it loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=_env(), cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        module = parts[2].strip()
+        if module.startswith("icarus_consumables"):
+            times[module] = int(parts[1]) / 1000.0
+    return times
+
+def main():
+    """Runs the startup benchmark and gates on the budget."""
+    parser = argparse.ArgumentParser(description="Measure CLI startup time and gate it on a budget")
+    parser.add_argument("--budget-ms", type=float, default=25.0, help="Allowed wall time over a bare interpreter per command (default: 25)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command; the fastest is kept")
+    parser.add_argument("--top", type=int, default=3, help="Slowest package imports to list per command")
+    args = parser.parse_args()
+
+    bare_ms = _best_of(["-c", "pass"], args.repeat)
+    print(f"⏱  Bare interpreter: {bare_ms:.1f} ms (best of {args.repeat})")
+    print(f"   {'Command':<12}  {'wall ms':>8}  {'over bare':>9}  {'pkg import ms':>13}  {'modules':>7}")
+
+    failures = []
+    for name, command in COMMANDS.items():
+        wall_ms = _best_of(command, args.repeat)
+        times = import_times(command)
+        top_level = max(times.values(), default=0.0)
+        print(f"   {name:<12}  {wall_ms:8.1f}  {wall_ms - bare_ms:9.1f}  {top_level:13.1f}  {len(times):7d}")
+        for module, ms in sorted(times.items(), key=lambda entry: -entry[1])[:args.top]:
+            print(f"      {module:<40}  {ms:6.1f} ms")
+
+        if wall_ms - bare_ms > args.budget_ms:
+            failures.append(f"{name} took {wall_ms - bare_ms:.1f} ms over a bare interpreter (budget {args.budget_ms:g} ms)")
+        forbidden = sorted(m for m in times if m.startswith(FORBIDDEN_PREFIXES))
+        if forbidden:
+            failures.append(f"{name} imported {', '.join(forbidden)}")
+
+    if failures:
+        print("❌ Startup budget exceeded:")
+        for failure in failures:
+            print(f"   - {failure}")
+        sys.exit(1)
+    print(f"✅ Every command started within {args.budget_ms:g} ms of a bare interpreter")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Load test for the query server: throughput and latency percentiles.
+
+Either targets a running server (--url) or starts one in-process on a
+synthetic corpus. Each worker thread keeps one HTTP/1.1 connection open
+and cycles through a fixed query mix. A second pass repeats the run with
+If-None-Match so revalidated (304) responses are measured too.
+
+Usage:
+    uv run python benchmarks/load_server.py                       # in-process, 1x corpus
+    uv run python benchmarks/load_server.py --scale 10 --concurrency 16
+    uv run python benchmarks/load_server.py --url http://127.0.0.1:8765
+"""
+import argparse
+import http.client
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.server import CatalogHTTPServer, CatalogQueryService
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.path_resolver import resolve_path
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+QUERY_MIX = [
+    "/items",
+    "/items?category=Drink",
+    "/items?category=Food&min_tier=2",
+    "/items?min_tier=1&max_tier=2.5",
+    "/items?stat=BaseFoodRecovery",
+    "/items?bench=Kitchen_Stove",
+    "/items?category=Medicine&bench=Fabricator&limit=10",
+    "/health",
+]
+
+def _start_local_server(scale: float) -> tuple[CatalogHTTPServer, tempfile.TemporaryDirectory]:
+    """
+    Parses a synthetic corpus and starts a server on an ephemeral port in a background thread.
+    """
+    tmp_dir = tempfile.TemporaryDirectory()
+    corpus_dir = write_corpus(Path(tmp_dir.name) / "corpus", scale)
+    with open(resolve_path("src/icarus_consumables/config/processing_config.json"), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    app = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), config)
+    items, _ = app.process()
+    generator = JsonGenerator("consumables_data.json")
+    server = CatalogHTTPServer(("127.0.0.1", 0), CatalogQueryService(items, generator))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, tmp_dir
+
+def _fetch_etags(host: str, port: int) -> dict[str, str]:
+    """Requests every query once and returns its ETag."""
+    conn = http.client.HTTPConnection(host, port)
+    etags = {}
+    for path in QUERY_MIX:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        etags[path] = response.getheader("ETag", "")
+    conn.close()
+    return etags
+
+def run_load(host: str, port: int, total: int, concurrency: int, etags: dict[str, str] = None) -> dict[str, float]:
+    """
+    Issues total requests across concurrency worker threads and returns throughput and latency percentiles.
+    """
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    lock = threading.Lock()
+    per_worker = total // concurrency
+
+    def worker(offset: int):
+        conn = http.client.HTTPConnection(host, port)
+        local = []
+        local_statuses: dict[int, int] = {}
+        for i in range(per_worker):
+            path = QUERY_MIX[(offset + i) % len(QUERY_MIX)]
+            headers = {"If-None-Match": etags[path]} if etags else {}
+            start = time.perf_counter()
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            local.append(time.perf_counter() - start)
+            local_statuses[response.status] = local_statuses.get(response.status, 0) + 1
+        conn.close()
+        with lock:
+            latencies.extend(local)
+            for status, count in local_statuses.items():
+                statuses[status] = statuses.get(status, 0) + count
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000.0
+
+    return {
+        "requests": len(latencies),
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "statuses": statuses
+    }
+
+def main():
+    """Runs the load test and prints one line per pass."""
+    parser = argparse.ArgumentParser(description="Load test the catalog query server")
+    parser.add_argument("--url", type=str, default=None, help="Target an already running server instead of starting one")
+    parser.add_argument("--scale", type=float, default=1.0, help="Synthetic corpus scale for the in-process server")
+    parser.add_argument("--requests", type=int, default=4000, help="Total requests per pass")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent keep-alive connections")
+    args = parser.parse_args()
+
+    server = tmp_dir = None
+    if args.url:
+        target = urlsplit(args.url)
+        host, port = target.hostname, target.port or 80
+    else:
+        print(f"🛠 Starting in-process server on a {args.scale:g}x synthetic corpus...")
+        server, tmp_dir = _start_local_server(args.scale)
+        host, port = server.server_address[:2]
+
+    try:
+        # Warm the server-side response cache before measuring
+        etags = _fetch_etags(host, port)
+        for label, conditional in (("full responses", None), ("If-None-Match (304)", etags)):
+            result = run_load(host, port, args.requests, args.concurrency, conditional)
+            print(
+                f"   {label:<20} {result['requests']:6d} req  {result['throughput_rps']:9.0f} req/s  "
+                f"p50 {result['p50_ms']:6.2f} ms  p95 {result['p95_ms']:6.2f} ms  p99 {result['p99_ms']:6.2f} ms  "
+                f"statuses {result['statuses']}"
+            )
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+            tmp_dir.cleanup()
+
+if __name__ == "__main__":
+    main()
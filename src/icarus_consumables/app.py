@@ -1,44 +1,203 @@
 import argparse
 import sys
 import json
-from icarus_consumables.services.data_loader import IcarusDataLoader
-from icarus_consumables.parser import IcarusFoodParserApp
-from icarus_consumables.generators.json import JsonGenerator
-from icarus_consumables.utils.path_resolver import resolve_path
+from typing import Any
 
-def main():
-    """Main entry point for the Icarus Food Parser."""
+# Only argparse, sys and json load before dispatch; each command imports the
+# pipeline, generators, server or watcher itself, so --help and --version stay cheap.
+CONFIG_PATH = "src/icarus_consumables/config/processing_config.json"
+
+class _VersionAction(argparse.Action):
+    """
+    Prints the package and parser versions. Unlike action="version", the
+    version is only looked up when the flag is actually given.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        config, _ = _load_config()
+        print(f"icarus-consumables {_package_version()} (parser {config.get('PARSER_VERSION', 'TBD')}, game {config.get('GAME_VERSION', 'TBD')})")
+        parser.exit()
+
+def _package_version() -> str:
+    """
+    Returns the installed package version, or the pyproject.toml version when running from a source checkout.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version("icarus-consumables")
+    except PackageNotFoundError:
+        import tomllib
+        from icarus_consumables.utils.path_resolver import resolve_path
+        try:
+            with open(resolve_path("pyproject.toml"), 'rb') as f:
+                return tomllib.load(f)["project"]["version"]
+        except (OSError, KeyError, tomllib.TOMLDecodeError):
+            return "unknown"
+
+def _load_config(args: Any = None) -> tuple[dict[str, Any], Any]:
+    """
+    Loads processing_config.json, applies command-line overrides and returns it with its path.
+    """
+    from icarus_consumables.utils.path_resolver import resolve_path
+    config_path = resolve_path(CONFIG_PATH)
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    if args is not None:
+        if args.profile_dir:
+            config["PROFILE_DIR"] = args.profile_dir
+        if args.release_tables:
+            config["RELEASE_RAW_TABLES"] = True
+        if args.generators:
+            config["GENERATORS"] = args.generators
+    return config, config_path
+
+def _build_app(args: Any, config: dict[str, Any], use_cache: bool = False) -> Any:
+    """
+    Creates the app with its data loader, profilers and optional run cache (no generators yet).
+    """
+    from icarus_consumables.parser import IcarusFoodParserApp
+    from icarus_consumables.services.data_loader import IcarusDataLoader
+    from icarus_consumables.utils.path_resolver import resolve_path
+    from icarus_consumables.utils.profiler import PipelineProfiler, MemoryProfiler
+
+    loader = IcarusDataLoader(pak_dir=args.data_dir)
+    profiler = PipelineProfiler(enabled=args.profile, cprofile=args.cprofile)
+    memory_profiler = MemoryProfiler(enabled=args.memory_profile)
+    run_cache = None
+    if use_cache and config.get("RUN_CACHE", True) and not args.no_cache:
+        from icarus_consumables.utils.run_cache import RunCache
+        run_cache = RunCache(
+            resolve_path(config.get("CACHE_DIR", "output/.cache")),
+            int(config.get("CACHE_MAX_ENTRIES", 5))
+        )
+    return IcarusFoodParserApp(loader, config, profiler, memory_profiler, run_cache)
+
+def _add_generators(app: Any, config: dict[str, Any]):
+    """
+    Registers the generators selected by GENERATORS; only their modules are imported.
+    """
+    from icarus_consumables.generators.registry import create_generators
+    for generator in create_generators(config):
+        app.add_generator(generator)
+
+def _run_pipeline(args: Any):
+    """Runs the full pipeline once (the default command)."""
+    config, _ = _load_config(args)
+    app = _build_app(args, config, use_cache=True)
+    _add_generators(app, config)
+    app.run(use_async=args.use_async)
+
+def _run_watch(args: Any):
+    """Keeps the pipeline state in memory and rebuilds when inputs change."""
+    from icarus_consumables.generators.registry import create_generators
+    from icarus_consumables.watcher import PipelineWatcher
+    config, config_path = _load_config(args)
+    app = _build_app(args, config)
+    _add_generators(app, config)
+    # Config edits keep the command-line overrides and re-select the generators
+    PipelineWatcher(app, config_path, args.interval, lambda: _load_config(args)[0], create_generators).run()
+
+def _run_serve(args: Any):
+    """Runs the pipeline once and answers item queries over HTTP (no output files are written)."""
+    from icarus_consumables.generators.registry import create_generator
+    from icarus_consumables.server import serve
+    config, _ = _load_config(args)
+    app = _build_app(args, config)
+    items, _ = app.process()
+    serve(items, create_generator("json", config), args.host, args.port, args.verbose)
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command-line parser. Each command stores its handler in args.handler.
+    """
     parser = argparse.ArgumentParser(description="Icarus Food and Consumable Data Parser")
+    parser.set_defaults(handler=_run_pipeline)
+    parser.add_argument(
+        "--version",
+        action=_VersionAction,
+        help="Show the package and parser versions and exit"
+    )
     parser.add_argument(
         "--data-dir", 
         type=str, 
         default="unpacked_icarus_data",
         help="Path to the directory containing unpacked Icarus game data (JSON files)"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time every pipeline stage and service, print a breakdown and write a Chrome trace"
+    )
+    parser.add_argument(
+        "--cprofile",
+        action="store_true",
+        help="With --profile, also capture a cProfile dump for each top-level stage"
+    )
+    parser.add_argument(
+        "--memory-profile",
+        action="store_true",
+        help="Record retained/peak memory and top allocation sites after each pipeline stage"
+    )
+    parser.add_argument(
+        "--release-tables",
+        action="store_true",
+        help="Free raw game data tables as soon as the services that read them are done"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=None,
+        help="Directory for profiling output (default: output/profile)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the full pipeline, ignoring and not updating the run cache"
+    )
+    parser.add_argument(
+        "--generators",
+        nargs="+",
+        metavar="NAME",
+        default=None,
+        help="Output generators to run by registry name (e.g. json sqlite binary), overriding GENERATORS in processing_config.json"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run stages as asyncio tasks that start as soon as their inputs are ready (overlaps I/O and CPU work)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Keep state in memory and rebuild incrementally when game data, overrides or config change"
+    )
+    watch_parser.set_defaults(handler=_run_watch)
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Polling interval in seconds (default: 1.0)"
+    )
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run the pipeline once and answer item queries over HTTP"
+    )
+    serve_parser.set_defaults(handler=_run_serve)
+    serve_parser.add_argument("--host", type=str, default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    serve_parser.add_argument("--verbose", action="store_true", help="Log every request")
+    return parser
+
+def main(argv: list[str] | None = None):
+    """Main entry point for the Icarus Food Parser."""
+    args = build_arg_parser().parse_args(argv)
 
     try:
-        # 1. Load configuration
-        config_path = resolve_path("src/icarus_consumables/config/processing_config.json")
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-
-        # 2. Initialize data loader
-        loader = IcarusDataLoader(pak_dir=args.data_dir)
-        
-        # 3. Create app instance
-        app = IcarusFoodParserApp(loader, config)
-        
-        # 4. Register generators
-        app.add_generator(JsonGenerator(
-            "consumables_data.json", 
-            parser_version=config.get("PARSER_VERSION", "v2.1.0"),
-            game_version=config.get("GAME_VERSION", "TBD")
-        ))
-        
-        # 5. Run pipeline
-        app.run()
-        
+        args.handler(args)
     except Exception as e:
         print(f"❌ Error during execution: {e}")
         import traceback
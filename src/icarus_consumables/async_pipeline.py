@@ -0,0 +1,147 @@
+import asyncio
+import time
+from typing import Any, Callable, Iterable
+from icarus_consumables.parser import IcarusFoodParserApp
+
+class AsyncPipeline:
+    """
+    Runs the pipeline as asyncio tasks with declared dependencies instead of
+    fixed phases. Every table read, the override files and each generator's
+    inputs (e.g., stat_metadata.json) load concurrently; each service is
+    built on an executor thread as soon as the tables and services it
+    declares in SERVICE_DEPENDENCIES are ready; the item index mapping is
+    written while services are still building; each data view the generators
+    declare is built once the items are parsed; and every generator starts
+    once the items and its own views are ready. End-to-end latency is therefore the critical
+    path through the stage graph rather than the sum of all stages.
+    """
+
+    def __init__(self, app: IcarusFoodParserApp):
+        """
+        Initializes the pipeline around a configured app (generators already registered).
+        """
+        self.app = app
+        self.data: dict[str, Any] = {}
+        self.services: dict[str, Any] = {}
+        self.item_index: Any = None
+        self.processed_data: list[Any] = []
+        self.snapshot: tuple[Any, ...] = ()
+        self.views: Any = None
+        self.dependencies: dict[str, tuple[str, ...]] = {}
+        self.spans: dict[str, tuple[float, float]] = {}  # Stage -> (start, end) in perf_counter seconds
+        self.depth = 0  # Profiler depth of the caller; executor threads nest their spans under it
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def run(self) -> tuple[list[Any], Any]:
+        """
+        Executes every stage and returns the parsed items and the Master Item Index.
+        """
+        self.depth = self.app.profiler.current_depth()
+        start = time.perf_counter()
+        asyncio.run(self._run())
+        total_ms = (time.perf_counter() - start) * 1000.0
+        path, path_ms = self.critical_path()
+        print(f"⏱  Async pipeline finished in {total_ms:.0f} ms (critical path {path_ms:.0f} ms: {' → '.join(path)})")
+        return self.processed_data, self.item_index
+
+    def _stage(self, name: str, deps: Iterable[str], func: Callable[[], Any], profiled: bool = True):
+        """
+        Declares a stage: func runs on an executor thread once every dependency
+        has finished. Stages whose func records its own profiler span pass profiled=False.
+        """
+        self.dependencies[name] = tuple(deps)
+        self._tasks[name] = asyncio.create_task(self._run_stage(name, func, profiled), name=name)
+
+    async def _run_stage(self, name: str, func: Callable[[], Any], profiled: bool) -> Any:
+        deps = [self._tasks[d] for d in self.dependencies[name]]
+        if deps:
+            await asyncio.gather(*deps)
+        return await asyncio.to_thread(self._timed, name, func, profiled)
+
+    def _timed(self, name: str, func: Callable[[], Any], profiled: bool) -> Any:
+        # Executor threads are reused and start at depth 0; place every stage under the caller's span
+        profiler = self.app.profiler
+        start = time.perf_counter()
+        try:
+            with profiler.at_depth(self.depth):
+                if not profiled:
+                    return func()
+                with profiler.stage(name, "async"):
+                    return func()
+        finally:
+            self.spans[name] = (start, time.perf_counter())
+
+    async def _run(self):
+        app = self.app
+        loader = app.data_loader
+
+        # 1. I/O: every table, the override files and generator inputs at once
+        for key, relative_path in loader.TABLE_PATHS.items():
+            self._stage(key, (), lambda key=key, relative_path=relative_path: self._load_table(key, relative_path))
+        for gen in app.generators:
+            self._stage(f"inputs:{gen.output_path.name}", (), gen.load_inputs)
+
+        # 2. Item index, written out as soon as it exists
+        self._stage("item_index", app.ITEM_INDEX_TABLES, self._build_item_index)
+        self._stage("export_item_index", ("item_index",), lambda: self.item_index.export_to_json(app.ITEM_INDEX_PATH))
+
+        # 3. Services, each gated on its own declared inputs ("config" needs no stage;
+        # "overrides" are read by OverrideService itself, which has no other dependency)
+        for name, inputs in app.SERVICE_DEPENDENCIES.items():
+            deps = [d for d in inputs if d not in ("config", "overrides")]
+            self._stage(name, deps, lambda name=name: app._build_service(name, self.data, self.item_index, self.services))
+
+        # 4. Parse, the declared data views, then every generator concurrently against one snapshot
+        self._stage("parse", list(app.SERVICE_DEPENDENCIES) + list(app.PARSE_TABLES), self._parse)
+        for view in app.required_views():
+            # DataViews records the "view:<name>" span itself
+            self._stage(f"view:{view}", ("parse",), lambda view=view: self._build_view(view), profiled=False)
+        for gen in app.generators:
+            name = gen.output_path.name
+            deps = ["parse", f"inputs:{name}"] + [f"view:{view}" for view in gen.REQUIRED_VIEWS]
+            self._stage(f"generate:{name}", deps, lambda gen=gen: app._run_generator(gen, self.snapshot, self.views))
+
+        try:
+            await asyncio.gather(*self._tasks.values())
+        finally:
+            # Let every started stage finish so no executor thread outlives the run
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+        results = [self._tasks[f"generate:{gen.output_path.name}"].result() for gen in app.generators]
+        app._report_generators(results)
+
+    def _load_table(self, key: str, relative_path: str):
+        self.data[key] = self.app.data_loader.load_json(relative_path)
+
+    def _build_item_index(self):
+        self.item_index = self.app._build_item_index(self.data)
+
+    def _parse(self):
+        self.processed_data = self.app._parse(self.data, self.services, self.item_index)
+        self.snapshot = tuple(self.processed_data)
+        self.views = self.app._data_views(self.snapshot)
+        print(f"✅ Processed {len(self.processed_data)} items.")
+
+    def _build_view(self, view: str):
+        try:
+            self.views.get(view)
+        except Exception:
+            # Not cached: each generator needing the view raises it again and is reported on its own
+            pass
+
+    def critical_path(self) -> tuple[list[str], float]:
+        """
+        Returns the chain of stages that determined the finish time, found by
+        walking back from the last stage to finish through the dependency that
+        finished last, and the chain's summed duration in milliseconds.
+        """
+        if not self.spans:
+            return [], 0.0
+        stage = max(self.spans, key=lambda s: self.spans[s][1])
+        path = []
+        while stage is not None:
+            path.append(stage)
+            deps = [d for d in self.dependencies.get(stage, ()) if d in self.spans]
+            stage = max(deps, key=lambda d: self.spans[d][1]) if deps else None
+        path.reverse()
+        return path, sum(self.spans[s][1] - self.spans[s][0] for s in path) * 1000.0
@@ -1,19 +1,43 @@
 from abc import ABC, abstractmethod
-from typing import List
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 from icarus_consumables.models.consumable import ConsumableData
 from icarus_consumables.utils.path_resolver import resolve_path
 
+if TYPE_CHECKING:
+    from icarus_consumables.generators.views import DataViews
+
 class BaseGenerator(ABC):
     """Abstract base class for all output generators."""
 
+    # Shared data views (see generators.views) this generator reads; the app
+    # passes them to generate() and builds only the views some generator declares
+    REQUIRED_VIEWS: tuple[str, ...] = ()
+
     def __init__(self, filename: str):
         self.output_path = resolve_path(f"output/{filename}")
         # Ensure output directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
     @abstractmethod
-    def generate(self, data: List[ConsumableData]) -> None:
-        """Generates the output file from the provided data."""
+    def generate(self, data: List[ConsumableData], views: Optional["DataViews"] = None) -> None:
+        """
+        Generates the output file from the provided data. Generators that
+        declare REQUIRED_VIEWS receive the run's shared views; without them
+        they build what they need from data.
+        """
+        pass
+
+    def artifact_paths(self) -> List[Path]:
+        """Returns every file this generator writes, so runs can be cached and restored."""
+        return [self.output_path]
+
+    def input_paths(self) -> List[Path]:
+        """Returns any extra files this generator reads (e.g., label mappings)."""
+        return []
+
+    def load_inputs(self) -> None:
+        """Reads the files from input_paths ahead of generate(); a no-op by default."""
         pass
 
     def _format_stats(self, consumable: ConsumableData) -> str:
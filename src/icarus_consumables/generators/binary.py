@@ -0,0 +1,507 @@
+"""
+Compact binary catalog (.icb), little-endian:
+
+    header      MAGIC, u16 version, u16 reserved, then 5 x u32 section offsets
+                (strings, items, recipes, modifiers, metadata)
+    strings     u32 count, (count + 1) x u32 end offsets into a UTF-8 blob, blob
+    items/      u32 count, count x (u32 record offset, u32 key string ref),
+    recipes/    then the records. Fixed-size index entries give O(1) access
+    modifiers   to any record by position.
+    metadata    u32 length + JSON (metadata and stat_metadata; rarely read)
+
+Every string is stored once in the string table and referenced by id.
+Inside records, references and small integers are unsigned varints (string
+refs are id + 1, with 0 meaning None). Optional integers such as lifetimes
+may be negative, so they are zigzag-encoded and then shifted by 1, keeping
+0 for None. Numeric stat blocks use a fixed layout of (u32 string ref,
+f64 value) entries so they decode with one struct call.
+"""
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
+from icarus_consumables.generators.base import BaseGenerator
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.models.consumable import ConsumableData
+
+if TYPE_CHECKING:
+    from icarus_consumables.generators.views import DataViews
+
+MAGIC = b"ICBN"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHH5I")
+INDEX_ENTRY = struct.Struct("<II")
+STAT_ENTRY = struct.Struct("<Id")
+EFFECT_ENTRY = struct.Struct("<IBd")
+F64 = struct.Struct("<d")
+U32 = struct.Struct("<I")
+
+# Item flag bits
+_HARVESTED, _ORBITAL, _DECAY, _OVERRIDE, _GROWTH, _BOM, _FARMING, _TRAITS = (1 << i for i in range(8))
+
+# Output flag bits
+_OUT_YIELDS_ITEM, _OUT_RANGE, _OUT_INT = 1, 2, 4
+
+class _StringTable:
+    """Assigns ids to unique strings in insertion order."""
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def ref(self, value: Optional[str]) -> int:
+        """Returns id + 1 for a string, 0 for None."""
+        if value is None:
+            return 0
+        value = str(value)
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index + 1
+
+    def encode(self) -> bytes:
+        blob = bytearray()
+        ends = []
+        for s in self.strings:
+            blob += s.encode("utf-8")
+            ends.append(len(blob))
+        return U32.pack(len(self.strings)) + struct.pack(f"<{len(ends) + 1}I", 0, *ends) + bytes(blob)
+
+class _RecordWriter:
+    """Appends varints, floats and fixed-layout blocks to a record buffer."""
+
+    def __init__(self, strings: _StringTable):
+        self.strings = strings
+        self.buf = bytearray()
+
+    def varint(self, value: int):
+        value = int(value)
+        if value < 0:
+            raise ValueError(f"Varints are unsigned, got {value}")
+        while value >= 0x80:
+            self.buf.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buf.append(value)
+
+    def ref(self, value: Optional[str]):
+        self.varint(self.strings.ref(value))
+
+    def refs(self, values: list[str]):
+        self.varint(len(values))
+        for v in values:
+            self.ref(v)
+
+    def optional_int(self, value: Optional[int]):
+        # Zigzag maps 0, -1, 1, -2, ... to 0, 1, 2, 3, ... so negatives stay small
+        if value is None:
+            self.varint(0)
+        else:
+            value = int(value)
+            self.varint((value << 1 if value >= 0 else (-value << 1) - 1) + 1)
+
+    def f64(self, value: float):
+        self.buf += F64.pack(float(value))
+
+    def stat_block(self, stats: dict[str, float]):
+        self.varint(len(stats))
+        for name, value in stats.items():
+            self.buf += STAT_ENTRY.pack(self.strings.ref(name), float(value))
+
+class BinaryGenerator(BaseGenerator):
+    """
+    Writes the catalog as a compact binary file built from the same payload
+    as the JSON output: a shared string table, varint-encoded references,
+    fixed-layout stat blocks and an offset index for O(1) random access.
+    Read it with BinaryCatalogReader.
+    """
+
+    REQUIRED_VIEWS = ("payload",)
+
+    def __init__(self, filename: str, parser_version: str = "TBD", game_version: str = "TBD"):
+        super().__init__(filename)
+        self.payload_builder = JsonGenerator(filename, parser_version, game_version)
+
+    def input_paths(self):
+        """Returns the stat metadata mapping used for labels."""
+        return self.payload_builder.input_paths()
+
+    def load_inputs(self) -> None:
+        """Loads the stat metadata mapping used for labels."""
+        self.payload_builder.load_inputs()
+
+    def generate(self, data: List[ConsumableData], views: Optional["DataViews"] = None) -> None:
+        """Encodes the payload and atomically replaces the output file."""
+        encoded = self.encode_payload(views.get("payload") if views else self.payload_builder.build_payload(data))
+        tmp_path = self.output_path.with_suffix(self.output_path.suffix + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(encoded)
+        os.replace(tmp_path, self.output_path)
+
+    def encode_payload(self, payload: dict) -> bytes:
+        """
+        Encodes a JsonGenerator payload into the binary layout.
+        """
+        strings = _StringTable()
+        items = [(item["name"], self._encode_item(item, strings)) for item in payload["items"]]
+        recipes = [(rid, self._encode_recipe(rid, r, strings)) for rid, r in payload["recipes"].items()]
+        modifiers = [(mid, self._encode_modifier(m, strings)) for mid, m in payload["modifiers"].items()]
+        sections = [self._encode_section(records, strings) for records in (items, recipes, modifiers)]
+
+        meta = json.dumps({"metadata": payload["metadata"], "stat_metadata": payload["stat_metadata"]}).encode("utf-8")
+        string_bytes = strings.encode()
+
+        offsets = []
+        position = HEADER.size
+        for block in [string_bytes] + sections:
+            offsets.append(position)
+            position += len(block)
+        offsets.append(position)
+
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, *offsets)
+        return b"".join([header, string_bytes] + sections + [U32.pack(len(meta)), meta])
+
+    def _encode_section(self, records: list[tuple[str, bytes]], strings: _StringTable) -> bytes:
+        """Builds the offset index followed by the record bodies."""
+        index = bytearray(U32.pack(len(records)))
+        body = bytearray()
+        base = 4 + INDEX_ENTRY.size * len(records)
+        for key, record in records:
+            index += INDEX_ENTRY.pack(base + len(body), strings.ref(key))
+            body += record
+        return bytes(index + body)
+
+    def _encode_item(self, item: dict, strings: _StringTable) -> bytes:
+        w = _RecordWriter(strings)
+        traits = item.get("traits")
+        growth, bom, farming = item.get("growth_data"), item.get("bill_of_materials"), item.get("farming")
+        flags = 0
+        if traits:
+            flags |= _TRAITS
+            flags |= _HARVESTED if traits.get("is_harvested") else 0
+            flags |= _ORBITAL if traits.get("is_orbital") else 0
+            flags |= _DECAY if traits.get("is_decay_product") else 0
+            flags |= _OVERRIDE if traits.get("is_override") else 0
+        flags |= _GROWTH if growth else 0
+        flags |= _BOM if bom else 0
+        flags |= _FARMING if farming else 0
+
+        w.varint(flags)
+        for key in ("name", "display_name", "category", "description", "source_item"):
+            w.ref(item[key])
+        w.f64(item["tier"]["total"])
+        w.ref(item["tier"]["anchor"])
+        w.varint(len(item["source_ids"]))
+        for source_file, source_id in item["source_ids"].items():
+            w.ref(source_file)
+            w.ref(source_id)
+        if growth:
+            for key in ("growth_time", "harvest_min", "harvest_max"):
+                w.optional_int(growth[key])
+        w.stat_block(item["base_stats"])
+        w.refs(item["modifiers"])
+        w.refs(item["recipes"])
+        w.refs(item["used_in"])
+        if bom:
+            w.stat_block(bom["raw_materials"])
+            w.f64(bom["energy_cost"])
+        if farming:
+            w.stat_block(farming["plot_hours"])
+            w.f64(farming["total_plot_hours"])
+        return bytes(w.buf)
+
+    def _encode_recipe(self, recipe_id: str, recipe: dict, strings: _StringTable) -> bytes:
+        w = _RecordWriter(strings)
+        w.refs(recipe["benches"])
+        alternate = recipe.get("alternate_inputs")
+        for inputs in (recipe["inputs"], alternate or []):
+            w.varint(len(inputs))
+            for ing in inputs:
+                w.ref(ing["name"])
+                w.ref(ing["display_name"])
+                w.varint(ing["count"])
+                w.varint(int(ing["is_generic"]))
+                if ing["is_generic"]:
+                    w.refs(ing.get("satisfied_by", []))
+        w.varint(1 if alternate is not None else 0)
+
+        w.varint(len(recipe["outputs"]))
+        for out in recipe["outputs"]:
+            flags = _OUT_YIELDS_ITEM if "yields_item" in out else 0
+            flags |= _OUT_RANGE if "yields_min" in out else 0
+            flags |= _OUT_INT if isinstance(out["yields_count"], int) else 0
+            w.varint(flags)
+            w.ref(out["name"])
+            w.ref(out["display_name"])
+            w.f64(out["yields_count"])
+            if flags & _OUT_YIELDS_ITEM:
+                w.ref(out["yields_item"])
+            if flags & _OUT_RANGE:
+                w.f64(out["yields_min"])
+                w.f64(out["yields_max"])
+
+        requirements = recipe["requirements"]
+        for key in ("talent", "character", "session"):
+            w.ref(requirements[key])
+        return bytes(w.buf)
+
+    def _encode_modifier(self, modifier: dict, strings: _StringTable) -> bytes:
+        w = _RecordWriter(strings)
+        w.ref(modifier["display_name"])
+        w.ref(modifier["description"])
+        w.optional_int(modifier["lifetime"])
+        w.varint(len(modifier["effects"]))
+        for stat, value in modifier["effects"].items():
+            w.buf += EFFECT_ENTRY.pack(strings.ref(stat), int(isinstance(value, bool)), float(value))
+        return bytes(w.buf)
+
+class _RecordReader:
+    """Sequentially decodes one record from the mapped file."""
+    __slots__ = ("reader", "buf", "pos")
+
+    def __init__(self, reader: "BinaryCatalogReader", pos: int):
+        self.reader = reader
+        self.buf = reader.buf
+        self.pos = pos
+
+    def varint(self) -> int:
+        result = shift = 0
+        buf = self.buf
+        while True:
+            byte = buf[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def ref(self) -> Optional[str]:
+        return self.reader.string(self.varint())
+
+    def refs(self) -> list[str]:
+        return [self.ref() for _ in range(self.varint())]
+
+    def optional_int(self) -> Optional[int]:
+        value = self.varint()
+        if value == 0:
+            return None
+        value -= 1
+        return (value >> 1) ^ -(value & 1)
+
+    def f64(self) -> float:
+        value = F64.unpack_from(self.buf, self.pos)[0]
+        self.pos += 8
+        return value
+
+    def stat_block(self) -> dict[str, float]:
+        count = self.varint()
+        end = self.pos + count * STAT_ENTRY.size
+        string = self.reader.string
+        block = {string(ref): value for ref, value in STAT_ENTRY.iter_unpack(self.buf[self.pos:end])}
+        self.pos = end
+        return block
+
+class BinaryCatalogReader:
+    """
+    Memory-maps a binary catalog and decodes records lazily. Opening only
+    parses the header; strings and records are decoded on first access.
+    Items, recipes and modifiers decode to the same dicts as the JSON output.
+    """
+
+    def __init__(self, filepath: Path):
+        """Opens and maps the file; call close() (or use as a context manager) when done."""
+        self._file = open(filepath, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buf = memoryview(self._mmap)
+
+        magic, version, _, strings_at, items_at, recipes_at, modifiers_at, meta_at = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Not a binary catalog (version {FORMAT_VERSION}): {filepath}")
+
+        self._string_count = U32.unpack_from(self.buf, strings_at)[0]
+        self._string_ends_at = strings_at + 4
+        self._string_blob_at = self._string_ends_at + 4 * (self._string_count + 1)
+        self._strings: dict[int, str] = {}
+
+        self._sections = {"items": items_at, "recipes": recipes_at, "modifiers": modifiers_at}
+        self._counts = {name: U32.unpack_from(self.buf, at)[0] for name, at in self._sections.items()}
+        self._keys: dict[str, dict[str, int]] = {}
+        self._meta_at = meta_at
+
+    def __enter__(self) -> "BinaryCatalogReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def close(self):
+        """Releases the memory map and file handle."""
+        if self.buf is not None:
+            self.buf.release()
+            self.buf = None
+            self._mmap.close()
+            self._file.close()
+
+    def __len__(self) -> int:
+        return self._counts["items"]
+
+    def __getitem__(self, position: int) -> dict:
+        return self.item_at(position)
+
+    def __iter__(self) -> Iterator[dict]:
+        for position in range(len(self)):
+            yield self.item_at(position)
+
+    def string(self, ref: int) -> Optional[str]:
+        """Returns the string for a reference (id + 1), decoding it on first use."""
+        if ref == 0:
+            return None
+        value = self._strings.get(ref)
+        if value is None:
+            index = ref - 1
+            start, end = struct.unpack_from("<II", self.buf, self._string_ends_at + 4 * index)
+            value = self._strings[ref] = str(self.buf[self._string_blob_at + start:self._string_blob_at + end], "utf-8")
+        return value
+
+    def _record_offset(self, section: str, position: int) -> tuple[int, int]:
+        """Returns (absolute record offset, key ref) from a section's offset index."""
+        if not 0 <= position < self._counts[section]:
+            raise IndexError(f"{section} position out of range: {position}")
+        at = self._sections[section]
+        offset, key_ref = INDEX_ENTRY.unpack_from(self.buf, at + 4 + INDEX_ENTRY.size * position)
+        return at + offset, key_ref
+
+    def _position(self, section: str, key: str) -> Optional[int]:
+        """Finds a record position by key; the key map is built from the index on first use."""
+        keys = self._keys.get(section)
+        if keys is None:
+            at = self._sections[section] + 4
+            count = self._counts[section]
+            entries = INDEX_ENTRY.iter_unpack(self.buf[at:at + INDEX_ENTRY.size * count])
+            keys = self._keys[section] = {self.string(ref): pos for pos, (_, ref) in enumerate(entries)}
+        return keys.get(key)
+
+    def keys(self, section: str = "items") -> list[str]:
+        """Returns the keys (item names, recipe or modifier IDs) of a section in file order."""
+        return [self.string(self._record_offset(section, pos)[1]) for pos in range(self._counts[section])]
+
+    def get(self, name: str) -> Optional[dict]:
+        """Returns an item by name, or None."""
+        position = self._position("items", name)
+        return self.item_at(position) if position is not None else None
+
+    def get_recipe(self, recipe_id: str) -> Optional[dict]:
+        """Returns a recipe by ID, or None."""
+        position = self._position("recipes", recipe_id)
+        return self._decode_recipe(*self._record_offset("recipes", position)) if position is not None else None
+
+    def get_modifier(self, modifier_id: str) -> Optional[dict]:
+        """Returns a modifier by ID, or None."""
+        position = self._position("modifiers", modifier_id)
+        return self._decode_modifier(*self._record_offset("modifiers", position)) if position is not None else None
+
+    def metadata(self) -> dict:
+        """Returns the metadata and stat_metadata blocks."""
+        length = U32.unpack_from(self.buf, self._meta_at)[0]
+        return json.loads(bytes(self.buf[self._meta_at + 4:self._meta_at + 4 + length]))
+
+    def item_at(self, position: int) -> dict:
+        """Decodes the item at a position in O(1)."""
+        offset, _ = self._record_offset("items", position)
+        r = _RecordReader(self, offset)
+        flags = r.varint()
+        name, display_name, category, description, source_item = (r.ref() for _ in range(5))
+        tier_total = r.f64()
+        anchor = r.ref()
+        source_ids = {}
+        for _ in range(r.varint()):
+            source_file = r.ref()
+            source_ids[source_file] = r.ref()
+        growth = None
+        if flags & _GROWTH:
+            growth = {"growth_time": r.optional_int(), "harvest_min": r.optional_int(), "harvest_max": r.optional_int()}
+        base_stats = r.stat_block()
+        modifiers, recipes, used_in = r.refs(), r.refs(), r.refs()
+        bom = None
+        if flags & _BOM:
+            bom = {"raw_materials": r.stat_block(), "energy_cost": r.f64()}
+        farming = None
+        if flags & _FARMING:
+            farming = {"plot_hours": r.stat_block(), "total_plot_hours": r.f64()}
+
+        item: dict[str, Any] = {"name": name, "display_name": display_name, "category": category, "description": description}
+        if flags & _TRAITS:
+            traits = {}
+            for bit, key in ((_HARVESTED, "is_harvested"), (_ORBITAL, "is_orbital"), (_DECAY, "is_decay_product"), (_OVERRIDE, "is_override")):
+                if flags & bit:
+                    traits[key] = True
+            item["traits"] = traits
+        item.update({
+            "source_item": source_item,
+            "source_ids": source_ids,
+            "tier": {"total": tier_total, "anchor": anchor},
+            "growth_data": growth,
+            "base_stats": base_stats,
+            "modifiers": modifiers,
+            "recipes": recipes,
+            "used_in": used_in,
+            "bill_of_materials": bom,
+            "farming": farming
+        })
+        return item
+
+    def _decode_recipe(self, offset: int, key_ref: int) -> dict:
+        r = _RecordReader(self, offset)
+        benches = r.refs()
+        input_lists = []
+        for _ in range(2):
+            inputs = []
+            for _ in range(r.varint()):
+                ing = {"name": r.ref()}
+                display_name = r.ref()
+                ing["count"] = r.varint()
+                ing["display_name"] = display_name
+                ing["is_generic"] = bool(r.varint())
+                if ing["is_generic"]:
+                    ing["satisfied_by"] = r.refs()
+                inputs.append(ing)
+            input_lists.append(inputs)
+        has_alternates = r.varint()
+
+        outputs = []
+        for _ in range(r.varint()):
+            flags = r.varint()
+            out = {"name": r.ref()}
+            display_name = r.ref()
+            count = r.f64()
+            out["yields_count"] = int(count) if flags & _OUT_INT else count
+            out["display_name"] = display_name
+            if flags & _OUT_YIELDS_ITEM:
+                out["yields_item"] = r.ref()
+            if flags & _OUT_RANGE:
+                out["yields_min"] = r.f64()
+                out["yields_max"] = r.f64()
+            outputs.append(out)
+
+        recipe = {"id": self.string(key_ref), "benches": benches, "inputs": input_lists[0]}
+        if has_alternates:
+            recipe["alternate_inputs"] = input_lists[1]
+        recipe["outputs"] = outputs
+        recipe["requirements"] = {"talent": r.ref(), "character": r.ref(), "session": r.ref()}
+        return recipe
+
+    def _decode_modifier(self, offset: int, key_ref: int) -> dict:
+        r = _RecordReader(self, offset)
+        display_name, description = r.ref(), r.ref()
+        lifetime = r.optional_int()
+        count = r.varint()
+        end = r.pos + count * EFFECT_ENTRY.size
+        effects = {
+            self.string(ref): bool(value) if is_bool else value
+            for ref, is_bool, value in EFFECT_ENTRY.iter_unpack(self.buf[r.pos:end])
+        }
+        return {"id": self.string(key_ref), "display_name": display_name, "effects": effects, "lifetime": lifetime, "description": description}
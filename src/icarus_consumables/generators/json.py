@@ -1,22 +1,41 @@
 import json
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 from icarus_consumables.generators.base import BaseGenerator
 from icarus_consumables.models.consumable import ConsumableData
+from icarus_consumables.models.recipe import Ingredient
+
+if TYPE_CHECKING:
+    from icarus_consumables.generators.views import DataViews
 
 class JsonGenerator(BaseGenerator):
     """Generates structured JSON output with metadata and visibility filtering."""
 
+    STAT_METADATA_PATH = Path("data/stat_metadata.json")
+    REQUIRED_VIEWS = ("payload",)
+    OUTPUT_FILES = ("consumables_items.json", "consumables_recipes.json", "consumables_modifiers.json", "consumables_benches.json")
+
     def __init__(self, filename: str, parser_version: str = "TBD", game_version: str = "TBD"):
         super().__init__(filename)
         self.parser_version = parser_version
         self.game_version = game_version
-        self.stat_metadata_map = self._load_stat_metadata()
+        self._stat_metadata_map: Optional[dict] = None
+
+    @property
+    def stat_metadata_map(self) -> dict:
+        """Stat labels and categories, loaded from STAT_METADATA_PATH on first use."""
+        if self._stat_metadata_map is None:
+            self._stat_metadata_map = self._load_stat_metadata()
+        return self._stat_metadata_map
+
+    @stat_metadata_map.setter
+    def stat_metadata_map(self, value: dict):
+        self._stat_metadata_map = value
 
     def _load_stat_metadata(self) -> dict:
         """Loads stat labels and categories from external mapping file."""
         # Look for data directory in project root
-        data_path = Path("data/stat_metadata.json")
+        data_path = self.STAT_METADATA_PATH
         try:
             with open(data_path, "r", encoding="utf-8") as f:
                 return json.load(f)
@@ -24,10 +43,73 @@ class JsonGenerator(BaseGenerator):
             # Fallback to current directory for safety if needed
             return {}
 
-    def generate(self, data: List[ConsumableData]) -> None:
+    def artifact_paths(self) -> List[Path]:
+        """Returns the split output files written next to output_path."""
+        return [self.output_path.parent / name for name in self.OUTPUT_FILES]
+
+    def input_paths(self) -> List[Path]:
+        """Returns the stat metadata mapping used for labels."""
+        return [self.STAT_METADATA_PATH]
+
+    def load_inputs(self) -> None:
+        """Loads the stat metadata mapping now instead of on first use."""
+        self.stat_metadata_map
+
+    def _ingredient_dict(self, ing: Ingredient) -> dict:
+        """
+        Converts a recipe input into its JSON form. Generic (tag-based) inputs
+        also carry the normalized IDs of every item that satisfies the tag.
+        """
+        ing_dict = {
+            "name": ing.item.name if ing.item else ing.tag,
+            "count": ing.count,
+            "display_name": ing.item.display_name if ing.item else (
+                ing.tag.replace("Any_", "").replace("_", " ") if ing.tag else "Unknown"
+            ),
+            "is_generic": ing.is_generic
+        }
+        if ing.is_generic:
+            ing_dict["satisfied_by"] = ing.satisfied_by
+        return ing_dict
+
+    def generate(self, data: List[ConsumableData], views: Optional["DataViews"] = None) -> None:
+        payload = views.get("payload") if views else self.build_payload(data)
+        metadata = payload["metadata"]
+
+        # Items
+        items_path, recipes_path, modifiers_path, benches_path = self.artifact_paths()
+        with open(items_path, 'w', encoding='utf-8') as f:
+            json.dump({"metadata": metadata, "items": payload["items"]}, f, indent=4)
+
+        # Recipes
+        with open(recipes_path, 'w', encoding='utf-8') as f:
+            json.dump({"metadata": metadata, "recipes": payload["recipes"]}, f, indent=4)
+
+        # Modifiers
+        with open(modifiers_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "metadata": metadata, 
+                "stat_metadata": payload["stat_metadata"],
+                "modifiers": payload["modifiers"]
+            }, f, indent=4)
+
+        # Benches
+        with open(benches_path, 'w', encoding='utf-8') as f:
+            json.dump({"metadata": metadata, "benches": payload["benches"]}, f, indent=4)
+
+        # Legacy cleanup/fallback (optional, but requested separate for now)
+        # We'll stop writing the monolithic file as requested.
+
+    def build_payload(self, data: List[ConsumableData]) -> dict:
+        """
+        Builds the JSON-ready item, recipe, modifier, bench and stat metadata
+        structures for the visible items without writing anything, so other
+        consumers (e.g., the query server) share the exact output schema.
+        """
         items = []
         modifiers_map = {}
         recipes_map = {}
+        benches_map = {}  # Bench display name -> bench view, filled while grouping recipes
         used_stats = set()
         
         # Build mapping for 'Primary' recipe detection
@@ -114,14 +196,7 @@ class JsonGenerator(BaseGenerator):
                     for ing in r.inputs:
                         ing_name = ing.item.name if ing.item else ing.tag
                         if ing_name not in existing_alternate_names and ing_name not in existing_primary_names:
-                            group['alternate_inputs'].append({
-                                "name": ing_name,
-                                "count": ing.count,
-                                "display_name": ing.item.display_name if ing.item else (
-                                    ing.tag.replace("Any_", "").replace("_", " ") if ing.tag else "Unknown"
-                                ),
-                                "is_generic": ing.is_generic
-                            })
+                            group['alternate_inputs'].append(self._ingredient_dict(ing))
                     
                     # Accumulate resource yields for range calculation
                     for res_name, res_count in res_outputs:
@@ -133,16 +208,7 @@ class JsonGenerator(BaseGenerator):
                     group = {
                         "id": r.id, 
                         "benches": list(benches_sig),
-                        "inputs": [
-                            {
-                                "name": ing.item.name if ing.item else ing.tag, 
-                                "count": ing.count, 
-                                "display_name": ing.item.display_name if ing.item else (
-                                    ing.tag.replace("Any_", "").replace("_", " ") if ing.tag else "Unknown"
-                                ),
-                                "is_generic": ing.is_generic
-                            } for ing in r.inputs
-                        ],
+                        "inputs": [self._ingredient_dict(ing) for ing in r.inputs],
                         "alternate_inputs": [],
                         "outputs": [], # Will be populated after processing all
                         "requirements": {
@@ -156,6 +222,22 @@ class JsonGenerator(BaseGenerator):
                     signatures[sig] = group
                     grouped_item_recipes.append(group)
 
+                    # Invert into the per-bench view: one entry per item and recipe group
+                    for bench in benches_sig:
+                        bench_view = benches_map.get(bench)
+                        if bench_view is None:
+                            bench_view = benches_map[bench] = {
+                                "name": bench,
+                                "rank": r.bench_ranks.get(bench, 4),
+                                "items": []
+                            }
+                        bench_view["items"].append({
+                            "name": item.name,
+                            "display_name": item.display_name,
+                            "recipe": r.id,
+                            "talent": r.requirement
+                        })
+
             item_recipe_ids = []
             for group in grouped_item_recipes:
                 # Finalize outputs with ranges and averages
@@ -227,7 +309,16 @@ class JsonGenerator(BaseGenerator):
                 } if item.growth_time or (item.harvest_min is not None) else None,
                 "base_stats": item.base_stats,
                 "modifiers": item_modifier_ids,
-                "recipes": item_recipe_ids
+                "recipes": item_recipe_ids,
+                "used_in": item.used_in,
+                "bill_of_materials": {
+                    "raw_materials": {name: round(qty, 4) for name, qty in sorted(item.raw_materials.items())},
+                    "energy_cost": round(item.energy_cost, 2)
+                } if item.energy_cost is not None else None,
+                "farming": {
+                    "plot_hours": {crop: round(hours, 4) for crop, hours in sorted(item.plot_hours.items())},
+                    "total_plot_hours": round(sum(item.plot_hours.values()), 4)
+                } if item.plot_hours else None
             }
             # Remove traits if None to save even more space
             if item_dict["traits"] is None:
@@ -249,30 +340,16 @@ class JsonGenerator(BaseGenerator):
                     "categories": ["Other"]
                 }
 
-        # 4. Write Separate Files
         metadata = {
             "parser_version": self.parser_version,
             "game_version": self.game_version
         }
 
-        # Items
-        items_path = self.output_path.parent / "consumables_items.json"
-        with open(items_path, 'w', encoding='utf-8') as f:
-            json.dump({"metadata": metadata, "items": items}, f, indent=4)
-
-        # Recipes
-        recipes_path = self.output_path.parent / "consumables_recipes.json"
-        with open(recipes_path, 'w', encoding='utf-8') as f:
-            json.dump({"metadata": metadata, "recipes": recipes_map}, f, indent=4)
-
-        # Modifiers
-        modifiers_path = self.output_path.parent / "consumables_modifiers.json"
-        with open(modifiers_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                "metadata": metadata, 
-                "stat_metadata": stat_metadata,
-                "modifiers": modifiers_map
-            }, f, indent=4)
-
-        # Legacy cleanup/fallback (optional, but requested separate for now)
-        # We'll stop writing the monolithic file as requested.
+        return {
+            "metadata": metadata,
+            "items": items,
+            "recipes": recipes_map,
+            "modifiers": modifiers_map,
+            "benches": sorted(benches_map.values(), key=lambda b: (b["rank"], b["name"])),
+            "stat_metadata": stat_metadata
+        }
@@ -0,0 +1,78 @@
+import importlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+@dataclass(frozen=True, slots=True)
+class GeneratorSpec:
+    """
+    Where a generator class lives and how to construct it. The module is
+    only imported when the generator is selected.
+    """
+    module: str
+    class_name: str
+    filename: str
+    description: str
+    options: tuple[tuple[str, str], ...] = ()  # (constructor keyword, config key) pairs
+
+# Registry name -> spec. Select generators with GENERATORS in processing_config.json or --generators.
+GENERATORS: dict[str, GeneratorSpec] = {
+    "json": GeneratorSpec(
+        "icarus_consumables.generators.json", "JsonGenerator", "consumables_data.json",
+        "Items, recipes, modifiers and benches as JSON files"
+    ),
+    "sqlite": GeneratorSpec(
+        "icarus_consumables.generators.sqlite", "SqliteGenerator", "consumables.db",
+        "Normalized SQLite database"
+    ),
+    "search_index": GeneratorSpec(
+        "icarus_consumables.generators.search_index", "SearchIndexGenerator", "consumables_search.json",
+        "Prebuilt full-text search index"
+    ),
+    "similar_items": GeneratorSpec(
+        "icarus_consumables.generators.similar_items", "SimilarItemsGenerator", "consumables_similar.json",
+        "Nearest-neighbour similar items (requires NumPy)",
+        options=(("top_k", "SIMILAR_ITEMS_TOP_K"), ("lower_tier_only", "SIMILAR_ITEMS_LOWER_TIER_ONLY"))
+    ),
+    "binary": GeneratorSpec(
+        "icarus_consumables.generators.binary", "BinaryGenerator", "consumables.icb",
+        "Compact memory-mappable binary catalog"
+    )
+}
+
+DEFAULT_GENERATORS = ("json", "sqlite", "search_index")
+
+def selected_generators(config: dict[str, Any]) -> list[str]:
+    """
+    Returns the registry names selected by the config, in order and without duplicates.
+    """
+    names = list(dict.fromkeys(config.get("GENERATORS", DEFAULT_GENERATORS)))
+    unknown = [name for name in names if name not in GENERATORS]
+    if unknown:
+        raise ValueError(f"Unknown generator(s): {', '.join(unknown)} (available: {', '.join(GENERATORS)})")
+    return names
+
+def load_generator_class(name: str) -> type:
+    """
+    Imports and returns the generator class registered under name.
+    """
+    spec = GENERATORS[name]
+    return getattr(importlib.import_module(spec.module), spec.class_name)
+
+def create_generator(name: str, config: dict[str, Any], filename: Optional[str] = None) -> Any:
+    """
+    Constructs a registered generator with the versions and options from config.
+    """
+    spec = GENERATORS[name]
+    kwargs = {keyword: config[key] for keyword, key in spec.options if key in config}
+    return load_generator_class(name)(
+        filename or spec.filename,
+        parser_version=config.get("PARSER_VERSION", "v2.1.0"),
+        game_version=config.get("GAME_VERSION", "TBD"),
+        **kwargs
+    )
+
+def create_generators(config: dict[str, Any]) -> list[Any]:
+    """
+    Constructs the generators selected by config, importing only their modules.
+    """
+    return [create_generator(name, config) for name in selected_generators(config)]
@@ -0,0 +1,186 @@
+import bisect
+import json
+import math
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+from icarus_consumables.generators.base import BaseGenerator
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.models.consumable import ConsumableData
+
+if TYPE_CHECKING:
+    from icarus_consumables.generators.views import DataViews
+
+# Relative importance of each indexed field
+FIELD_WEIGHTS = {
+    "display_name": 4.0,
+    "modifier": 3.0,
+    "stat": 2.0,
+    "description": 1.0
+}
+
+# Splits words and camelCase identifiers ("BaseStaminaRegen" -> base, stamina, regen)
+TOKEN_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+STOP_WORDS = frozenset({"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or", "the", "to", "with", "your", "you"})
+
+# Matches on a prefix of a term count for less than whole-word matches
+PREFIX_FACTOR = 0.5
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """
+    Lowercases and splits text into index terms, dropping stop words and stray letters.
+    """
+    if not text:
+        return []
+    terms = (m.lower() for m in TOKEN_PATTERN.findall(text))
+    return [t for t in terms if t not in STOP_WORDS and (len(t) > 1 or t.isdigit())]
+
+class SearchIndexGenerator(BaseGenerator):
+    """
+    Writes a prebuilt full-text search index so clients can search without
+    scanning the catalog. Each visible item is a document; its display name,
+    description, modifier names and stat labels are tokenized into an
+    inverted index with a precomputed relevance weight per (term, item).
+    Terms are sorted, so a prefix is a contiguous range found by binary search.
+
+    Artifact layout (compact JSON):
+        documents   [[name, display_name, category], ...]
+        terms       sorted list of terms
+        postings    one flat [doc, weight, doc, weight, ...] list per term,
+                    ordered by descending weight
+    """
+
+    REQUIRED_VIEWS = ("payload",)
+
+    def __init__(self, filename: str, parser_version: str = "TBD", game_version: str = "TBD"):
+        super().__init__(filename)
+        self.payload_builder = JsonGenerator(filename, parser_version, game_version)
+
+    def input_paths(self):
+        """Returns the stat metadata mapping used for labels."""
+        return self.payload_builder.input_paths()
+
+    def load_inputs(self) -> None:
+        """Loads the stat metadata mapping used for labels."""
+        self.payload_builder.load_inputs()
+
+    def generate(self, data: List[ConsumableData], views: Optional["DataViews"] = None) -> None:
+        """Builds the index and atomically replaces the output file."""
+        index = self.build_index(views.get("payload") if views else self.payload_builder.build_payload(data))
+        tmp_path = self.output_path.with_suffix(self.output_path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_path, self.output_path)
+
+    def _stat_label(self, stat: str) -> str:
+        """Returns the display label of a stat key (JSON keys may carry a '%' suffix)."""
+        name = stat.rstrip("%")
+        meta = self.payload_builder.stat_metadata_map.get(name)
+        return meta["label"] if meta else name.replace("Base", "").replace("_", " ")
+
+    def build_index(self, payload: dict) -> dict:
+        """
+        Builds the inverted index from a JsonGenerator payload. A term's weight
+        for an item is its inverse document frequency times the sum over fields
+        of field weight x (1 + log(term count in that field)).
+        """
+        documents = []
+        field_counts: dict[str, dict[int, dict[str, int]]] = {}
+        modifiers = payload["modifiers"]
+
+        for doc, item in enumerate(payload["items"]):
+            documents.append([item["name"], item["display_name"], item["category"]])
+
+            stats = list(item["base_stats"])
+            modifier_text = []
+            for modifier_id in dict.fromkeys(item["modifiers"]):
+                modifier = modifiers.get(modifier_id)
+                if modifier:
+                    modifier_text.append(modifier["display_name"] or "")
+                    stats.extend(modifier["effects"])
+
+            fields = {
+                "display_name": item["display_name"],
+                "modifier": " ".join(modifier_text),
+                "stat": " ".join(self._stat_label(s) for s in dict.fromkeys(stats)),
+                "description": item["description"]
+            }
+            for field, text in fields.items():
+                for term in tokenize(text):
+                    counts = field_counts.setdefault(term, {}).setdefault(doc, {})
+                    counts[field] = counts.get(field, 0) + 1
+
+        total = len(documents)
+        terms = sorted(field_counts)
+        postings = []
+        for term in terms:
+            docs = field_counts[term]
+            idf = math.log(1.0 + total / len(docs))
+            weighted = [
+                (doc, round(idf * sum(FIELD_WEIGHTS[f] * (1.0 + math.log(n)) for f, n in counts.items()), 3))
+                for doc, counts in docs.items()
+            ]
+            weighted.sort(key=lambda p: (-p[1], p[0]))
+            postings.append([value for pair in weighted for value in pair])
+
+        return {
+            "metadata": {**payload["metadata"], "documents": total, "field_weights": FIELD_WEIGHTS},
+            "documents": documents,
+            "terms": terms,
+            "postings": postings
+        }
+
+class SearchIndex:
+    """
+    Queries a search index artifact the way a client would: every query word
+    is matched as a whole term or as a prefix, and only items matching all
+    words are returned, ranked by summed weight.
+    """
+
+    def __init__(self, index: dict):
+        """Wraps a loaded index dict; use load() to read the artifact."""
+        self.documents = index["documents"]
+        self.terms = index["terms"]
+        self.postings = index["postings"]
+
+    @classmethod
+    def load(cls, filepath: Path) -> "SearchIndex":
+        """Loads an index written by SearchIndexGenerator."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _match(self, word: str) -> dict[int, float]:
+        """Returns doc -> best weight over all terms starting with word."""
+        scores: dict[int, float] = {}
+        start = bisect.bisect_left(self.terms, word)
+        for t in range(start, len(self.terms)):
+            term = self.terms[t]
+            if not term.startswith(word):
+                break
+            factor = 1.0 if term == word else PREFIX_FACTOR
+            flat = self.postings[t]
+            for i in range(0, len(flat), 2):
+                weight = flat[i + 1] * factor
+                if weight > scores.get(flat[i], 0.0):
+                    scores[flat[i]] = weight
+        return scores
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[str, float]]:
+        """
+        Returns up to limit (item name, score) pairs for a free-text query.
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        scores: Optional[dict[int, float]] = None
+        for word in words:
+            matches = self._match(word)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {doc: s + matches[doc] for doc, s in scores.items() if doc in matches}
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda e: (-e[1], self.documents[e[0]][0]))[:limit]
+        return [(self.documents[doc][0], round(score, 3)) for doc, score in ranked]
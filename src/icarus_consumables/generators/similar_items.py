@@ -0,0 +1,46 @@
+import json
+import os
+from typing import TYPE_CHECKING, List, Optional
+from icarus_consumables.generators.base import BaseGenerator
+from icarus_consumables.models.consumable import ConsumableData
+from icarus_consumables.services.similarity import SimilarityIndex
+from icarus_consumables.services.stat_matrix import StatMatrix
+
+if TYPE_CHECKING:
+    from icarus_consumables.generators.views import DataViews
+
+class SimilarItemsGenerator(BaseGenerator):
+    """
+    Exports the nearest-neighbour "similar items" list for every visible item,
+    ranked by cosine similarity of their stats and modifier effects.
+    Requires NumPy (optional analysis extra).
+    """
+
+    REQUIRED_VIEWS = ("stat_matrix",)
+
+    def __init__(self, filename: str, parser_version: str = "TBD", game_version: str = "TBD", top_k: int = 5, lower_tier_only: bool = False):
+        super().__init__(filename)
+        self.parser_version = parser_version
+        self.game_version = game_version
+        self.top_k = top_k
+        self.lower_tier_only = lower_tier_only
+
+    def generate(self, data: List[ConsumableData], views: Optional["DataViews"] = None) -> None:
+        """Computes the neighbours and atomically replaces the output file."""
+        matrix = views.get("stat_matrix") if views else StatMatrix.from_items(data)
+        neighbours = SimilarityIndex(matrix).neighbours(self.top_k, self.lower_tier_only)
+        tmp_path = self.output_path.with_suffix(self.output_path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "metadata": {
+                    "parser_version": self.parser_version,
+                    "game_version": self.game_version,
+                    "top_k": self.top_k,
+                    "lower_tier_only": self.lower_tier_only
+                },
+                "items": {
+                    name: [{"name": other, "similarity": score} for other, score in similar]
+                    for name, similar in neighbours.items()
+                }
+            }, f, indent=4)
+        os.replace(tmp_path, self.output_path)
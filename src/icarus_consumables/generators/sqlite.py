@@ -0,0 +1,233 @@
+import json
+import os
+import sqlite3
+from typing import TYPE_CHECKING, List, Optional
+from icarus_consumables.generators.base import BaseGenerator
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.models.consumable import ConsumableData
+
+if TYPE_CHECKING:
+    from icarus_consumables.generators.views import DataViews
+
+SCHEMA = """
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE items (
+    name TEXT PRIMARY KEY,
+    display_name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    description TEXT,
+    tier_total REAL NOT NULL,
+    tier_anchor TEXT,
+    is_harvested INTEGER NOT NULL DEFAULT 0,
+    is_orbital INTEGER NOT NULL DEFAULT 0,
+    is_decay_product INTEGER NOT NULL DEFAULT 0,
+    is_override INTEGER NOT NULL DEFAULT 0,
+    source_item TEXT,
+    growth_time INTEGER,
+    harvest_min INTEGER,
+    harvest_max INTEGER,
+    energy_cost REAL
+) WITHOUT ROWID;
+
+CREATE TABLE item_stats (
+    item_name TEXT NOT NULL REFERENCES items(name),
+    stat TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (item_name, stat)
+) WITHOUT ROWID;
+
+CREATE TABLE source_ids (
+    item_name TEXT NOT NULL REFERENCES items(name),
+    source_file TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    PRIMARY KEY (item_name, source_file)
+) WITHOUT ROWID;
+
+CREATE TABLE modifiers (
+    id TEXT PRIMARY KEY,
+    display_name TEXT,
+    description TEXT,
+    lifetime INTEGER
+) WITHOUT ROWID;
+
+CREATE TABLE modifier_effects (
+    modifier_id TEXT NOT NULL REFERENCES modifiers(id),
+    stat TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (modifier_id, stat)
+) WITHOUT ROWID;
+
+CREATE TABLE item_modifiers (
+    item_name TEXT NOT NULL REFERENCES items(name),
+    modifier_id TEXT NOT NULL REFERENCES modifiers(id),
+    PRIMARY KEY (item_name, modifier_id)
+) WITHOUT ROWID;
+
+CREATE TABLE recipes (
+    id TEXT PRIMARY KEY,
+    talent TEXT,
+    character_req TEXT,
+    session_req TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE item_recipes (
+    item_name TEXT NOT NULL REFERENCES items(name),
+    recipe_id TEXT NOT NULL REFERENCES recipes(id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (item_name, recipe_id)
+) WITHOUT ROWID;
+
+CREATE TABLE benches (
+    recipe_id TEXT NOT NULL REFERENCES recipes(id),
+    bench TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (recipe_id, bench)
+) WITHOUT ROWID;
+
+CREATE TABLE recipe_inputs (
+    recipe_id TEXT NOT NULL REFERENCES recipes(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    display_name TEXT,
+    count INTEGER NOT NULL,
+    is_generic INTEGER NOT NULL DEFAULT 0,
+    is_alternate INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (recipe_id, position)
+) WITHOUT ROWID;
+
+CREATE TABLE recipe_outputs (
+    recipe_id TEXT NOT NULL REFERENCES recipes(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    display_name TEXT,
+    yields_count REAL NOT NULL,
+    yields_min REAL,
+    yields_max REAL,
+    yields_item TEXT,
+    PRIMARY KEY (recipe_id, position)
+) WITHOUT ROWID;
+"""
+
+# Covering indexes for the common lookups: every column a typical query
+# reads is in the index, so SQLite answers from the index alone.
+INDEXES = """
+CREATE INDEX idx_items_category_tier ON items(category, tier_total, name);
+CREATE INDEX idx_items_tier ON items(tier_total, name);
+CREATE INDEX idx_item_stats_stat ON item_stats(stat, value, item_name);
+CREATE INDEX idx_source_ids_lookup ON source_ids(source_file, source_id, item_name);
+CREATE INDEX idx_modifier_effects_stat ON modifier_effects(stat, value, modifier_id);
+CREATE INDEX idx_item_modifiers_modifier ON item_modifiers(modifier_id, item_name);
+CREATE INDEX idx_item_recipes_recipe ON item_recipes(recipe_id, item_name);
+CREATE INDEX idx_benches_bench ON benches(bench, recipe_id);
+CREATE INDEX idx_recipe_inputs_name ON recipe_inputs(name, recipe_id, count);
+CREATE INDEX idx_recipe_outputs_name ON recipe_outputs(name, recipe_id, yields_count);
+"""
+
+class SqliteGenerator(BaseGenerator):
+    """
+    Writes the catalog into a single SQLite database with a normalized
+    relational schema and covering indexes. Rows come from the same payload
+    as the JSON output, so both formats always agree.
+    """
+
+    REQUIRED_VIEWS = ("payload",)
+
+    def __init__(self, filename: str, parser_version: str = "TBD", game_version: str = "TBD"):
+        super().__init__(filename)
+        self.payload_builder = JsonGenerator(filename, parser_version, game_version)
+
+    def input_paths(self):
+        """Returns the stat metadata mapping used for labels."""
+        return self.payload_builder.input_paths()
+
+    def load_inputs(self) -> None:
+        """Loads the stat metadata mapping used for labels."""
+        self.payload_builder.load_inputs()
+
+    def generate(self, data: List[ConsumableData], views: Optional["DataViews"] = None) -> None:
+        """
+        Builds the database in a temporary file (bulk inserts in one
+        transaction, indexes created afterwards) and atomically replaces the output.
+        """
+        payload = self.build_rows(views.get("payload") if views else self.payload_builder.build_payload(data))
+        tmp_path = self.output_path.with_suffix(self.output_path.suffix + ".tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            # The file is rebuilt from scratch, so durability during the build is irrelevant
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(SCHEMA)
+            with conn:
+                for table, rows in payload.items():
+                    if rows:
+                        placeholders = ", ".join("?" * len(rows[0]))
+                        conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+            conn.executescript(INDEXES)
+            conn.execute("ANALYZE")
+        finally:
+            conn.close()
+
+        os.replace(tmp_path, self.output_path)
+
+    def build_rows(self, payload: dict) -> dict[str, list[tuple]]:
+        """
+        Flattens the JSON payload into row tuples per table, in schema column order.
+        """
+        rows: dict[str, list[tuple]] = {
+            "metadata": [], "items": [], "item_stats": [], "source_ids": [],
+            "modifiers": [], "modifier_effects": [], "item_modifiers": [],
+            "recipes": [], "item_recipes": [], "benches": [], "recipe_inputs": [], "recipe_outputs": []
+        }
+
+        for key, value in payload["metadata"].items():
+            rows["metadata"].append((key, str(value)))
+        rows["metadata"].append(("stat_metadata", json.dumps(payload["stat_metadata"])))
+
+        for item in payload["items"]:
+            traits = item.get("traits") or {}
+            growth = item.get("growth_data") or {}
+            bom = item.get("bill_of_materials") or {}
+            name = item["name"]
+            rows["items"].append((
+                name, item["display_name"], item["category"], item["description"],
+                item["tier"]["total"], item["tier"]["anchor"],
+                int(traits.get("is_harvested", False)), int(traits.get("is_orbital", False)),
+                int(traits.get("is_decay_product", False)), int(traits.get("is_override", False)),
+                item["source_item"], growth.get("growth_time"), growth.get("harvest_min"), growth.get("harvest_max"),
+                bom.get("energy_cost")
+            ))
+            rows["item_stats"].extend((name, stat, value) for stat, value in item["base_stats"].items())
+            rows["source_ids"].extend((name, source_file, source_id) for source_file, source_id in item["source_ids"].items())
+            rows["item_modifiers"].extend((name, modifier_id) for modifier_id in dict.fromkeys(item["modifiers"]))
+            rows["item_recipes"].extend((name, recipe_id, pos) for pos, recipe_id in enumerate(dict.fromkeys(item["recipes"])))
+
+        for modifier in payload["modifiers"].values():
+            rows["modifiers"].append((modifier["id"], modifier["display_name"], modifier["description"], modifier["lifetime"]))
+            rows["modifier_effects"].extend(
+                (modifier["id"], stat, float(value)) for stat, value in modifier["effects"].items()
+            )
+
+        for recipe_id, recipe in payload["recipes"].items():
+            requirements = recipe["requirements"]
+            rows["recipes"].append((recipe_id, requirements["talent"], requirements["character"], requirements["session"]))
+            rows["benches"].extend((recipe_id, bench, pos) for pos, bench in enumerate(dict.fromkeys(recipe["benches"])))
+
+            inputs = [(ing, 0) for ing in recipe["inputs"]] + [(ing, 1) for ing in recipe.get("alternate_inputs", [])]
+            for pos, (ing, is_alternate) in enumerate(inputs):
+                rows["recipe_inputs"].append((
+                    recipe_id, pos, ing["name"], ing["display_name"], ing["count"], int(ing["is_generic"]), is_alternate
+                ))
+            for pos, out in enumerate(recipe["outputs"]):
+                rows["recipe_outputs"].append((
+                    recipe_id, pos, out["name"], out["display_name"], out["yields_count"],
+                    out.get("yields_min"), out.get("yields_max"), out.get("yields_item")
+                ))
+
+        return rows
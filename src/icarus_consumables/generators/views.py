@@ -0,0 +1,67 @@
+import threading
+from typing import Any, Callable, Iterable, Optional
+from icarus_consumables.generators.base import BaseGenerator
+from icarus_consumables.models.shared import freeze
+from icarus_consumables.utils.profiler import PipelineProfiler
+
+def _payload(views: "DataViews") -> Any:
+    if views.payload_builder is None:
+        raise ValueError("The payload view needs a payload builder (a JsonGenerator)")
+    # Shared by concurrent generators, so frozen: a mutation raises instead of corrupting the others' output
+    return freeze(views.payload_builder.build_payload(views.items))
+
+def _stat_matrix(views: "DataViews") -> Any:
+    from icarus_consumables.services.stat_matrix import StatMatrix
+    return StatMatrix.from_items(views.items)
+
+# View name -> builder. Generators list the views they read in REQUIRED_VIEWS.
+VIEW_BUILDERS: dict[str, Callable[["DataViews"], Any]] = {
+    "payload": _payload,          # JsonGenerator payload: items, recipes, modifiers, benches, stat_metadata
+    "stat_matrix": _stat_matrix   # StatMatrix of base stat and modifier effect vectors (NumPy)
+}
+
+class DataViews:
+    """
+    Derived views of one run's parsed items, shared by every generator in
+    the run. Each view is built at most once, when a generator first asks
+    for it, so a run only pays for the views its selected generators
+    declare. The payload view is deep-frozen (FrozenDict/FrozenList), so a
+    generator that tries to modify it fails on its own. A failed build is not
+    cached; every generator asking for that view reports the error itself.
+    """
+
+    def __init__(self, items: tuple[Any, ...], payload_builder: Any = None, profiler: Optional[PipelineProfiler] = None):
+        """
+        Initializes the views over the shared tuple of parsed items.
+        """
+        self.items = items
+        self.payload_builder = payload_builder
+        self.profiler = profiler or PipelineProfiler(enabled=False)
+        self._values: dict[str, Any] = {}
+        self._locks = {name: threading.Lock() for name in VIEW_BUILDERS}
+
+    @classmethod
+    def for_generators(cls, items: tuple[Any, ...], generators: Iterable[BaseGenerator], profiler: Optional[PipelineProfiler] = None) -> "DataViews":
+        """
+        Creates the views for a set of generators. The payload is built by the
+        first generator that declares it (a JsonGenerator, or the JsonGenerator
+        a generator composes as its payload_builder).
+        """
+        builder = next(
+            (getattr(gen, "payload_builder", gen) for gen in generators if "payload" in gen.REQUIRED_VIEWS),
+            None
+        )
+        return cls(items, builder, profiler)
+
+    def get(self, name: str) -> Any:
+        """
+        Returns the named view, building it on first use. Concurrent callers wait for one build.
+        """
+        builder = VIEW_BUILDERS.get(name)
+        if builder is None:
+            raise ValueError(f"Unknown data view: {name}")
+        with self._locks[name]:
+            if name not in self._values:
+                with self.profiler.stage(f"view:{name}", "view"):
+                    self._values[name] = builder(self)
+            return self._values[name]
@@ -1,11 +1,12 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 from .item import IcarusItem
 from .modifier import ModifierEffect
 from .recipe import Recipe
-from .tier import TierInfo
+from .shared import EMPTY_DICT, EMPTY_LIST
+from .tier import TierInfo, UNTIERED
 
-@dataclass
+@dataclass(slots=True)
 class ConsumableData(IcarusItem):
     """
     Represents the full set of data for a consumable item in Icarus, 
@@ -26,10 +27,10 @@ class ConsumableData(IcarusItem):
     category: str = ""
     is_visible: bool = True
     is_decay_product: bool = False
-    base_stats: dict[str, float] = field(default_factory=dict)
-    modifiers: list[ModifierEffect] = field(default_factory=list)
-    recipes: list[Recipe] = field(default_factory=list)
-    tier_info: TierInfo = field(default_factory=lambda: TierInfo(0, 0.0, 0.0, "None", True))
+    base_stats: dict[str, float] = EMPTY_DICT
+    modifiers: list[ModifierEffect] = EMPTY_LIST
+    recipes: list[Recipe] = EMPTY_LIST
+    tier_info: TierInfo = UNTIERED
     
     # Growth Data
     growth_time: Optional[int] = None
@@ -37,3 +38,9 @@ class ConsumableData(IcarusItem):
     harvest_max: Optional[int] = None
     yield_multiplier: int = 1
     source_item: Optional[str] = None # The item this piece came from (e.g., Chocolate_Cake)
+
+    # Recipe Graph Data
+    used_in: list[str] = EMPTY_LIST # Items this one is an ingredient of
+    raw_materials: dict[str, float] = EMPTY_DICT # Flattened raw inputs per unit
+    energy_cost: Optional[float] = None # Total millijoules along the cheapest production path
+    plot_hours: dict[str, float] = EMPTY_DICT # Crop -> farm plot-hours per unit
@@ -1,7 +1,8 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional, Dict
+from .shared import EMPTY_DICT
 
-@dataclass
+@dataclass(slots=True)
 class IcarusItem:
     """
     The fundamental base class for all items in the Icarus game data.
@@ -20,4 +21,4 @@ class IcarusItem:
     yields_item: Optional[str] = None # For items that break down (e.g., Cake -> Piece)
     yields_count: int = 1              # How many are yielded
     is_override: bool = False          # True if any property was set via an override file
-    source_ids: Dict[str, str] = field(default_factory=dict) # SourceFile -> ExactSourceID
+    source_ids: Dict[str, str] = EMPTY_DICT # SourceFile -> ExactSourceID (shared with the item index; read-only)
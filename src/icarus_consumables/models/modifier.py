@@ -8,7 +8,7 @@ class StatType(Enum):
     PERCENTAGE = "percentage"
     BOOLEAN = "boolean"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatEffect:
     """
     Represents a single stat change from a modifier.
@@ -32,7 +32,7 @@ class StatEffect:
         
         return self.name, float(self.value)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModifierEffect:
     """
     Defines a status effect or buff applied to a player.
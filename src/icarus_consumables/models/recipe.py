@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from typing import Optional
 from .item import IcarusItem
+from .shared import EMPTY_DICT, EMPTY_LIST
 
-@dataclass
+@dataclass(slots=True)
 class Ingredient:
     """
     A link between an item and a specific quantity, used for defining 
@@ -18,8 +19,9 @@ class Ingredient:
     count: int = 1                    # Quantity required or produced
     tag: Optional[str] = None         # For generic inputs (e.g., Any_Vegetable)
     is_generic: bool = False          # Whether this is a generic tag-based input
+    satisfied_by: list[str] = EMPTY_LIST # Normalized IDs matching the tag query
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     """
     A complete crafting recipe definition, mapping inputs to outputs 
@@ -42,3 +44,5 @@ class Recipe:
     character_req: Optional[str] = None    # Character flag requirement
     session_req: Optional[str] = None      # DLC or mission requirements
     energy_cost: float = 0.0               # Required millijoules
+    bench_ranks: dict[str, int] = EMPTY_DICT # Bench -> anchor rank (1-4, from get_bench_rank)
+    bench_ids: list[str] = EMPTY_LIST # Bench row names (benches holds display names once parsed)
@@ -0,0 +1,44 @@
+from typing import Any, NoReturn
+
+def _read_only(*args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError("Shared container is read-only; assign a new container instead")
+
+class FrozenDict(dict):
+    """
+    A dict that rejects mutation. Still a real dict, so JSON encoding,
+    copying and comparisons behave exactly like an ordinary empty dict.
+    """
+    __slots__ = ()
+    # Hashable by identity so the shared instance can be a plain dataclass default
+    __hash__ = object.__hash__
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    update = pop = popitem = setdefault = clear = _read_only
+
+class FrozenList(list):
+    """
+    A list that rejects mutation; see FrozenDict.
+    """
+    __slots__ = ()
+    __hash__ = object.__hash__
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+def freeze(value: Any) -> Any:
+    """
+    Returns a deep read-only copy of nested dicts, lists and tuples (other
+    values are shared). The copies are still real dicts and lists, so JSON
+    encoding and reads behave as before while any mutation raises TypeError.
+    """
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+# Defaults for model container fields that are usually empty. Every model
+# shares these instances instead of allocating its own empty dict or list;
+# code that fills such a field assigns a new container.
+EMPTY_DICT: dict = FrozenDict()
+EMPTY_LIST: list = FrozenList()
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TierInfo:
     """
     Metadata describing the technological standing of an item.
@@ -22,3 +22,6 @@ class TierInfo:
     anchor_bench: str         # The primary bench for the tier (e.g., "Crafting_Bench")
     is_harvested: bool        # True if Tier 0 (not crafted)
     is_orbital: bool = False  # True if purchased from orbit
+
+# Default for items whose tier has not been resolved
+UNTIERED = TierInfo(0, 0.0, 0.0, "None", True)
@@ -1,29 +1,72 @@
-from icarus_consumables.services.data_loader import IcarusDataLoader
-from icarus_consumables.services.translation import IcarusTranslationService
-from icarus_consumables.services.tier_mapper import IcarusTierMapper
-from icarus_consumables.services.recipe_service import RecipeService
-from icarus_consumables.services.modifier_service import ModifierService
-from icarus_consumables.services.consumable_parser import ConsumableDataParser
-from icarus_consumables.services.category_service import CategoryService
-from icarus_consumables.services.override_service import OverrideService
-from icarus_consumables.services.farming_service import FarmingService
-from icarus_consumables.services.tag_service import IcarusTagService
 from icarus_consumables.generators.base import BaseGenerator
-from typing import Any
+from icarus_consumables.generators.views import DataViews
+from icarus_consumables.utils.profiler import PipelineProfiler, MemoryProfiler
+from icarus_consumables.utils.path_resolver import resolve_path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+import gc
+import time
+
+if TYPE_CHECKING:
+    from icarus_consumables.services.consumable_parser import ConsumableDataParser
+    from icarus_consumables.services.data_loader import IcarusDataLoader
+    from icarus_consumables.utils.run_cache import RunCache
 
 class IcarusFoodParserApp:
     """
     The main orchestration class for the food parser application.
     """
 
-    def __init__(self, data_loader: IcarusDataLoader, config: dict[str, Any]):
+    # Raw tables still read by ConsumableDataParser.parse_all once services are built
+    PARSE_TABLES = ("consumables", "itemable", "items_static", "decayable")
+
+    ITEM_INDEX_PATH = "output/item_index_mapping.json"
+
+    # Raw tables the Master Item Index is built from
+    ITEM_INDEX_TABLES = ("items_static", "consumables", "item_templates", "workshop_items")
+
+    # Service name -> inputs it is built from, in build order. Inputs are raw
+    # table keys, "item_index", "config", "overrides" or earlier services.
+    SERVICE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+        "translation": ("itemable", "items_static"),
+        "tag": ("crafting_tags", "tag_queries", "items_static"),
+        "recipe": ("recipes", "items_static", "tag", "item_index"),
+        "recipe_graph": ("recipes", "recipe"),
+        "tier_mapper": ("items_static", "talents", "recipe", "workshop_items", "item_templates", "consumables", "item_index"),
+        "bom": ("recipe_graph", "tier_mapper", "item_index"),
+        "tier_propagation": ("recipe_graph", "tier_mapper", "item_index"),
+        "modifier": ("modifiers",),
+        "category": ("config",),
+        "override": ("config", "overrides"),
+        "farming": ("farming_seeds", "farming_growth_states", "item_rewards"),
+        "farming_planner": ("bom", "farming", "item_index")
+    }
+
+    def __init__(
+        self, 
+        data_loader: "IcarusDataLoader", 
+        config: dict[str, Any], 
+        profiler: Optional[PipelineProfiler] = None,
+        memory_profiler: Optional[MemoryProfiler] = None,
+        run_cache: Optional["RunCache"] = None
+    ):
         """
         Initializes the application with a data loader and configuration.
+        Optional profilers time every stage and service constructor and
+        record memory after each stage. With a run cache, unchanged inputs
+        restore the previous outputs instead of re-running the pipeline.
         """
 
         self.data_loader = data_loader
         self.config = config
         self.generators: list[BaseGenerator] = []
+        self.profiler = profiler or PipelineProfiler(enabled=False)
+        self.memory_profiler = memory_profiler or MemoryProfiler(enabled=False)
+        self.release_tables = bool(config.get("RELEASE_RAW_TABLES", False))
+        self.consumable_parser: Optional["ConsumableDataParser"] = None
+        self.run_cache = run_cache
 
     def add_generator(self, generator: BaseGenerator):
         """
@@ -31,21 +74,126 @@ class IcarusFoodParserApp:
         """
         self.generators.append(generator)
 
-    def run(self):
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """
+        Wraps a top-level pipeline stage in both the timer and the memory profiler.
+        """
+        with self.profiler.stage(name), self.memory_profiler.stage(name):
+            yield
+
+    def _release(self, data: dict[str, Any], keep: tuple[str, ...] = ()):
+        """
+        Drops raw row tables no remaining stage reads, so they can be garbage collected.
+        Services still holding rows keep those alive until the services themselves are released.
+        """
+        for key in list(data):
+            if key not in keep:
+                del data[key]
+        gc.collect()
+
+    def run(self, use_async: bool = False):
         """
-        Executes the full parsing and generation pipeline.
+        Executes the full parsing and generation pipeline. With use_async, the
+        stages run as asyncio tasks that start as soon as their inputs are ready.
         """
         print("🚀 Starting Icarus Food Data Refactor (v2)...")
+
+        fingerprint = None
+        if self.run_cache:
+            fingerprint = self.compute_fingerprint()
+            # Profiling runs always execute the pipeline; there is nothing to measure on a hit
+            if not (self.profiler.enabled or self.memory_profiler.enabled):
+                restored = self.run_cache.restore(fingerprint)
+                if restored is not None:
+                    print(f"⚡ Inputs unchanged (fingerprint {fingerprint[:12]}), restored {len(restored)} cached output files.")
+                    return
         
+        if use_async:
+            from icarus_consumables.async_pipeline import AsyncPipeline
+            with self._stage("async_pipeline"):
+                AsyncPipeline(self).run()
+        else:
+            processed_data, item_index = self.process()
+
+            # 4. Generate Output
+            print("📝 Generating output files...")
+            with self._stage("generate"):
+                self._generate(processed_data, item_index)
+            
+        if self.run_cache and fingerprint:
+            self.run_cache.store(fingerprint, self.artifact_paths())
+
+        print("✨ Refactor pipeline complete!")
+        profile_dir = resolve_path(self.config.get("PROFILE_DIR", "output/profile"))
+        self.profiler.write_reports(profile_dir)
+        self.memory_profiler.write_reports(profile_dir)
+
+    def process(self) -> tuple[list[Any], Any]:
+        """
+        Loads the game data, builds the services and parses every consumable.
+        Returns the parsed items and the Master Item Index.
+        """
         # 1. Load Data
         print("📂 Loading game data files...")
-        data = self.data_loader.load_all_data()
+        with self._stage("load_data"):
+            data = self.data_loader.load_all_data()
+        
+        print("🛠 Building Master Item Index...")
+        with self._stage("build_item_index"):
+            item_index = self._build_item_index(data)
+
+        # 2. Initialize Services
+        print("🛠 Initializing services...")
+        with self._stage("init_services"):
+            services = self._build_services(data, item_index)
+            if self.release_tables:
+                self._release(data, keep=self.PARSE_TABLES)
         
-        translation_service = IcarusTranslationService(data["itemable"], data["items_static"])
+        # 3. Parse Items
+        print("🔍 Parsing consumables...")
+        with self._stage("parse"):
+            processed_data = self._parse(data, services, item_index)
+        print(f"✅ Processed {len(processed_data)} items.")
+
+        if self.release_tables:
+            with self._stage("release_tables"):
+                services.clear()
+                self.consumable_parser = None
+                self._release(data)
+
+        return processed_data, item_index
+
+    def compute_fingerprint(self) -> str:
+        """
+        Fingerprints every input of a run: game data tables, output-affecting
+        config, override files, generator inputs and the parser version.
+        """
+        data_files = [self.data_loader.pak_dir / p for p in self.data_loader.TABLE_PATHS.values()]
+        extra_files = [path for gen in self.generators for path in gen.input_paths()]
+        generator_names = ",".join(f"{type(gen).__name__}:{gen.output_path.name}" for gen in self.generators)
+        return self.run_cache.compute_fingerprint(
+            data_files,
+            self.config,
+            extra_files,
+            Path(self.config.get("OVERRIDES_DIR", "data/overrides")),
+            salt=f"{self.config.get('PARSER_VERSION', '')}|{generator_names}"
+        )
+
+    def artifact_paths(self) -> list[Path]:
+        """
+        Returns every file a run writes: the item index mapping plus each generator's artifacts.
+        """
+        paths = [Path(self.ITEM_INDEX_PATH)]
+        for gen in self.generators:
+            paths.extend(gen.artifact_paths())
+        return paths
 
-        # Build Master Item Index
+    def _build_item_index(self, data: dict[str, Any]) -> Any:
+        """
+        Builds the Master Item Index aligning IDs across the source tables.
+        """
         from icarus_consumables.services.item_index import ItemIndexService
-        print("🛠 Building Master Item Index...")
         item_index = ItemIndexService()
         for row in data["items_static"]:
             item_index.add_entry("D_ItemsStatic", str(row.get("Name")))
@@ -55,51 +203,193 @@ class IcarusFoodParserApp:
             item_index.add_entry("D_ItemTemplate", str(row.get("Name")))
         for row in data["workshop_items"]:
             item_index.add_entry("D_WorkshopItems", str(row.get("Name")))
+        return item_index
 
-        # 2. Initialize Services
-        print("🛠 Initializing services...")
-        tag_service = IcarusTagService(data["crafting_tags"], data["tag_queries"])
-        recipe_service = RecipeService(data["recipes"], data["items_static"], tag_service, item_index)
-        
-        # Build Item Map for TierMapper (Systematic tag lookup)
-        static_item_dict = {str(r.get("Name")): r for r in data["items_static"]}
-        tier_mapper = IcarusTierMapper(
-            static_item_dict, 
-            data["talents"], 
-            recipe_service, 
-            data["workshop_items"],
-            data["item_templates"],
-            data["consumables"],
-            item_index
-        )
-        
-        modifier_service = ModifierService(data["modifiers"])
-        category_service = CategoryService(self.config)
-        override_service = OverrideService(self.config.get("OVERRIDES_DIR", "data/overrides"))
-        farming_service = FarmingService(data["farming_seeds"], data["farming_growth_states"], data["item_rewards"])
-        
-        # 3. Parse Items
-        print("🔍 Parsing consumables...")
+    def _build_services(self, data: dict[str, Any], item_index: Any) -> dict[str, Any]:
+        """
+        Constructs every service from the raw tables in dependency order, timing each constructor.
+        """
+        services: dict[str, Any] = {}
+        for name in self.SERVICE_DEPENDENCIES:
+            self._build_service(name, data, item_index, services)
+        return services
+
+    def _build_service(self, name: str, data: dict[str, Any], item_index: Any, services: dict[str, Any]) -> Any:
+        """
+        Constructs (or reconstructs) one service from its declared inputs and stores it in services.
+        Each service module is imported on first use, so importing the app stays cheap.
+        """
+        profiler = self.profiler
+        if name == "translation":
+            from icarus_consumables.services.translation import IcarusTranslationService
+            service = profiler.measure(
+                "IcarusTranslationService", IcarusTranslationService, data["itemable"], data["items_static"]
+            )
+        elif name == "tag":
+            from icarus_consumables.services.tag_service import IcarusTagService
+            service = profiler.measure(
+                "IcarusTagService", IcarusTagService, data["crafting_tags"], data["tag_queries"], data["items_static"]
+            )
+        elif name == "recipe":
+            from icarus_consumables.services.recipe_service import RecipeService
+            service = profiler.measure(
+                "RecipeService", RecipeService, data["recipes"], data["items_static"], services["tag"], item_index
+            )
+        elif name == "recipe_graph":
+            from icarus_consumables.services.recipe_graph import RecipeGraph
+            service = profiler.measure("RecipeGraph", RecipeGraph, data["recipes"], services["recipe"])
+        elif name == "tier_mapper":
+            from icarus_consumables.services.tier_mapper import IcarusTierMapper
+            # Build Item Map for TierMapper (Systematic tag lookup)
+            static_item_dict = {str(r.get("Name")): r for r in data["items_static"]}
+            service = profiler.measure(
+                "IcarusTierMapper",
+                IcarusTierMapper,
+                static_item_dict, 
+                data["talents"], 
+                services["recipe"], 
+                data["workshop_items"],
+                data["item_templates"],
+                data["consumables"],
+                item_index
+            )
+        elif name == "bom":
+            from icarus_consumables.services.bill_of_materials import BillOfMaterialsService
+            # Raw materials for costing: anything carrying harvest tags is never expanded
+            tier_mapper = services["tier_mapper"]
+            raw_items = {
+                norm for norm in services["recipe_graph"].items
+                if tier_mapper.is_harvest_item(item_index.get_source_id("D_ItemsStatic", norm) or norm)
+            }
+            service = profiler.measure(
+                "BillOfMaterialsService", BillOfMaterialsService, services["recipe_graph"], raw_items
+            )
+        elif name == "tier_propagation":
+            from icarus_consumables.services.tier_propagation import TierPropagationService
+            service = profiler.measure(
+                "TierPropagationService", TierPropagationService, services["recipe_graph"], services["tier_mapper"], item_index
+            )
+        elif name == "modifier":
+            from icarus_consumables.services.modifier_service import ModifierService
+            service = profiler.measure("ModifierService", ModifierService, data["modifiers"])
+        elif name == "category":
+            from icarus_consumables.services.category_service import CategoryService
+            service = profiler.measure("CategoryService", CategoryService, self.config)
+        elif name == "override":
+            from icarus_consumables.services.override_service import OverrideService
+            service = profiler.measure(
+                "OverrideService", OverrideService, self.config.get("OVERRIDES_DIR", "data/overrides")
+            )
+        elif name == "farming":
+            from icarus_consumables.services.farming_service import FarmingService
+            service = profiler.measure(
+                "FarmingService", FarmingService,
+                data["farming_seeds"], data["farming_growth_states"], data["item_rewards"]
+            )
+        elif name == "farming_planner":
+            from icarus_consumables.services.farming_planner import FarmingPlanner
+            service = profiler.measure(
+                "FarmingPlanner", FarmingPlanner, services["bom"], services["farming"], item_index
+            )
+        else:
+            raise ValueError(f"Unknown service: {name}")
+
+        services[name] = service
+        return service
+
+    def _parse(self, data: dict[str, Any], services: dict[str, Any], item_index: Any) -> list[Any]:
+        """
+        Assembles the ConsumableDataParser from the services and parses every consumable.
+        """
+        from icarus_consumables.services.consumable_parser import ConsumableDataParser
         self.consumable_parser = ConsumableDataParser(
-            translation_service,
-            recipe_service,
-            tier_mapper,
-            modifier_service,
-            category_service,
-            override_service,
-            farming_service,
+            services["translation"],
+            services["recipe"],
+            services["tier_mapper"],
+            services["modifier"],
+            services["category"],
+            services["override"],
+            services["farming"],
             item_index,
-            data["decayable"]
+            data["decayable"],
+            services["recipe_graph"],
+            services["bom"],
+            services["tier_propagation"],
+            services["farming_planner"]
         )
         
-        processed_data = self.consumable_parser.parse_all(data["consumables"], data["itemable"], data["items_static"], data["decayable"])
-        print(f"✅ Processed {len(processed_data)} items.")
-        
-        # 4. Generate Output
-        print("📝 Generating output files...")
-        item_index.export_to_json("output/item_index_mapping.json")
-        for gen in self.generators:
-            print(f"   - Generating {gen.output_path.name}...")
-            gen.generate(processed_data)
-            
-        print("✨ Refactor pipeline complete!")
+        return self.consumable_parser.parse_all(data["consumables"], data["itemable"], data["items_static"], data["decayable"])
+
+    def _generate(self, processed_data: list[Any], item_index: Any):
+        """
+        Writes the item index mapping and runs every registered generator.
+        Generators run concurrently on a thread pool (GENERATOR_WORKERS, 1 runs
+        them in order) against one shared tuple of the items and the data views
+        built from it. The payload view is deep-frozen; the tuple only fixes
+        the sequence, and the items themselves are shared, mutable objects, so
+        generators must not modify them (test_generators_do_not_mutate_items
+        checks the built-in ones). A failing generator does not stop the
+        others; failures are reported together once every generator has
+        finished.
+        """
+        with self.profiler.stage("ItemIndexService.export_to_json", "generator"):
+            item_index.export_to_json(self.ITEM_INDEX_PATH)
+
+        snapshot = tuple(processed_data)
+        views = self._data_views(snapshot)
+        workers = min(int(self.config.get("GENERATOR_WORKERS", 4)), len(self.generators))
+        if workers > 1:
+            # Pool threads start at depth 0; nest their spans under the calling stage instead
+            depth = self.profiler.current_depth()
+
+            def run(gen: BaseGenerator) -> tuple[float, Optional[Exception]]:
+                with self.profiler.at_depth(depth):
+                    return self._run_generator(gen, snapshot, views)
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="generator") as pool:
+                results = list(pool.map(run, self.generators))
+        else:
+            results = [self._run_generator(gen, snapshot, views) for gen in self.generators]
+        self._report_generators(results)
+
+    def _data_views(self, snapshot: tuple[Any, ...]) -> DataViews:
+        """
+        Returns the shared data views for the registered generators; nothing is built until a generator asks.
+        """
+        return DataViews.for_generators(snapshot, self.generators, self.profiler)
+
+    def required_views(self) -> list[str]:
+        """
+        Returns the data views the registered generators declare, in first-use order.
+        """
+        return list(dict.fromkeys(view for gen in self.generators for view in gen.REQUIRED_VIEWS))
+
+    def _report_generators(self, results: list[tuple[float, Optional[Exception]]]):
+        """
+        Prints each generator's time and raises once if any generator failed.
+        """
+        failures = []
+        for gen, (elapsed, error) in zip(self.generators, results):
+            if error is None:
+                print(f"   - Generated {gen.output_path.name} ({elapsed * 1000.0:.0f} ms)")
+            else:
+                print(f"   ❌ {gen.output_path.name} failed after {elapsed * 1000.0:.0f} ms: {error}")
+                failures.append(f"{type(gen).__name__} ({gen.output_path.name}): {error}")
+        if failures:
+            raise RuntimeError(f"{len(failures)} generator(s) failed: " + "; ".join(failures))
+
+    def _run_generator(self, gen: BaseGenerator, snapshot: tuple[Any, ...], views: Optional[DataViews] = None) -> tuple[float, Optional[Exception]]:
+        """
+        Runs one generator, returning its wall time in seconds and the exception it raised, if any.
+        Generators declaring REQUIRED_VIEWS also receive the shared views.
+        """
+        start = time.perf_counter()
+        try:
+            with self.profiler.stage(type(gen).__name__, "generator"):
+                if gen.REQUIRED_VIEWS and views is not None:
+                    gen.generate(snapshot, views)
+                else:
+                    gen.generate(snapshot)
+        except Exception as e:
+            return time.perf_counter() - start, e
+        return time.perf_counter() - start, None
@@ -0,0 +1,205 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.models.consumable import ConsumableData
+from icarus_consumables.services.catalog import ConsumableCatalog
+
+class QueryError(ValueError):
+    """Raised for malformed query parameters; answered with HTTP 400."""
+
+class CatalogQueryService:
+    """
+    Answers item queries over the parsed consumables held in memory. Item,
+    recipe and modifier bodies use the same JSON schema as JsonGenerator.
+    """
+
+    def __init__(self, items: list[ConsumableData], generator: JsonGenerator):
+        """
+        Builds the JSON payload once and indexes the visible items in a ConsumableCatalog.
+        """
+        self.payload = generator.build_payload(items)
+        self.catalog = ConsumableCatalog(items)
+        self.items = self.catalog.items
+        self.item_dicts: dict[str, dict[str, Any]] = {d["name"]: d for d in self.payload["items"]}
+
+    def handle(self, path: str, params: dict[str, list[str]]) -> tuple[int, Any]:
+        """
+        Routes a GET request and returns (status, JSON-serializable body).
+        """
+        parts = [unquote(p) for p in path.strip("/").split("/") if p]
+        try:
+            if not parts or parts == ["health"]:
+                return 200, {"status": "ok", "items": len(self.items), "metadata": self.payload["metadata"]}
+            if parts == ["items"]:
+                return 200, self.query_items(params)
+            if parts[0] == "items" and len(parts) == 2:
+                return self.get_item(parts[1])
+            if parts[0] in ("recipes", "modifiers") and len(parts) == 2:
+                entry = self.payload[parts[0]].get(parts[1])
+                return (200, entry) if entry else (404, {"error": f"Unknown {parts[0][:-1]}: {parts[1]}"})
+            if parts == ["stats"]:
+                return 200, self.payload["stat_metadata"]
+        except QueryError as e:
+            return 400, {"error": str(e)}
+        return 404, {"error": f"Unknown endpoint: {path}"}
+
+    def get_item(self, name: str) -> tuple[int, Any]:
+        """
+        Returns one item together with the recipes and modifiers it references.
+        """
+        consumable = self.catalog.get(name)
+        item = self.item_dicts.get(consumable.name) if consumable else None
+        if not item:
+            return 404, {"error": f"Unknown item: {name}"}
+        return 200, {
+            "item": item,
+            "recipes": {rid: self.payload["recipes"][rid] for rid in item["recipes"] if rid in self.payload["recipes"]},
+            "modifiers": {mid: self.payload["modifiers"][mid] for mid in item["modifiers"] if mid in self.payload["modifiers"]}
+        }
+
+    def query_items(self, params: dict[str, list[str]]) -> dict[str, Any]:
+        """
+        Filters items by category, tier range (min_tier/max_tier), stat,
+        bench, anchor bench, modifier and ingredient via the catalog indexes.
+        Repeated category, bench, anchor or modifier values match any;
+        repeated stats and ingredients must all be present. Supports limit/offset paging.
+        """
+        matches = self.catalog.query(
+            categories=params.get("category", []),
+            anchor_benches=params.get("anchor", []),
+            modifiers=params.get("modifier", []),
+            ingredients=params.get("ingredient", []),
+            min_tier=_float_param(params, "min_tier"),
+            max_tier=_float_param(params, "max_tier"),
+            stats=params.get("stat", []),
+            benches=params.get("bench", [])
+        )
+        offset = _count_param(params, "offset") or 0
+        limit = _count_param(params, "limit")
+        page = matches[offset:offset + limit] if limit is not None else matches[offset:]
+        return {"count": len(matches), "items": [self.item_dicts[item.name] for item in page]}
+
+def _float_param(params: dict[str, list[str]], name: str) -> Optional[float]:
+    """Parses a single numeric query parameter."""
+    values = params.get(name)
+    if not values:
+        return None
+    try:
+        return float(values[0])
+    except ValueError:
+        raise QueryError(f"Parameter '{name}' must be a number, got '{values[0]}'")
+
+def _count_param(params: dict[str, list[str]], name: str) -> Optional[int]:
+    """Parses a single non-negative integer query parameter (limit, offset)."""
+    values = params.get(name)
+    if not values:
+        return None
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise QueryError(f"Parameter '{name}' must be a non-negative integer, got '{values[0]}'")
+    if value < 0:
+        raise QueryError(f"Parameter '{name}' must be a non-negative integer, got '{values[0]}'")
+    return value
+
+class _ResponseCache:
+    """
+    Thread-safe LRU cache of encoded responses keyed by canonical request path.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, tuple[int, bytes, str]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[int, bytes, str]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: tuple[int, bytes, str]):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+class CatalogHTTPServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server exposing a CatalogQueryService with ETag-validated, cached responses.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], query_service: CatalogQueryService, max_age: int = 60, verbose: bool = False):
+        super().__init__(address, _CatalogRequestHandler)
+        self.query_service = query_service
+        self.response_cache = _ResponseCache()
+        self.max_age = max_age
+        self.verbose = verbose
+
+    def respond(self, path: str, query: str) -> tuple[int, bytes, str]:
+        """
+        Returns (status, body, etag) for a request, serving repeated queries from the cache.
+        """
+        params = parse_qs(query)
+        key = path + "?" + "&".join(f"{k}={v}" for k in sorted(params) for v in params[k])
+        entry = self.response_cache.get(key)
+        if entry is None:
+            status, body = self.query_service.handle(path, params)
+            encoded = json.dumps(body, separators=(",", ":")).encode("utf-8")
+            entry = (status, encoded, '"' + hashlib.blake2b(encoded, digest_size=12).hexdigest() + '"')
+            if status == 200:
+                self.response_cache.put(key, entry)
+        return entry
+
+class _CatalogRequestHandler(BaseHTTPRequestHandler):
+    """Handles GET requests against the catalog server."""
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; avoid Nagle stalls on keep-alive connections
+    disable_nagle_algorithm = True
+    server: CatalogHTTPServer
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, body, etag = self.server.respond(url.path, url.query)
+
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"public, max-age={self.server.max_age}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def serve(items: list[ConsumableData], generator: JsonGenerator, host: str = "127.0.0.1", port: int = 8765, verbose: bool = False):
+    """
+    Serves the parsed items until interrupted.
+    """
+    server = CatalogHTTPServer((host, port), CatalogQueryService(items, generator), verbose=verbose)
+    print(f"🌐 Serving {len(server.query_service.items)} items on http://{host}:{server.server_address[1]} (Ctrl+C to stop)")
+    print("   GET /items?category=Drink&min_tier=2&stat=BaseHealthRegen&bench=Kitchen_Stove, /items/<name>, /recipes/<id>, /modifiers/<id>, /stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("👋 Server stopped.")
+    finally:
+        server.server_close()
@@ -0,0 +1,124 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+@dataclass
+class BillOfMaterials:
+    """
+    The flattened cost of producing one unit of an item: the raw
+    (gathered or unproducible) inputs and the total energy spent by
+    every recipe along the chosen production path.
+    """
+    raw_inputs: dict[str, float] = field(default_factory=dict)
+    energy_cost: float = 0.0           # Total RequiredMillijoules per unit
+    recipe_id: Optional[str] = None    # Cheapest recipe chosen (None for raw items)
+
+    @property
+    def total_units(self) -> float:
+        """Total number of raw units consumed, used to rank alternatives."""
+        return sum(self.raw_inputs.values())
+
+class BillOfMaterialsService:
+    """
+    Computes raw-material bills of materials and energy totals for every
+    item in the recipe graph in a single dynamic-programming pass. Items are
+    processed in topological order so each result is built from already
+    memoized ingredient results, and the cheapest recipe among alternatives
+    is selected. Recipe cycles are broken by ignoring inputs that are not
+    yet resolved within the same strongly connected component.
+    """
+
+    def __init__(self, recipe_graph: Any, raw_items: Optional[Iterable[str]] = None):
+        """
+        Initializes the service and computes the bill of materials for the whole catalog.
+        Items in raw_items (e.g., harvested crops and meats) are never expanded further.
+        """
+        self.recipe_graph = recipe_graph
+        self.raw_items = set(raw_items or [])
+        self.results: dict[str, BillOfMaterials] = {}
+        self.compute_all()
+
+    def compute_all(self) -> dict[str, BillOfMaterials]:
+        """
+        Fills the memo table for every graph item, component by component.
+        """
+        self.results = {}
+        for component in self.recipe_graph.components:
+            pending = list(component)
+            # Cycle guard: resolve members whose recipes only need already
+            # resolved inputs, repeating until the component stops making progress.
+            while pending:
+                unresolved = []
+                for item in pending:
+                    bom = self._compute_item(item)
+                    if bom:
+                        self.results[item] = bom
+                    else:
+                        unresolved.append(item)
+                if len(unresolved) == len(pending):
+                    for item in unresolved:
+                        self.results[item] = BillOfMaterials({item: 1.0})
+                    break
+                pending = unresolved
+        return self.results
+
+    def _compute_item(self, item: str) -> Optional[BillOfMaterials]:
+        """
+        Returns the cheapest bill of materials for an item, or None if every
+        producing recipe still depends on an unresolved input.
+        """
+        producers = self.recipe_graph.get_producers(item)
+        if item in self.raw_items or not producers:
+            return BillOfMaterials({item: 1.0})
+
+        best: Optional[BillOfMaterials] = None
+        for recipe_id in producers:
+            candidate = self._cost_recipe(recipe_id, item)
+            if candidate and (not best or self._sort_key(candidate) < self._sort_key(best)):
+                best = candidate
+        return best
+
+    def _cost_recipe(self, recipe_id: str, item: str) -> Optional[BillOfMaterials]:
+        """
+        Costs one unit of item via the given recipe from memoized ingredient results.
+        """
+        out_count = sum(count for name, count in self.recipe_graph.recipe_outputs[recipe_id] if name == item)
+        if out_count <= 0:
+            return None
+
+        parts: list[tuple[BillOfMaterials, int]] = []
+        for name, count in self.recipe_graph.recipe_inputs[recipe_id]:
+            if name == item or name not in self.results:
+                return None
+            parts.append((self.results[name], count))
+
+        for _, count, candidates in self.recipe_graph.recipe_generic_inputs[recipe_id]:
+            options = [self.results[c] for c in candidates if c != item and c in self.results]
+            if not options:
+                return None
+            parts.append((min(options, key=self._sort_key), count))
+
+        row = self.recipe_graph.recipes[recipe_id]
+        energy = float(row.get("RequiredMillijoules", 0.0))
+        raw_inputs: dict[str, float] = {}
+        for bom, count in parts:
+            energy += bom.energy_cost * count
+            for raw_name, qty in bom.raw_inputs.items():
+                raw_inputs[raw_name] = raw_inputs.get(raw_name, 0.0) + qty * count
+
+        return BillOfMaterials(
+            raw_inputs={name: qty / out_count for name, qty in raw_inputs.items()},
+            energy_cost=energy / out_count,
+            recipe_id=recipe_id
+        )
+
+    def _sort_key(self, bom: BillOfMaterials) -> tuple[float, float, str]:
+        """
+        Orders alternatives by raw unit count, then energy, then recipe ID for stability.
+        """
+        return (bom.total_units, bom.energy_cost, bom.recipe_id or "")
+
+    def get_bill_of_materials(self, item_name: str) -> Optional[BillOfMaterials]:
+        """
+        Returns the memoized bill of materials for a normalized item ID.
+        """
+        return self.results.get(item_name)
@@ -0,0 +1,133 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Optional
+from icarus_consumables.models.consumable import ConsumableData
+
+class ConsumableCatalog:
+    """
+    Indexed, read-only query API over parsed consumables. Secondary indexes
+    map category, anchor bench, crafting bench, modifier ID, ingredient and
+    stat name to item positions, and a sorted tier index answers range
+    queries by bisection. Combined queries intersect position sets, starting
+    from the smallest, instead of scanning every item. Keys are case-insensitive,
+    and crafting benches match by display name or bench row name.
+
+    Example:
+        >>> catalog = ConsumableCatalog(items)
+        >>> catalog.query(categories=["Drink"], min_tier=2.0, stats=["BaseHealthRegen"])
+    """
+
+    def __init__(self, items: Iterable[ConsumableData], include_hidden: bool = False):
+        """
+        Builds every index in one pass. Hidden items are skipped unless include_hidden is set.
+        """
+        self.items: list[ConsumableData] = [item for item in items if include_hidden or item.is_visible]
+        self.by_name: dict[str, int] = {}
+
+        self.category_index: dict[str, set[int]] = {}
+        self.anchor_index: dict[str, set[int]] = {}
+        self.bench_index: dict[str, set[int]] = {}
+        self.modifier_index: dict[str, set[int]] = {}
+        self.ingredient_index: dict[str, set[int]] = {}
+        self.stat_index: dict[str, set[int]] = {}
+
+        for pos, item in enumerate(self.items):
+            self.by_name.setdefault(item.name.lower(), pos)
+            _add(self.category_index, item.category, pos)
+            _add(self.anchor_index, item.tier_info.anchor_bench, pos)
+            for stat in item.base_stats:
+                _add(self.stat_index, stat, pos)
+            for modifier in item.modifiers:
+                if modifier is None or not modifier.id:
+                    continue
+                _add(self.modifier_index, modifier.id, pos)
+                for effect in modifier.effects:
+                    _add(self.stat_index, effect.name, pos)
+            for recipe in item.recipes:
+                # Benches match by display name or row name (Kitchen Stove / Kitchen_Stove)
+                for bench in (*recipe.benches, *recipe.bench_ids):
+                    _add(self.bench_index, bench, pos)
+                for ing in recipe.inputs:
+                    _add(self.ingredient_index, ing.item.name if ing.item else ing.tag, pos)
+
+        # Sorted (tier, position) pairs for bisect range queries
+        tier_pairs = sorted((item.tier_info.total_tier, pos) for pos, item in enumerate(self.items))
+        self._tiers = [tier for tier, _ in tier_pairs]
+        self._tier_positions = [pos for _, pos in tier_pairs]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, name: str) -> Optional[ConsumableData]:
+        """
+        Returns the item with the given internal name (case-insensitive), if any.
+        """
+        pos = self.by_name.get(name.lower())
+        return self.items[pos] if pos is not None else None
+
+    def tier_range(self, min_tier: Optional[float] = None, max_tier: Optional[float] = None) -> list[ConsumableData]:
+        """
+        Returns the items whose total tier lies within [min_tier, max_tier], ordered by tier.
+        """
+        lo, hi = self._tier_bounds(min_tier, max_tier)
+        return [self.items[pos] for pos in self._tier_positions[lo:hi]]
+
+    def _tier_bounds(self, min_tier: Optional[float], max_tier: Optional[float]) -> tuple[int, int]:
+        """Returns the slice of the sorted tier index covering the range."""
+        lo = bisect_left(self._tiers, min_tier) if min_tier is not None else 0
+        hi = bisect_right(self._tiers, max_tier) if max_tier is not None else len(self._tiers)
+        return lo, hi
+
+    def query(
+        self,
+        categories: Iterable[str] = (),
+        anchor_benches: Iterable[str] = (),
+        benches: Iterable[str] = (),
+        modifiers: Iterable[str] = (),
+        ingredients: Iterable[str] = (),
+        stats: Iterable[str] = (),
+        min_tier: Optional[float] = None,
+        max_tier: Optional[float] = None
+    ) -> list[ConsumableData]:
+        """
+        Returns the items matching every given filter, in catalog order.
+        Categories, anchor benches, benches and modifiers match any of the
+        given values; ingredients and stats must all be present.
+        """
+        candidate_sets: list[set[int]] = []
+        for index, values in (
+            (self.category_index, categories),
+            (self.anchor_index, anchor_benches),
+            (self.bench_index, benches),
+            (self.modifier_index, modifiers)
+        ):
+            keys = [v.lower() for v in values]
+            if keys:
+                candidate_sets.append(set().union(*(index.get(k, ()) for k in keys)))
+
+        for index, values in ((self.ingredient_index, ingredients), (self.stat_index, stats)):
+            for value in values:
+                candidate_sets.append(index.get(value.lower(), set()))
+
+        if min_tier is not None or max_tier is not None:
+            lo, hi = self._tier_bounds(min_tier, max_tier)
+            candidate_sets.append(set(self._tier_positions[lo:hi]))
+
+        if not candidate_sets:
+            return list(self.items)
+
+        candidate_sets.sort(key=len)
+        result = candidate_sets[0].intersection(*candidate_sets[1:])
+        return [self.items[pos] for pos in sorted(result)]
+
+    def get_categories(self) -> list[str]:
+        """Returns every indexed category key."""
+        return sorted(self.category_index)
+
+    def get_stat_names(self) -> list[str]:
+        """Returns every indexed stat key."""
+        return sorted(self.stat_index)
+
+def _add(index: dict[str, set[int]], key: Optional[str], pos: int):
+    """Adds a position under a lowercased key, skipping empty keys."""
+    if key:
+        index.setdefault(key.lower(), set()).add(pos)
@@ -23,7 +23,11 @@ class ConsumableDataParser:
         override_service: OverrideService,
         farming_service: FarmingService,
         item_index_service: Any,
-        decayable_rows: list[dict[str, Any]] = None
+        decayable_rows: list[dict[str, Any]] = None,
+        recipe_graph: Any = None,
+        bom_service: Any = None,
+        tier_propagation: Any = None,
+        farming_planner: Any = None
     ):
         """
         Initializes the parser with its required service dependencies.
@@ -37,6 +41,10 @@ class ConsumableDataParser:
         self.farming_service = farming_service
         self.item_index_service = item_index_service
         self.decayable_rows = decayable_rows or []
+        self.recipe_graph = recipe_graph
+        self.bom_service = bom_service
+        self.tier_propagation = tier_propagation
+        self.farming_planner = farming_planner
 
     def parse_all(self, consumable_rows: list[dict[str, Any]], itemable_rows: list[dict[str, Any]], items_static: list[dict[str, Any]], decayable_rows: list[dict[str, Any]] = None) -> list[ConsumableData]:
         """
@@ -190,7 +198,8 @@ class ConsumableDataParser:
         if not norm_id:
             norm_id = self.item_index_service._normalize_id(name)
             
-        source_ids = self.item_index_service.norm_to_source.get(norm_id, {}).copy()
+        # Shared with the item index rather than copied per item; models treat it as read-only
+        source_ids = self.item_index_service.norm_to_source.get(norm_id)
         if not source_ids:
             # If it was an override or something totally unindexed
             source_ids = {"Unknown": name}
@@ -253,7 +262,7 @@ class ConsumableDataParser:
             lifetime = int(mod_data.get("ModifierLifetime", 0))
             modifier = self.modifier_service.get_modifier_effect(mod_id, lifetime)
             if modifier:
-                consumable.modifiers.append(modifier)
+                consumable.modifiers = [modifier]
         
         # 5. Recipes & Tiers
         matched_recipes = self.recipe_service.get_recipes_for_item(name)
@@ -270,19 +279,27 @@ class ConsumableDataParser:
                         res.item.yields_item, res.item.yields_count = yield_info
                 
                 translated_benches = []
+                bench_ranks = {}
                 for bench in recipe.benches:
-                    translated_benches.append(self.translation.get_display_name(bench))
+                    display_name = self.translation.get_display_name(bench)
+                    translated_benches.append(display_name)
+                    bench_ranks[display_name] = self.tier_mapper.get_bench_rank(bench)
                 recipe.benches = translated_benches
+                recipe.bench_ranks = bench_ranks
 
             consumable.recipes = matched_recipes
             
             # For tiering, we use the lowest tier among available recipes
             recipe_rows = self.recipe_service.get_recipe_rows_for_item(name)
             best_tier_info = None
-            for raw_rec in recipe_rows:
-                tier_info = self.tier_mapper.calculate_tier(name, raw_rec)
-                if not best_tier_info or tier_info.total_tier < best_tier_info.total_tier:
-                    best_tier_info = tier_info
+            if self.tier_propagation and recipe_rows:
+                # Precomputed in one topological pass; never below the item's ingredients
+                best_tier_info = self.tier_propagation.get_item_tier(name, recipe_rows)
+            else:
+                for raw_rec in recipe_rows:
+                    tier_info = self.tier_mapper.calculate_tier(name, raw_rec)
+                    if not best_tier_info or tier_info.total_tier < best_tier_info.total_tier:
+                        best_tier_info = tier_info
             
             if best_tier_info:
                 consumable.tier_info = best_tier_info
@@ -290,6 +307,19 @@ class ConsumableDataParser:
             # Harvested item
             consumable.tier_info = self.tier_mapper.calculate_tier(name, None)
 
+        # Reverse "used in" lookup from the prebuilt recipe graph
+        if self.recipe_graph:
+            consumable.used_in = list(self.recipe_graph.get_used_in(norm_id))
+
+        # Precomputed bill of materials (only for items actually crafted from something)
+        if self.bom_service and matched_recipes:
+            bom = self.bom_service.get_bill_of_materials(norm_id)
+            if bom and bom.recipe_id:
+                consumable.raw_materials = dict(bom.raw_inputs)
+                consumable.energy_cost = bom.energy_cost
+                if self.farming_planner:
+                    consumable.plot_hours = dict(self.farming_planner.get_plot_hours(norm_id))
+
         # 6. Category Assignment
         consumable.category = self.category_service.assign_category(name, stats)
 
@@ -9,6 +9,26 @@ class IcarusDataLoader:
     file reading with proper encoding.
     """
 
+    # Data key -> file path relative to the pak directory
+    TABLE_PATHS = {
+        "consumables": "Traits/D_Consumable.json",
+        "recipes": "Crafting/D_ProcessorRecipes.json",
+        "recipe_sets": "Crafting/D_RecipeSets.json",
+        "modifiers": "Modifiers/D_ModifierStates.json",
+        "items_static": "Items/D_ItemsStatic.json",
+        "itemable": "Traits/D_Itemable.json",
+        "talents": "Talents/D_Talents.json",
+        "character_flags": "Flags/D_CharacterFlags.json",
+        "farming_seeds": "Farming/D_FarmingSeeds.json",
+        "farming_growth_states": "Farming/D_FarmingGrowthStates.json",
+        "item_rewards": "Items/D_ItemRewards.json",
+        "crafting_tags": "Crafting/D_CraftingTags.json",
+        "tag_queries": "Tags/D_TagQueries.json",
+        "workshop_items": "MetaWorkshop/D_WorkshopItems.json",
+        "item_templates": "Items/D_ItemTemplate.json",
+        "decayable": "Traits/D_Decayable.json"
+    }
+
     def __init__(self, pak_dir: str = "unpacked_icarus_data"):
         """
         Initializes the data loader with the pak directory path.
@@ -31,21 +51,4 @@ class IcarusDataLoader:
         """
         Loads all required game data files.
         """
-        return {
-            "consumables": self.load_json("Traits/D_Consumable.json"),
-            "recipes": self.load_json("Crafting/D_ProcessorRecipes.json"),
-            "recipe_sets": self.load_json("Crafting/D_RecipeSets.json"),
-            "modifiers": self.load_json("Modifiers/D_ModifierStates.json"),
-            "items_static": self.load_json("Items/D_ItemsStatic.json"),
-            "itemable": self.load_json("Traits/D_Itemable.json"),
-            "talents": self.load_json("Talents/D_Talents.json"),
-            "character_flags": self.load_json("Flags/D_CharacterFlags.json"),
-            "farming_seeds": self.load_json("Farming/D_FarmingSeeds.json"),
-            "farming_growth_states": self.load_json("Farming/D_FarmingGrowthStates.json"),
-            "item_rewards": self.load_json("Items/D_ItemRewards.json"),
-            "crafting_tags": self.load_json("Crafting/D_CraftingTags.json"),
-            "tag_queries": self.load_json("Tags/D_TagQueries.json"),
-            "workshop_items": self.load_json("MetaWorkshop/D_WorkshopItems.json"),
-            "item_templates": self.load_json("Items/D_ItemTemplate.json"),
-            "decayable": self.load_json("Traits/D_Decayable.json")
-        }
+        return {key: self.load_json(relative_path) for key, relative_path in self.TABLE_PATHS.items()}
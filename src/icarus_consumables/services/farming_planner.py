@@ -0,0 +1,99 @@
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+@dataclass
+class CropRequirement:
+    """
+    Growing capacity needed for one crop to sustain a consumption rate.
+    """
+    crop: str                 # Normalized crop item ID
+    units_per_hour: float     # Crop units consumed per hour
+    plots: float              # Exact number of plots needed
+    plots_rounded: int        # Plots to actually plant (rounded up)
+
+@dataclass
+class FarmingPlan:
+    """
+    Result of planning for a set of target consumption rates.
+    Raw inputs that are not farmable crops (meat, fish, water...) are
+    reported separately as units per hour.
+    """
+    crops: dict[str, CropRequirement] = field(default_factory=dict)
+    other_raw: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_plots(self) -> int:
+        """Total plots to plant across all crops."""
+        return sum(c.plots_rounded for c in self.crops.values())
+
+class FarmingPlanner:
+    """
+    Turns consumption targets into crop plot counts. Each crafted item's
+    bill of materials is already flattened to raw inputs, so the planner
+    only maps raw crops to their growth cycle: a plot yields the average
+    harvest once per growth time, and the plots for a crop are its hourly
+    demand divided by one plot's hourly output. Per-unit plot-hours are
+    precomputed for every costed item so the whole table is a batch lookup.
+    """
+
+    def __init__(self, bom_service: Any, farming_service: Any, item_index_service: Any):
+        """
+        Initializes the planner and precomputes per-unit plot-hours for every costed item.
+        """
+        self.bom_service = bom_service
+        self.farming_service = farming_service
+        self.item_index_service = item_index_service
+
+        # Normalized crop ID -> units one plot yields per hour
+        self.crop_rates: dict[str, float] = {}
+        for crop_name, info in farming_service.crop_map.items():
+            if info.time_seconds <= 0:
+                continue
+            norm = item_index_service.get_normalized_id("D_ItemsStatic", crop_name) or item_index_service._normalize_id(crop_name)
+            average_yield = (info.yield_min + info.yield_max) / 2.0
+            if average_yield > 0:
+                self.crop_rates[norm] = average_yield * 3600.0 / info.time_seconds
+
+        self.plot_hours: dict[str, dict[str, float]] = {}
+        for item, bom in bom_service.results.items():
+            hours = {
+                raw: qty / self.crop_rates[raw]
+                for raw, qty in bom.raw_inputs.items() if raw in self.crop_rates
+            }
+            if hours:
+                self.plot_hours[item] = hours
+
+    def get_plot_hours(self, item_name: str) -> dict[str, float]:
+        """
+        Returns crop -> plot-hours needed to produce one unit of a normalized item.
+        Plots needed for a rate of N units per hour are plot-hours x N.
+        """
+        return self.plot_hours.get(item_name, {})
+
+    def plan(self, targets: dict[str, float]) -> FarmingPlan:
+        """
+        Plans plots for target consumption rates given as normalized item ID -> units per hour.
+        """
+        demand: dict[str, float] = {}
+        for item, rate in targets.items():
+            bom = self.bom_service.get_bill_of_materials(item)
+            raw_inputs = bom.raw_inputs if bom else {item: 1.0}
+            for raw, qty in raw_inputs.items():
+                demand[raw] = demand.get(raw, 0.0) + qty * rate
+
+        plan = FarmingPlan()
+        for raw, units_per_hour in sorted(demand.items()):
+            crop_rate = self.crop_rates.get(raw)
+            if crop_rate:
+                plots = units_per_hour / crop_rate
+                plan.crops[raw] = CropRequirement(raw, units_per_hour, plots, math.ceil(plots - 1e-9))
+            else:
+                plan.other_raw[raw] = units_per_hour
+        return plan
+
+    def get_crop_rate(self, crop: str) -> Optional[float]:
+        """
+        Returns how many units of a normalized crop one plot yields per hour.
+        """
+        return self.crop_rates.get(crop)
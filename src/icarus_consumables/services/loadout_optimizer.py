@@ -0,0 +1,121 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+from icarus_consumables.models.consumable import ConsumableData
+from icarus_consumables.services.stat_matrix import StatMatrix
+
+@dataclass
+class Loadout:
+    """
+    A set of consumables eaten together, with its combined weighted score
+    and the summed stats it grants.
+    """
+    items: list[str]
+    score: float
+    stats: dict[str, float] = field(default_factory=dict)
+
+class LoadoutOptimizer:
+    """
+    Finds the best multi-item buff loadouts for a set of stat weights.
+    Items are scored in one vectorized pass over the StatMatrix, then a
+    depth-first branch-and-bound search picks combinations: candidates are
+    sorted by score, so the best completion of a partial loadout is bounded
+    by the next highest scores, and branches that cannot beat the current
+    K-th best loadout are pruned without being expanded.
+    """
+
+    def __init__(self, items: Iterable[ConsumableData], stat_matrix: Optional[StatMatrix] = None):
+        """
+        Initializes the optimizer from parsed items (visible only), reusing a prebuilt matrix if given.
+        """
+        items = [item for item in items if item.is_visible]
+        self.matrix = stat_matrix or StatMatrix.from_items(items)
+        self.modifier_ids: dict[str, frozenset[str]] = {
+            item.name: frozenset(m.id for m in item.modifiers if m and m.id) for item in items
+        }
+
+    def optimize(
+        self,
+        weights: dict[str, float],
+        size: int = 3,
+        category_mix: Optional[dict[str, int]] = None,
+        categories: Optional[Iterable[str]] = None,
+        max_tier: Optional[float] = None,
+        top_k: int = 5,
+        per_second: bool = False,
+        allow_duplicate_modifiers: bool = False
+    ) -> list[Loadout]:
+        """
+        Returns up to top_k loadouts ordered by score. category_mix fixes how
+        many items come from each category (e.g. {"Food": 2, "Drink": 1});
+        otherwise size items are drawn from the given categories (or all).
+        By default no two items in a loadout may grant the same modifier.
+        """
+        scores = self.matrix.score(weights, per_second)
+        if category_mix:
+            groups = [([category], count) for category, count in category_mix.items() if count > 0]
+        else:
+            groups = [(list(categories) if categories else None, size)]
+        if not groups or any(count <= 0 for _, count in groups) or top_k <= 0:
+            return []
+
+        # Per group: candidate rows sorted by descending score, with prefix sums for bounds
+        group_rows: list[list[int]] = []
+        group_scores: list[list[float]] = []
+        group_prefix: list[list[float]] = []
+        for group_categories, count in groups:
+            mask = self.matrix.mask(categories=group_categories, max_tier=max_tier)
+            rows = [int(r) for r in mask.nonzero()[0]]
+            rows.sort(key=lambda r: (-scores[r], self.matrix.names[r]))
+            if len(rows) < count:
+                return []
+            ordered = [float(scores[r]) for r in rows]
+            prefix = [0.0]
+            for s in ordered:
+                prefix.append(prefix[-1] + s)
+            group_rows.append(rows)
+            group_scores.append(ordered)
+            group_prefix.append(prefix)
+
+        # Best possible contribution of every group after index g
+        counts = [count for _, count in groups]
+        tail_bound = [0.0] * (len(groups) + 1)
+        for g in range(len(groups) - 1, -1, -1):
+            tail_bound[g] = tail_bound[g + 1] + group_prefix[g][counts[g]]
+
+        best: list[tuple[float, tuple[str, ...], list[int]]] = []
+        chosen: list[int] = []
+
+        def search(g: int, start: int, remaining: int, score: float, used: frozenset[str]):
+            if remaining == 0:
+                if g + 1 == len(groups):
+                    names = tuple(self.matrix.names[r] for r in chosen)
+                    if len(best) < top_k:
+                        heapq.heappush(best, (score, names, list(chosen)))
+                    elif score > best[0][0]:
+                        heapq.heapreplace(best, (score, names, list(chosen)))
+                    return
+                search(g + 1, 0, counts[g + 1], score, used)
+                return
+
+            rows, ordered, prefix = group_rows[g], group_scores[g], group_prefix[g]
+            for i in range(start, len(rows) - remaining + 1):
+                # Upper bound: this pick plus the next best picks in this group, then the best of later groups
+                bound = score + prefix[i + remaining] - prefix[i] + tail_bound[g + 1]
+                if len(best) == top_k and bound <= best[0][0]:
+                    break
+                modifiers = self.modifier_ids.get(self.matrix.names[rows[i]], frozenset())
+                if not allow_duplicate_modifiers and modifiers & used:
+                    continue
+                chosen.append(rows[i])
+                search(g, i + 1, remaining - 1, score + ordered[i], used | modifiers)
+                chosen.pop()
+
+        search(0, 0, counts[0], 0.0, frozenset())
+
+        loadouts = []
+        for score, names, rows in sorted(best, key=lambda e: (-e[0], e[1])):
+            totals = self.matrix.values[rows].sum(axis=0)
+            stats = {self.matrix.stat_names[c]: float(v) for c, v in enumerate(totals) if v}
+            loadouts.append(Loadout(list(names), score, stats))
+        return loadouts
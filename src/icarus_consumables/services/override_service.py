@@ -1,4 +1,5 @@
 import json
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Optional
 
@@ -76,11 +77,11 @@ class OverrideService:
 
         # Tier
         if "tier" in overrides and hasattr(item_data, "tier_info"):
-            item_data.tier_info.total_tier = float(overrides["tier"])
+            item_data.tier_info = replace(item_data.tier_info, total_tier=float(overrides["tier"]))
 
         # Stats
         if "stats" in overrides and hasattr(item_data, "base_stats"):
-            item_data.base_stats.update(overrides["stats"])
+            item_data.base_stats = {**item_data.base_stats, **overrides["stats"]}
 
         # Description
         if "description" in overrides:
@@ -0,0 +1,197 @@
+from collections import defaultdict
+from typing import Any
+
+class RecipeGraph:
+    """
+    A producer/consumer graph over every row of D_ProcessorRecipes, keyed by
+    normalized item IDs. Built once, it answers both "what makes X" and
+    "what uses X" by dictionary lookup. Generic tag inputs are expanded to
+    the concrete items that satisfy them, and strongly connected components
+    are detected so cyclic recipe chains can be handled by downstream passes.
+    """
+
+    def __init__(self, recipe_rows: list[dict[str, Any]], recipe_service: Any):
+        """
+        Builds adjacency for producers and consumers, the item-level dependency
+        edges, the strongly connected components and the reverse "used in" index.
+        """
+        self.recipe_service = recipe_service
+
+        # Recipe ID -> raw row / parsed edges
+        self.recipes: dict[str, dict[str, Any]] = {}
+        self.recipe_inputs: dict[str, list[tuple[str, int]]] = {}
+        self.recipe_generic_inputs: dict[str, list[tuple[str, int, list[str]]]] = {}
+        self.recipe_outputs: dict[str, list[tuple[str, int]]] = {}
+
+        # Item ID -> recipe IDs
+        self.producers: dict[str, list[str]] = defaultdict(list)
+        self.consumers: dict[str, list[str]] = defaultdict(list)
+
+        # Item ID -> items it is used to make (input -> output edges)
+        self.successors: dict[str, set[str]] = defaultdict(set)
+
+        self._build_adjacency(recipe_rows)
+        self.items: list[str] = sorted(set(self.successors) | set(self.producers) | set(self.consumers))
+
+        self.components = self._find_components()
+        self.component_of: dict[str, int] = {}
+        for index, component in enumerate(self.components):
+            for item in component:
+                self.component_of[item] = index
+
+        self.used_in = self._build_used_in()
+
+    def _build_adjacency(self, recipe_rows: list[dict[str, Any]]):
+        """
+        Parses every recipe row once into normalized input/output edges.
+        """
+        for row in recipe_rows:
+            recipe_id = str(row.get("Name", ""))
+            if not recipe_id or recipe_id in self.recipes:
+                continue
+            self.recipes[recipe_id] = row
+
+            outputs = []
+            for o in row.get("Outputs", []):
+                item_name = str(o.get("Element", {}).get("RowName", ""))
+                if item_name and item_name != "None":
+                    outputs.append((self.recipe_service.normalize_item_id(item_name), int(o.get("Count", 1))))
+
+            inputs = []
+            for i in row.get("Inputs", []):
+                item_name = str(i.get("Element", {}).get("RowName", ""))
+                if item_name and item_name != "None":
+                    inputs.append((self.recipe_service.normalize_item_id(item_name), int(i.get("Count", 1))))
+
+            generic_inputs = []
+            for qi in row.get("QueryInputs", []):
+                tag_data = qi.get("Query") or qi.get("Tag")
+                tag_name = str(tag_data.get("RowName", "")) if tag_data else ""
+                if tag_name and tag_name != "None":
+                    generic_inputs.append((tag_name, int(qi.get("Count", 1)), self.recipe_service.expand_tag(tag_name)))
+
+            self.recipe_outputs[recipe_id] = outputs
+            self.recipe_inputs[recipe_id] = inputs
+            self.recipe_generic_inputs[recipe_id] = generic_inputs
+
+            output_ids = [name for name, _ in outputs]
+            for name in dict.fromkeys(output_ids):
+                self.producers[name].append(recipe_id)
+
+            input_ids = [name for name, _ in inputs]
+            for _, _, candidates in generic_inputs:
+                input_ids.extend(candidates)
+
+            for name in dict.fromkeys(input_ids):
+                self.consumers[name].append(recipe_id)
+                self.successors[name].update(output_ids)
+
+    def _find_components(self) -> list[list[str]]:
+        """
+        Finds strongly connected components with an iterative Tarjan walk.
+        Components are returned in topological order: every component comes
+        after the components producing its ingredients.
+        """
+        index_of: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        components: list[list[str]] = []
+        counter = 0
+
+        for root in self.items:
+            if root in index_of:
+                continue
+
+            work = [(root, iter(sorted(self.successors.get(root, ()))))]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.successors.get(child, ())))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+        # Tarjan emits sink components first; reverse so ingredients precede products
+        components.reverse()
+        return components
+
+    def _build_used_in(self) -> dict[str, list[str]]:
+        """
+        Builds the reverse index: item -> items it is an ingredient of.
+        """
+        used_in: dict[str, list[str]] = {}
+        for item, products in self.successors.items():
+            others = sorted(p for p in products if p != item)
+            if others:
+                used_in[item] = others
+        return used_in
+
+    def is_cyclic(self, item_name: str) -> bool:
+        """
+        Returns True if the item takes part in a recipe cycle (including self-loops).
+        """
+        index = self.component_of.get(item_name)
+        if index is None:
+            return False
+        return len(self.components[index]) > 1 or item_name in self.successors.get(item_name, ())
+
+    def get_cyclic_components(self) -> list[list[str]]:
+        """
+        Returns every strongly connected component that forms a recipe cycle.
+        """
+        return [c for c in self.components if len(c) > 1 or c[0] in self.successors.get(c[0], ())]
+
+    def topological_order(self) -> list[str]:
+        """
+        Returns all items with ingredients ordered before the items made from them.
+        Members of a cycle are adjacent but in no particular dependency order.
+        """
+        return [item for component in self.components for item in component]
+
+    def get_producers(self, item_name: str) -> list[str]:
+        """
+        Returns the IDs of recipes that output the item.
+        """
+        return self.producers.get(item_name, [])
+
+    def get_consumers(self, item_name: str) -> list[str]:
+        """
+        Returns the IDs of recipes that take the item as an input (directly or via a tag).
+        """
+        return self.consumers.get(item_name, [])
+
+    def get_used_in(self, item_name: str) -> list[str]:
+        """
+        Returns the normalized IDs of items the given item is an ingredient of.
+        """
+        return self.used_in.get(item_name, [])
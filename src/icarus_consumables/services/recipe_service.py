@@ -1,3 +1,4 @@
+import json
 from typing import Any, Optional
 from icarus_consumables.models.recipe import Recipe, Ingredient
 from icarus_consumables.models.item import IcarusItem
@@ -14,6 +15,7 @@ class RecipeService:
         self.item_index_service = item_index_service
         self.tag_service = tag_service
         self.recipes = recipe_rows
+        self._tag_expansion_cache: dict[str, list[str]] = {}
         self.recipe_map = self._build_composite_index(recipe_rows, items_static)
         self.tier_mapper: Optional[Any] = None
 
@@ -165,6 +167,35 @@ class RecipeService:
             
         recipe.benches.sort(key=lambda b: self.tier_mapper.get_bench_rank(b))
 
+    def normalize_item_id(self, item_name: str) -> str:
+        """
+        Resolves a D_ItemsStatic row name used in a recipe to its normalized ID.
+        """
+        norm_item = self.item_index_service.get_normalized_id("D_ItemsStatic", item_name)
+        if not norm_item:
+            norm_item = self.item_index_service._normalize_id(item_name)
+        return norm_item
+
+    def expand_tag(self, tag_name: str) -> list[str]:
+        """
+        Returns the normalized IDs of all items satisfying a generic tag input.
+        """
+        if tag_name in self._tag_expansion_cache:
+            return self._tag_expansion_cache[tag_name]
+
+        expansion: list[str] = []
+        if self.tag_service:
+            seen = set()
+            for static_name in self.tag_service.get_items_for_tag(tag_name):
+                norm_item = self.normalize_item_id(static_name)
+                if norm_item not in seen:
+                    seen.add(norm_item)
+                    expansion.append(norm_item)
+            expansion.sort()
+
+        self._tag_expansion_cache[tag_name] = expansion
+        return expansion
+
     def _parse_recipe(self, row: dict[str, Any]) -> Recipe:
         """
         Parses a recipe row into a Recipe object, handling both specific and generic inputs.
@@ -174,11 +205,9 @@ class RecipeService:
         for i in row.get("Inputs", []):
             item_name = str(i.get("Element", {}).get("RowName", ""))
             if item_name and item_name != "None":
-                norm_item = self.item_index_service.get_normalized_id("D_ItemsStatic", item_name)
-                if not norm_item:
-                    norm_item = self.item_index_service._normalize_id(item_name)
+                norm_item = self.normalize_item_id(item_name)
                 
-                source_ids = self.item_index_service.norm_to_source.get(norm_item, {}).copy()
+                source_ids = self.item_index_service.norm_to_source.get(norm_item)
                 if not source_ids:
                     source_ids = {"Unknown": item_name}
                     
@@ -205,18 +234,17 @@ class RecipeService:
                     item=None,
                     count=int(qi.get("Count", 1)),
                     tag=tag_name,
-                    is_generic=True
+                    is_generic=True,
+                    satisfied_by=list(self.expand_tag(tag_name))
                 ))
         
         outputs = []
         for o in row.get("Outputs", []):
             item_name = str(o.get("Element", {}).get("RowName", ""))
             if item_name and item_name != "None":
-                norm_item = self.item_index_service.get_normalized_id("D_ItemsStatic", item_name)
-                if not norm_item:
-                    norm_item = self.item_index_service._normalize_id(item_name)
+                norm_item = self.normalize_item_id(item_name)
                     
-                source_ids = self.item_index_service.norm_to_source.get(norm_item, {}).copy()
+                source_ids = self.item_index_service.norm_to_source.get(norm_item)
                 if not source_ids:
                     source_ids = {"Unknown": item_name}
                     
@@ -230,10 +258,24 @@ class RecipeService:
         return Recipe(
             id=str(row.get("Name")),
             benches=benches,
+            bench_ids=list(benches),
             inputs=inputs,
             outputs=outputs,
             requirement=str(row.get("Requirement", {}).get("RowName")),
-            character_req=row.get("CharacterRequirement"),
-            session_req=row.get("SessionRequirement"),
+            character_req=_requirement_name(row.get("CharacterRequirement")),
+            session_req=_requirement_name(row.get("SessionRequirement")),
             energy_cost=float(row.get("RequiredMillijoules", 0.0))
         )
+
+def _requirement_name(value: Any) -> Optional[str]:
+    """
+    Reduces a character or session requirement to the string every output
+    stores: a row handle becomes its RowName (None for "None"), a string is
+    kept and any other value is JSON-encoded.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, dict) and "RowName" in value:
+        name = str(value["RowName"])
+        return None if name == "None" else name
+    return json.dumps(value, sort_keys=True)
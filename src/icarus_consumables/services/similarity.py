@@ -0,0 +1,77 @@
+from typing import Any, Optional
+from icarus_consumables.services.stat_matrix import StatMatrix, _numpy
+
+class SimilarityIndex:
+    """
+    Finds items with similar stats and buffs. Every StatMatrix column is
+    scaled by its largest absolute value (so hunger points and regen
+    percentages weigh alike) and every row is L2-normalized, making cosine
+    similarity a plain dot product. Neighbours for all items are computed
+    with one matrix product per batch of rows instead of pairwise loops.
+
+    Example:
+        >>> index = SimilarityIndex(StatMatrix.from_items(items))
+        >>> index.similar_to("Stew", k=3, lower_tier_only=True)
+    """
+
+    def __init__(self, matrix: StatMatrix, batch_size: int = 512):
+        """
+        Precomputes the normalized item vectors.
+        """
+        np = _numpy()
+        self.matrix = matrix
+        self.batch_size = batch_size
+
+        scale = np.abs(matrix.values).max(axis=0) if len(matrix.names) else np.zeros(len(matrix.stat_names))
+        scaled = np.divide(matrix.values, scale, out=np.zeros_like(matrix.values), where=scale > 0)
+        norms = np.linalg.norm(scaled, axis=1)
+        self.vectors = np.divide(scaled, norms[:, None], out=np.zeros_like(scaled), where=norms[:, None] > 0)
+        self.has_vector = norms > 0
+
+    def _top_k(self, rows: Any, k: int, lower_tier_only: bool) -> list[list[tuple[str, float]]]:
+        """
+        Returns the k most similar items for each row in a batch of row indices.
+        Items without stats, the item itself and (optionally) higher-tier items are excluded.
+        """
+        np = _numpy()
+        m = self.matrix
+        sims = self.vectors[rows] @ self.vectors.T
+        excluded = ~self.has_vector[None, :] | ~self.has_vector[rows][:, None]
+        excluded[np.arange(len(rows)), rows] = True
+        if lower_tier_only:
+            excluded |= m.tiers[None, :] > m.tiers[rows][:, None]
+        sims[excluded] = -np.inf
+
+        k = min(k, len(m.names) - 1)
+        if k <= 0:
+            return [[] for _ in rows]
+        best = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        results = []
+        for r, candidates in enumerate(best):
+            # Highest similarity first; ties by name for stable output
+            ordered = sorted(candidates, key=lambda c: (-sims[r, c], m.names[c]))
+            results.append([(m.names[c], round(float(sims[r, c]), 4)) for c in ordered if sims[r, c] > 0])
+        return results
+
+    def neighbours(self, k: int = 5, lower_tier_only: bool = False) -> dict[str, list[tuple[str, float]]]:
+        """
+        Returns item name -> up to k (similar item, cosine similarity) pairs for
+        every item, optionally limited to items of equal or lower total tier.
+        """
+        np = _numpy()
+        result: dict[str, list[tuple[str, float]]] = {}
+        for start in range(0, len(self.matrix.names), self.batch_size):
+            rows = np.arange(start, min(start + self.batch_size, len(self.matrix.names)))
+            for row, similar in zip(rows, self._top_k(rows, k, lower_tier_only)):
+                result[self.matrix.names[row]] = similar
+        return result
+
+    def similar_to(self, name: str, k: int = 5, lower_tier_only: bool = False) -> Optional[list[tuple[str, float]]]:
+        """
+        Returns up to k items most similar to one item, or None if the item is unknown.
+        """
+        np = _numpy()
+        row = self.matrix.row_of.get(name)
+        if row is None:
+            return None
+        return self._top_k(np.asarray([row]), k, lower_tier_only)[0]
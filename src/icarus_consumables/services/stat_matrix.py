@@ -0,0 +1,192 @@
+from pathlib import Path
+from typing import Any, Iterable, Optional
+from icarus_consumables.models.consumable import ConsumableData
+
+def _numpy() -> Any:
+    """
+    Imports NumPy on first use so the rest of the package works without it.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "StatMatrix requires NumPy. Install the optional analysis extra: uv sync --extra analysis"
+        ) from e
+    return numpy
+
+class StatMatrix:
+    """
+    Columnar view of the catalog for vectorized queries. Rows are items and
+    columns are stats: base recovery stats (e.g. "Food") plus modifier
+    effects keyed as in the JSON output (e.g. "BaseStaminaRegen%", scaled the
+    same way). Lifetimes, tiers and categories are parallel arrays, so
+    ranking, filtering and weighted scoring are single NumPy operations.
+
+    Example:
+        >>> matrix = StatMatrix.from_items(items)
+        >>> matrix.rank("BaseStaminaRegen%", top=5, per_second=True, mask=matrix.mask(categories=["Food"]))
+    """
+
+    def __init__(self, names: list[str], stat_names: list[str], values: Any, lifetimes: Any, tiers: Any, categories: Any):
+        """
+        Wraps prebuilt arrays; use from_items or load to construct.
+        """
+        self.names = list(names)
+        self.stat_names = list(stat_names)
+        self.values = values          # float64, shape (items, stats)
+        self.lifetimes = lifetimes    # float64 seconds, longest modifier per item (0 if none)
+        self.tiers = tiers            # float64 total tier
+        self.categories = categories  # str array
+        self.stat_columns = {name: col for col, name in enumerate(self.stat_names)}
+        self.row_of = {name: row for row, name in enumerate(self.names)}
+
+    @classmethod
+    def from_items(cls, items: Iterable[ConsumableData], include_hidden: bool = False) -> "StatMatrix":
+        """
+        Builds the matrix from parsed items. Effects of the same stat from
+        several modifiers on one item are summed; booleans become 1.0.
+        """
+        np = _numpy()
+        rows: list[dict[str, float]] = []
+        names, lifetimes, tiers, categories = [], [], [], []
+        stat_names: dict[str, None] = {}
+
+        for item in items:
+            if not (include_hidden or item.is_visible):
+                continue
+            row = dict(item.base_stats)
+            lifetime = 0
+            for modifier in item.modifiers:
+                if modifier is None:
+                    continue
+                lifetime = max(lifetime, modifier.lifetime or 0)
+                for effect in modifier.effects:
+                    key, value = effect.to_json_pair()
+                    row[key] = row.get(key, 0.0) + float(value)
+            stat_names.update(dict.fromkeys(row))
+            rows.append(row)
+            names.append(item.name)
+            lifetimes.append(lifetime)
+            tiers.append(item.tier_info.total_tier)
+            categories.append(item.category)
+
+        columns = sorted(stat_names)
+        column_of = {name: col for col, name in enumerate(columns)}
+        values = np.zeros((len(rows), len(columns)), dtype=np.float64)
+        for r, row in enumerate(rows):
+            for key, value in row.items():
+                values[r, column_of[key]] = value
+
+        return cls(
+            names, columns, values,
+            np.asarray(lifetimes, dtype=np.float64),
+            np.asarray(tiers, dtype=np.float64),
+            np.asarray(categories, dtype=str)
+        )
+
+    def column(self, stat: str) -> Any:
+        """
+        Returns one stat as a vector over all items (zeros if the stat is unknown).
+        """
+        np = _numpy()
+        col = self.stat_columns.get(stat)
+        return self.values[:, col] if col is not None else np.zeros(len(self.names))
+
+    def mask(
+        self,
+        categories: Optional[Iterable[str]] = None,
+        min_tier: Optional[float] = None,
+        max_tier: Optional[float] = None,
+        has_stats: Iterable[str] = ()
+    ) -> Any:
+        """
+        Returns a boolean row mask combining category, tier range and non-zero stat filters.
+        """
+        np = _numpy()
+        result = np.ones(len(self.names), dtype=bool)
+        if categories:
+            result &= np.isin(self.categories, list(categories))
+        if min_tier is not None:
+            result &= self.tiers >= min_tier
+        if max_tier is not None:
+            result &= self.tiers <= max_tier
+        for stat in has_stats:
+            result &= self.column(stat) != 0
+        return result
+
+    def weight_vector(self, weights: dict[str, float]) -> Any:
+        """
+        Converts {stat: weight} into a vector aligned with the stat columns; unknown stats are ignored.
+        """
+        np = _numpy()
+        vector = np.zeros(len(self.stat_names))
+        for stat, weight in weights.items():
+            col = self.stat_columns.get(stat)
+            if col is not None:
+                vector[col] = weight
+        return vector
+
+    def score(self, weights: dict[str, float], per_second: bool = False) -> Any:
+        """
+        Returns the weighted sum of stats for every item, optionally divided by
+        buff lifetime (items without a timed buff score 0 per second).
+        """
+        np = _numpy()
+        scores = self.values @ self.weight_vector(weights)
+        if per_second:
+            scores = np.divide(scores, self.lifetimes, out=np.zeros_like(scores), where=self.lifetimes > 0)
+        return scores
+
+    def top(self, weights: dict[str, float], k: int = 5, per_second: bool = False, mask: Any = None) -> list[tuple[str, float]]:
+        """
+        Returns the k best (name, score) pairs by weighted score among the masked rows.
+        """
+        np = _numpy()
+        scores = self.score(weights, per_second)
+        candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(self.names))
+        if not len(candidates) or k <= 0:
+            return []
+        k = min(k, len(candidates))
+        subset = scores[candidates]
+        best = np.argpartition(-subset, k - 1)[:k]
+        best = best[np.argsort(-subset[best], kind="stable")]
+        return [(self.names[candidates[i]], float(subset[i])) for i in best]
+
+    def rank(self, stat: str, top: int = 5, per_second: bool = False, mask: Any = None) -> list[tuple[str, float]]:
+        """
+        Returns the top items by a single stat.
+        """
+        return self.top({stat: 1.0}, top, per_second, mask)
+
+    def save(self, filepath: Path):
+        """
+        Saves all arrays to a compressed .npz file.
+        """
+        np = _numpy()
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            filepath,
+            names=np.asarray(self.names, dtype=str),
+            stat_names=np.asarray(self.stat_names, dtype=str),
+            values=self.values,
+            lifetimes=self.lifetimes,
+            tiers=self.tiers,
+            categories=self.categories
+        )
+
+    @classmethod
+    def load(cls, filepath: Path) -> "StatMatrix":
+        """
+        Loads a matrix saved with save().
+        """
+        np = _numpy()
+        with np.load(Path(filepath), allow_pickle=False) as data:
+            return cls(
+                data["names"].tolist(),
+                data["stat_names"].tolist(),
+                data["values"],
+                data["lifetimes"],
+                data["tiers"],
+                data["categories"]
+            )
@@ -1,20 +1,73 @@
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 import re
 
+# Expression types from Unreal's FGameplayTagQuery token stream (EGameplayTagQueryExprType)
+QUERY_EXPR_TYPES = {
+    1: "ANY",
+    2: "ALL",
+    3: "NONE",
+    4: "ANY_EXPR",
+    5: "ALL_EXPR",
+    6: "NONE_EXPR"
+}
+
 class IcarusTagService:
     """
-    Resolves generic crafting tags (e.g., Any_Vegetable) to their 
+    Resolves generic crafting tags (e.g., Any_Vegetable) to their
     localized names and provides mapping to items that satisfy them.
+
+    D_TagQueries rows are compiled once into predicate trees (ANY/ALL/NONE)
+    and evaluated against a per-tag bitmap of D_ItemsStatic rows, so resolving
+    a crafting tag to its satisfying items is a handful of integer bitwise
+    operations rather than a scan over every item.
     """
 
-    def __init__(self, crafting_tags: List[Dict[str, Any]], tag_queries: List[Dict[str, Any]]):
+    def __init__(self, crafting_tags: List[Dict[str, Any]], tag_queries: List[Dict[str, Any]], items_static: Optional[List[Dict[str, Any]]] = None):
         """
         Initializes the tag service with data from D_CraftingTags and D_TagQueries.
+        When D_ItemsStatic rows are supplied, the per-item tag bitmap is built as well.
         """
         self.tags = {str(row["Name"]): row for row in crafting_tags}
         self.queries = {str(row["Name"]): row for row in tag_queries}
         self.loc_pattern = re.compile(r'NSLOCTEXT\(".*?",\s*".*?",\s*"(.*?)"\)')
 
+        # Bit i of a mask corresponds to self.item_names[i]
+        self.item_names: List[str] = []
+        self.tag_masks: Dict[str, int] = {}
+        self.universe_mask = 0
+        self._compiled: Dict[str, Tuple[str, tuple]] = {}
+        self._resolved: Dict[str, int] = {}
+        if items_static:
+            self._build_item_bitmap(items_static)
+
+    def _build_item_bitmap(self, items_static: List[Dict[str, Any]]):
+        """
+        Builds the inverted bitmap: GameplayTag -> bitmask of items carrying it.
+        Parent tags are included so hierarchical matches (Item.Plant matches
+        Item.Plant.Vegetable) behave like Unreal's container queries.
+        """
+        masks: Dict[str, int] = {}
+        for index, row in enumerate(items_static):
+            self.item_names.append(str(row.get("Name")))
+            bit = 1 << index
+
+            tags = [t.get("TagName", "") for t in row.get("Manual_Tags", {}).get("GameplayTags", [])] + \
+                   [t.get("TagName", "") for t in row.get("Generated_Tags", {}).get("GameplayTags", [])]
+
+            expanded = set()
+            for tag in tags:
+                if not tag:
+                    continue
+                parts = tag.split(".")
+                for depth in range(1, len(parts) + 1):
+                    expanded.add(".".join(parts[:depth]))
+
+            for tag in expanded:
+                masks[tag] = masks.get(tag, 0) | bit
+
+        self.tag_masks = masks
+        self.universe_mask = (1 << len(self.item_names)) - 1
+
     def get_tag_display_name(self, tag_name: str) -> str:
         """
         Translates a generic tag name (Any_Vegetable) to its display name (Vegetable).
@@ -48,3 +101,115 @@ class IcarusTagService:
         # Most generic food tags use a simple ANY or ALL query with a single tag
         tag_dict = query.get("Query", {}).get("TagDictionary", [])
         return [str(t.get("TagName")) for t in tag_dict]
+
+    def compile_query(self, query_name: str) -> Optional[Tuple[str, tuple]]:
+        """
+        Compiles a D_TagQueries row into a predicate tree of (op, operands) tuples.
+        Tag expressions carry tag names; *_EXPR expressions carry sub-trees.
+        """
+        if query_name in self._compiled:
+            return self._compiled[query_name]
+
+        query = self.queries.get(query_name)
+        if not query:
+            return None
+
+        query_data = query.get("Query", {})
+        tag_dict = [str(t.get("TagName")) for t in query_data.get("TagDictionary", [])]
+        stream = query_data.get("QueryTokenStream") or []
+
+        compiled = None
+        # Token stream layout: [version, has_root_expression, <expression>...]
+        if len(stream) > 2 and stream[1]:
+            try:
+                compiled, _ = self._compile_expression(stream, 2, tag_dict)
+            except (IndexError, KeyError, ValueError):
+                compiled = None
+
+        if compiled is None:
+            # Fall back to the auto description (" ALL( A, B )") or a plain ANY over the dictionary
+            description = str(query_data.get("AutoDescription", "")).strip().upper()
+            op = "ANY"
+            for candidate in ("ALL", "NONE"):
+                if description.startswith(candidate):
+                    op = candidate
+            compiled = (op, tuple(tag_dict))
+
+        self._compiled[query_name] = compiled
+        return compiled
+
+    def _compile_expression(self, stream: List[int], pos: int, tag_dict: List[str]) -> Tuple[Tuple[str, tuple], int]:
+        """
+        Recursively decodes one expression from the token stream, returning it
+        with the position of the next unread token.
+        """
+        op = QUERY_EXPR_TYPES[stream[pos]]
+        count = stream[pos + 1]
+        pos += 2
+
+        if not op.endswith("_EXPR"):
+            tags = tuple(tag_dict[i] for i in stream[pos:pos + count])
+            if len(tags) != count:
+                raise ValueError("Truncated tag expression")
+            return (op, tags), pos + count
+
+        children = []
+        for _ in range(count):
+            child, pos = self._compile_expression(stream, pos, tag_dict)
+            children.append(child)
+        return (op, tuple(children)), pos
+
+    def _evaluate(self, node: Tuple[str, tuple]) -> int:
+        """
+        Evaluates a compiled predicate tree to a bitmask over all items at once.
+        """
+        op, operands = node
+        if op.endswith("_EXPR"):
+            masks = [self._evaluate(child) for child in operands]
+        else:
+            masks = [self.tag_masks.get(tag, 0) for tag in operands]
+
+        if op in ("ANY", "ANY_EXPR"):
+            result = 0
+            for mask in masks:
+                result |= mask
+            return result
+        if op in ("ALL", "ALL_EXPR"):
+            result = self.universe_mask
+            for mask in masks:
+                result &= mask
+            return result
+        # NONE / NONE_EXPR
+        combined = 0
+        for mask in masks:
+            combined |= mask
+        return self.universe_mask & ~combined
+
+    def resolve_tag_mask(self, tag_name: str) -> int:
+        """
+        Resolves a crafting tag (or a query name used directly) to the bitmask
+        of satisfying items. Results are memoized per tag.
+        """
+        if tag_name in self._resolved:
+            return self._resolved[tag_name]
+
+        query_name = self.get_query_for_tag(tag_name)
+        if not query_name or query_name == "None":
+            query_name = tag_name
+
+        compiled = self.compile_query(query_name)
+        mask = self._evaluate(compiled) if compiled else 0
+        self._resolved[tag_name] = mask
+        return mask
+
+    def get_items_for_tag(self, tag_name: str) -> List[str]:
+        """
+        Returns the D_ItemsStatic names satisfying a generic crafting tag, in data order.
+        """
+        mask = self.resolve_tag_mask(tag_name)
+        names = []
+        while mask:
+            low_bit = mask & -mask
+            names.append(self.item_names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return names
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Any, Optional, Set
 from collections import deque
 from icarus_consumables.models.tier import TierInfo
@@ -18,6 +19,15 @@ class IcarusTierMapper:
         "Fabricator": 4
     }
 
+    # Gameplay tag prefixes marking gathered (Tier 0) items
+    HARVEST_PREFIXES = [
+        "Item.Creature.Loot",       # Meats, Skins, etc.
+        "Item.Plant",               # Fruits, Vegetables
+        "NPC.Fish",                 # Catchable fish
+        "Item.Consumable.Food.Raw", # Raw gathering items
+        "Item.Consumable.Food.Berry"# Specific harvestable
+    ]
+
     def __init__(
         self, 
         static_item_dict: Any, 
@@ -127,9 +137,29 @@ class IcarusTierMapper:
                 mapping[item_name] = talent_name
         return mapping
 
-    def calculate_tier(self, item_name: str, recipe_row: Optional[dict[str, Any]]) -> TierInfo:
+    def is_harvest_item(self, static_id: str) -> bool:
         """
-        Determines the TierInfo for a given item and its recipe.
+        Returns True if the D_ItemsStatic row carries a gathering/harvest gameplay tag.
+        """
+        item_raw = self.item_index.get(static_id) or self.item_index.get(f"Item_{static_id}")
+        if not item_raw:
+            return False
+
+        tags = [t.get("TagName", "") for t in item_raw.get("Manual_Tags", {}).get("GameplayTags", [])] + \
+               [t.get("TagName", "") for t in item_raw.get("Generated_Tags", {}).get("GameplayTags", [])]
+        return any(any(t.startswith(prefix) for prefix in self.HARVEST_PREFIXES) for t in tags)
+
+    def is_orbital(self, item_name: str) -> bool:
+        """
+        Returns True if the item is purchased from orbit (Workshop items and their byproducts).
+        """
+        return item_name in self.orbital_items or f"Item_{item_name}" in self.orbital_items
+
+    def get_fixed_tier(self, item_name: str, has_recipe: bool) -> Optional[TierInfo]:
+        """
+        Returns the TierInfo for items whose tier does not depend on a recipe
+        (harvested, orbital without recipes, or never crafted), or None if the
+        tier must be derived from the item's recipes.
         """
         # Systematic Harvest Detection via Tags
         is_harvested = False
@@ -140,34 +170,20 @@ class IcarusTierMapper:
         if not static_id:
             static_id = item_name # Fallback for raw items like Carrot
             
-        item_raw = self.item_index.get(static_id) or self.item_index.get(f"Item_{static_id}")
-        
-        if item_raw:
-            tags = [t.get("TagName", "") for t in item_raw.get("Manual_Tags", {}).get("GameplayTags", [])] + \
-                   [t.get("TagName", "") for t in item_raw.get("Generated_Tags", {}).get("GameplayTags", [])]
-            
-            harvest_prefixes = [
-                "Item.Creature.Loot",       # Meats, Skins, etc.
-                "Item.Plant",               # Fruits, Vegetables
-                "NPC.Fish",                 # Catchable fish
-                "Item.Consumable.Food.Raw", # Raw gathering items
-                "Item.Consumable.Food.Berry"# Specific harvestable
-            ]
-            
-            if any(any(t.startswith(prefix) for prefix in harvest_prefixes) for t in tags):
-                is_harvested = True
+        if self.is_harvest_item(static_id):
+            is_harvested = True
                 
         # Orbital items are never "harvested" even if they have Item.Plant tags (Seeds)
-        if item_name in self.orbital_items or f"Item_{item_name}" in self.orbital_items:
+        if self.is_orbital(item_name):
             is_harvested = False
 
         # Tier 0 check: If item is definitely harvested (via tags) or never an output
         is_recipe_output = item_name in self.recipe_service.recipe_map or \
                            f"Item_{item_name}" in self.recipe_service.recipe_map
 
-        if is_harvested or (not is_recipe_output and not recipe_row):
+        if is_harvested or (not is_recipe_output and not has_recipe):
             # Orbital items are never "harvested" even if they have no standard recipes
-            is_truly_orbital = item_name in self.orbital_items or f"Item_{item_name}" in self.orbital_items
+            is_truly_orbital = self.is_orbital(item_name)
             is_truly_harvested = is_harvested and not is_truly_orbital
             
             if is_truly_orbital:
@@ -175,9 +191,16 @@ class IcarusTierMapper:
                 
             return TierInfo(0, 0.0, 0.0, "None", is_truly_harvested, False)
 
-        if not recipe_row:
+        if not has_recipe:
             return TierInfo(0, 0.0, 0.0, "None", True, False)
 
+        return None
+
+    def calculate_recipe_tier(self, recipe_row: dict[str, Any]) -> TierInfo:
+        """
+        Scores a single recipe from its lowest bench anchor and talent depth,
+        independent of the item it produces.
+        """
         # 2. Find the lowest bench anchor
         benches = recipe_row.get("RecipeSets", [])
         best_anchor_tier = 5
@@ -198,9 +221,20 @@ class IcarusTierMapper:
             dist = self._get_talent_distance(best_anchor, talent_name)
             offset = min(dist * 0.1, 0.9)
 
-        total_tier = best_anchor_tier + offset
-        is_truly_orbital = item_name in self.orbital_items or f"Item_{item_name}" in self.orbital_items
-        return TierInfo(best_anchor_tier, offset, total_tier if not is_truly_orbital else 10.0, best_anchor, False, is_truly_orbital)
+        return TierInfo(best_anchor_tier, offset, best_anchor_tier + offset, best_anchor, False, False)
+
+    def calculate_tier(self, item_name: str, recipe_row: Optional[dict[str, Any]]) -> TierInfo:
+        """
+        Determines the TierInfo for a given item and its recipe.
+        """
+        fixed_tier = self.get_fixed_tier(item_name, bool(recipe_row))
+        if fixed_tier:
+            return fixed_tier
+
+        tier_info = self.calculate_recipe_tier(recipe_row)
+        if self.is_orbital(item_name):
+            tier_info = replace(tier_info, total_tier=10.0, is_orbital=True)
+        return tier_info
 
     def _resolve_bench_anchor(self, bench_name: str) -> str:
         """
@@ -0,0 +1,138 @@
+from dataclasses import replace
+from typing import Any, Optional
+from icarus_consumables.models.tier import TierInfo
+
+HARVESTED_TIER = TierInfo(0, 0.0, 0.0, "None", True, False)
+
+class TierPropagationService:
+    """
+    Batch tier engine over the recipe graph. Every item is visited once in
+    topological order, so by the time an item is scored its ingredients
+    already have their effective tiers. A recipe's effective tier is its own
+    bench/talent tier raised to the highest tier among its ingredients, and an
+    item takes the lowest effective tier among the recipes producing it.
+    """
+
+    def __init__(self, recipe_graph: Any, tier_mapper: Any, item_index_service: Any):
+        """
+        Initializes the engine and propagates tiers across the whole graph.
+        """
+        self.recipe_graph = recipe_graph
+        self.tier_mapper = tier_mapper
+        self.item_index_service = item_index_service
+        self.recipe_tiers: dict[str, TierInfo] = {}
+        self.item_tiers: dict[str, TierInfo] = {}
+        self.effective_recipe_tiers: dict[str, TierInfo] = {}
+        self.propagate()
+
+    def propagate(self) -> dict[str, TierInfo]:
+        """
+        Computes the effective tier of every graph item, component by component.
+        Inside a recipe cycle, inputs that are not resolved yet are ignored.
+        """
+        self.item_tiers = {}
+        self.effective_recipe_tiers = {}
+        for component in self.recipe_graph.components:
+            pending = list(component)
+            while pending:
+                unresolved = []
+                for item in pending:
+                    tier_info = self._resolve_item(item, allow_partial=False)
+                    if tier_info:
+                        self.item_tiers[item] = tier_info
+                    else:
+                        unresolved.append(item)
+                if len(unresolved) == len(pending):
+                    for item in unresolved:
+                        self.item_tiers[item] = self._resolve_item(item, allow_partial=True) or HARVESTED_TIER
+                    break
+                pending = unresolved
+        return self.item_tiers
+
+    def _resolve_item(self, item: str, allow_partial: bool) -> Optional[TierInfo]:
+        """
+        Returns the lowest effective tier among the item's producing recipes.
+        Raw (harvested or unproducible) items sit at Tier 0.
+        """
+        producers = self.recipe_graph.get_producers(item)
+        static_id = self.item_index_service.get_source_id("D_ItemsStatic", item) or item
+        if not producers or self.tier_mapper.is_harvest_item(static_id):
+            return HARVESTED_TIER
+
+        best = None
+        for recipe_id in producers:
+            tier_info = self._effective_recipe_tier(recipe_id, allow_partial)
+            if tier_info and (not best or tier_info.total_tier < best.total_tier):
+                best = tier_info
+        return best
+
+    def _effective_recipe_tier(self, recipe_id: str, allow_partial: bool = True) -> Optional[TierInfo]:
+        """
+        Returns the recipe's own tier raised to its highest-tier ingredient.
+        Generic inputs contribute their lowest-tier satisfying item. Returns
+        None when an ingredient is unresolved and partial results are not allowed.
+        """
+        if recipe_id in self.effective_recipe_tiers:
+            return self.effective_recipe_tiers[recipe_id]
+
+        floor: Optional[TierInfo] = None
+        complete = True
+        for name, _ in self.recipe_graph.recipe_inputs[recipe_id]:
+            ingredient_tier = self.item_tiers.get(name)
+            if ingredient_tier is None:
+                complete = False
+            elif not floor or ingredient_tier.total_tier > floor.total_tier:
+                floor = ingredient_tier
+
+        for _, _, candidates in self.recipe_graph.recipe_generic_inputs[recipe_id]:
+            options = [self.item_tiers[c] for c in candidates if c in self.item_tiers]
+            if candidates and not options:
+                complete = False
+            elif options:
+                cheapest = min(options, key=lambda t: t.total_tier)
+                if not floor or cheapest.total_tier > floor.total_tier:
+                    floor = cheapest
+
+        if not complete and not allow_partial:
+            return None
+
+        tier_info = self.get_recipe_tier(recipe_id)
+        if floor and not floor.is_orbital and floor.total_tier > tier_info.total_tier:
+            # The item sits at its hardest ingredient's position in the tech tree
+            tier_info = TierInfo(floor.base_tier, floor.fractional_offset, floor.total_tier, floor.anchor_bench, False, False)
+
+        if complete:
+            self.effective_recipe_tiers[recipe_id] = tier_info
+        return tier_info
+
+    def get_recipe_tier(self, recipe_id: str) -> TierInfo:
+        """
+        Returns the memoized bench/talent tier of a recipe on its own.
+        """
+        if recipe_id not in self.recipe_tiers:
+            self.recipe_tiers[recipe_id] = self.tier_mapper.calculate_recipe_tier(self.recipe_graph.recipes[recipe_id])
+        return self.recipe_tiers[recipe_id]
+
+    def get_item_tier(self, item_name: str, recipe_rows: list[dict[str, Any]]) -> TierInfo:
+        """
+        Resolves the TierInfo for a parsed item from its matched recipe rows,
+        using the precomputed effective recipe tiers. TierInfo is frozen, so
+        the precomputed instance is shared rather than copied.
+        """
+        fixed_tier = self.tier_mapper.get_fixed_tier(item_name, bool(recipe_rows))
+        if fixed_tier:
+            return fixed_tier
+
+        best = None
+        for row in recipe_rows:
+            recipe_id = str(row.get("Name", ""))
+            if recipe_id in self.recipe_graph.recipes:
+                tier_info = self._effective_recipe_tier(recipe_id)
+            else:
+                tier_info = self.tier_mapper.calculate_recipe_tier(row)
+            if not best or tier_info.total_tier < best.total_tier:
+                best = tier_info
+
+        if self.tier_mapper.is_orbital(item_name):
+            return replace(best, total_tier=10.0, is_orbital=True)
+        return best
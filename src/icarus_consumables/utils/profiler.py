@@ -0,0 +1,360 @@
+import cProfile
+import json
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+class _StageTimer:
+    """
+    Context manager recording one timed span. Kept as a plain class rather
+    than a generator-based context manager to keep per-stage overhead low.
+    """
+    __slots__ = ("profiler", "name", "category", "start_ns", "depth", "cprofile")
+
+    def __init__(self, profiler: "PipelineProfiler", name: str, category: str):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.start_ns = 0
+        self.depth = 0
+        self.cprofile: Optional[cProfile.Profile] = None
+
+    def __enter__(self) -> "_StageTimer":
+        self.depth = self.profiler._enter()
+        # Only one cProfile can be active at a time, so capture top-level stages only
+        if self.profiler.cprofile and self.depth == 0:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_ns = time.perf_counter_ns()
+        if self.cprofile:
+            self.cprofile.disable()
+            self.profiler.cprofile_stats[self.name] = self.cprofile
+        self.profiler._exit()
+        self.profiler.events.append({
+            "name": self.name,
+            "cat": self.category,
+            "start_ns": self.start_ns,
+            "duration_ns": end_ns - self.start_ns,
+            "depth": self.depth,
+            "tid": threading.get_ident()
+        })
+        return False
+
+class _NullStage:
+    """
+    Shared no-op context manager returned when profiling is disabled.
+    """
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class _DepthScope:
+    """
+    Context manager placing the current thread's spans at a fixed nesting
+    depth, so work handed to a pool thread nests under the stage that
+    submitted it instead of starting a new top-level span.
+    """
+    __slots__ = ("profiler", "depth", "previous")
+
+    def __init__(self, profiler: "PipelineProfiler", depth: int):
+        self.profiler = profiler
+        self.depth = depth
+        self.previous = 0
+
+    def __enter__(self) -> "_DepthScope":
+        self.previous = self.profiler.current_depth()
+        self.profiler._local.depth = self.depth
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.profiler._local.depth = self.previous
+        return False
+
+class PipelineProfiler:
+    """
+    Records wall-clock spans for pipeline stages and service constructors.
+    Produces a printed breakdown table, a Chrome trace-event JSON file
+    (viewable in chrome://tracing or Perfetto) and, optionally, one cProfile
+    dump per top-level stage. When disabled every call is a no-op.
+    """
+
+    def __init__(self, enabled: bool = False, cprofile: bool = False):
+        """
+        Initializes the profiler. cProfile capture only applies when enabled.
+        """
+        self.enabled = enabled
+        self.cprofile = enabled and cprofile
+        self.events: list[dict[str, Any]] = []
+        self.cprofile_stats: dict[str, cProfile.Profile] = {}
+        self.origin_ns = time.perf_counter_ns()
+        self._local = threading.local()
+
+    def _enter(self) -> int:
+        """Increments and returns the nesting depth of the current thread."""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        return depth
+
+    def _exit(self):
+        """Decrements the nesting depth of the current thread."""
+        self._local.depth = getattr(self._local, "depth", 1) - 1
+
+    def current_depth(self) -> int:
+        """Returns the nesting depth of the current thread (0 outside any span)."""
+        return getattr(self._local, "depth", 0)
+
+    def at_depth(self, depth: int) -> Any:
+        """
+        Returns a context manager under which the current thread's spans start
+        at depth. Worker threads use the depth captured in the submitting
+        thread, so their spans nest under (and are not counted beside) its stage.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _DepthScope(self, depth)
+
+    def stage(self, name: str, category: str = "stage") -> Any:
+        """
+        Returns a context manager timing the enclosed block as a named span.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _StageTimer(self, name, category)
+
+    def measure(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls func (typically a service constructor) inside a timed span and returns its result.
+        """
+        with self.stage(name, "service"):
+            return func(*args, **kwargs)
+
+    def get_breakdown(self) -> list[tuple[str, str, int, float]]:
+        """
+        Returns (name, category, depth, milliseconds) rows in start order.
+        """
+        ordered = sorted(self.events, key=lambda e: (e["start_ns"], e["depth"]))
+        return [(e["name"], e["cat"], e["depth"], e["duration_ns"] / 1e6) for e in ordered]
+
+    def print_report(self):
+        """
+        Prints a breakdown table; nested spans are indented under their stage.
+        """
+        if not self.events:
+            return
+
+        rows = self.get_breakdown()
+        total_ms = sum(ms for _, _, depth, ms in rows if depth == 0) or 1.0
+        width = max(len("  " * depth + name) for name, _, depth, _ in rows)
+        width = max(width, len("Stage"))
+
+        print("⏱  Pipeline profile:")
+        print(f"   {'Stage'.ljust(width)}  {'ms':>10}  {'share':>6}")
+        print(f"   {'-' * width}  {'-' * 10}  {'-' * 6}")
+        for name, _, depth, ms in rows:
+            label = ("  " * depth + name).ljust(width)
+            share = f"{ms / total_ms * 100:5.1f}%" if depth == 0 else ""
+            print(f"   {label}  {ms:10.2f}  {share:>6}")
+        print(f"   {'Total'.ljust(width)}  {total_ms:10.2f}")
+
+    def write_chrome_trace(self, filepath: Path):
+        """
+        Writes all spans as complete ("X") trace events in microseconds.
+        """
+        trace_events = []
+        for e in self.events:
+            trace_events.append({
+                "name": e["name"],
+                "cat": e["cat"],
+                "ph": "X",
+                "ts": (e["start_ns"] - self.origin_ns) / 1000.0,
+                "dur": e["duration_ns"] / 1000.0,
+                "pid": 1,
+                "tid": e["tid"]
+            })
+
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f, indent=1)
+
+    def write_cprofile_stats(self, directory: Path) -> list[Path]:
+        """
+        Dumps one .prof file per captured stage (load with pstats or snakeviz).
+        """
+        written = []
+        if not self.cprofile_stats:
+            return written
+
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, profile in self.cprofile_stats.items():
+            safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', name)
+            path = directory / f"{safe_name}.prof"
+            profile.dump_stats(str(path))
+            written.append(path)
+        return written
+
+    def write_reports(self, directory: Path):
+        """
+        Prints the breakdown and writes the trace (and cProfile dumps) to the given directory.
+        """
+        if not self.enabled:
+            return
+
+        self.print_report()
+        trace_path = directory / "pipeline_trace.json"
+        self.write_chrome_trace(trace_path)
+        print(f"   Trace written to {trace_path}")
+        for path in self.write_cprofile_stats(directory):
+            print(f"   cProfile stats written to {path}")
+
+class _MemoryStage:
+    """
+    Context manager recording Python heap usage and top allocation sites for one stage.
+    """
+    __slots__ = ("profiler", "name")
+
+    def __init__(self, profiler: "MemoryProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_MemoryStage":
+        tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.profiler.checkpoint(self.name)
+        return False
+
+class MemoryProfiler:
+    """
+    Tracks memory across pipeline stages with tracemalloc. After each stage it
+    records the retained heap, the peak reached during the stage, the process
+    peak RSS and the allocation sites that grew the most since the previous
+    checkpoint. When disabled every call is a no-op.
+    """
+
+    def __init__(self, enabled: bool = False, top_sites: int = 5):
+        """
+        Initializes the profiler and starts tracemalloc when enabled.
+        """
+        self.enabled = enabled
+        self.top_sites = top_sites
+        self.records: list[dict[str, Any]] = []
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        if enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._previous = self._snapshot()
+
+    def stage(self, name: str) -> Any:
+        """
+        Returns a context manager measuring the enclosed block as a named stage.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _MemoryStage(self, name)
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        """Takes a snapshot excluding tracemalloc's and the import system's own frames."""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+    def checkpoint(self, name: str):
+        """
+        Records current/peak heap, peak RSS and the top allocation sites for a stage.
+        """
+        if not self.enabled:
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = self._snapshot()
+        sites = []
+        for stat in snapshot.compare_to(self._previous, "lineno")[:self.top_sites]:
+            frame = stat.traceback[0]
+            sites.append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff
+            })
+        self._previous = snapshot
+
+        self.records.append({
+            "stage": name,
+            "current_bytes": current,
+            "peak_bytes": peak,
+            "max_rss_bytes": _max_rss_bytes(),
+            "top_sites": sites
+        })
+
+    def print_report(self):
+        """
+        Prints retained/peak memory per stage followed by each stage's top allocation sites.
+        """
+        if not self.records:
+            return
+
+        mb = 1024 * 1024
+        width = max(len("Stage"), max(len(r["stage"]) for r in self.records))
+        print("🧠 Memory profile:")
+        print(f"   {'Stage'.ljust(width)}  {'retained MB':>11}  {'peak MB':>9}  {'max RSS MB':>10}")
+        print(f"   {'-' * width}  {'-' * 11}  {'-' * 9}  {'-' * 10}")
+        for r in self.records:
+            rss = f"{r['max_rss_bytes'] / mb:10.1f}" if r["max_rss_bytes"] is not None else f"{'-':>10}"
+            print(f"   {r['stage'].ljust(width)}  {r['current_bytes'] / mb:11.2f}  {r['peak_bytes'] / mb:9.2f}  {rss}")
+
+        for r in self.records:
+            if not r["top_sites"]:
+                continue
+            print(f"   Top allocation sites after '{r['stage']}':")
+            for site in r["top_sites"]:
+                print(f"     {site['size_diff'] / 1024:+10.1f} KiB  {site['count_diff']:+8d} blocks  {site['site']}")
+
+    def write_report(self, filepath: Path):
+        """
+        Writes the per-stage records as JSON.
+        """
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump({"stages": self.records}, f, indent=4)
+
+    def write_reports(self, directory: Path):
+        """
+        Prints the report, writes memory_profile.json to the given directory and stops tracemalloc.
+        """
+        if not self.enabled:
+            return
+
+        self.print_report()
+        report_path = directory / "memory_profile.json"
+        self.write_report(report_path)
+        print(f"   Memory report written to {report_path}")
+        tracemalloc.stop()
+
+def _max_rss_bytes() -> Optional[int]:
+    """
+    Returns the process peak resident set size, or None where the resource module is unavailable.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
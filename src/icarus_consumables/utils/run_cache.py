@@ -0,0 +1,120 @@
+import hashlib
+import json
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+class RunCache:
+    """
+    Whole-run result cache. A fingerprint combines the content of every game
+    data table, the processing config, the stat metadata, every override file
+    and the parser version. Output artifacts are stored under
+    <cache_dir>/<fingerprint>/ so an unchanged run can restore them instead of
+    re-parsing.
+    """
+
+    MANIFEST = "manifest.json"
+
+    # Config keys that only affect how a run is executed, not what it produces
+    RUN_ONLY_KEYS = ("PROFILE_DIR", "RELEASE_RAW_TABLES", "RUN_CACHE", "CACHE_DIR", "CACHE_MAX_ENTRIES", "GENERATOR_WORKERS")
+
+    def __init__(self, cache_dir: Path, max_entries: int = 5):
+        """
+        Initializes the cache; older entries beyond max_entries are pruned on store.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+    def compute_fingerprint(
+        self,
+        data_files: Iterable[Path],
+        config: dict[str, Any],
+        extra_files: Iterable[Path] = (),
+        overrides_dir: Optional[Path] = None,
+        salt: str = ""
+    ) -> str:
+        """
+        Hashes the names and contents of all input files plus the output-affecting
+        config. Missing files hash as absent so creating them invalidates the cache.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(salt.encode("utf-8"))
+
+        relevant_config = {k: v for k, v in config.items() if k not in self.RUN_ONLY_KEYS}
+        digest.update(json.dumps(relevant_config, sort_keys=True).encode("utf-8"))
+
+        files = list(data_files) + list(extra_files)
+        if overrides_dir and Path(overrides_dir).exists():
+            files.extend(sorted(Path(overrides_dir).glob("*.json")))
+
+        for path in files:
+            path = Path(path)
+            digest.update(b"\0" + str(path.name).encode("utf-8") + b"\0")
+            if not path.exists():
+                digest.update(b"<missing>")
+                continue
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def restore(self, fingerprint: str) -> Optional[list[Path]]:
+        """
+        Copies the cached artifacts for a fingerprint back to their original
+        locations. Returns the restored paths, or None on a cache miss.
+        """
+        entry_dir = self.cache_dir / fingerprint
+        manifest_path = entry_dir / self.MANIFEST
+        if not manifest_path.exists():
+            return None
+
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        artifacts = manifest.get("artifacts", [])
+        if not all((entry_dir / a["stored"]).exists() for a in artifacts):
+            return None
+
+        restored = []
+        for artifact in artifacts:
+            target = Path(artifact["target"])
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry_dir / artifact["stored"], target)
+            restored.append(target)
+
+        # Touch the manifest so pruning keeps recently used entries
+        manifest_path.touch()
+        return restored
+
+    def store(self, fingerprint: str, artifact_paths: Iterable[Path]):
+        """
+        Copies the run's output artifacts into the cache under the fingerprint.
+        """
+        entry_dir = self.cache_dir / fingerprint
+        entry_dir.mkdir(parents=True, exist_ok=True)
+
+        artifacts = []
+        for index, path in enumerate(artifact_paths):
+            path = Path(path)
+            if not path.exists():
+                continue
+            stored = f"{index:02d}_{path.name}"
+            shutil.copyfile(path, entry_dir / stored)
+            artifacts.append({"target": str(path.resolve()), "stored": stored})
+
+        # Manifest last, so an interrupted store is never seen as a valid entry
+        with open(entry_dir / self.MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump({"created": time.time(), "artifacts": artifacts}, f, indent=4)
+
+        self._prune()
+
+    def _prune(self):
+        """
+        Deletes the least recently used entries beyond max_entries.
+        """
+        entries = [d for d in self.cache_dir.iterdir() if (d / self.MANIFEST).exists()]
+        entries.sort(key=lambda d: (d / self.MANIFEST).stat().st_mtime_ns, reverse=True)
+        for stale in entries[self.max_entries:]:
+            shutil.rmtree(stale, ignore_errors=True)
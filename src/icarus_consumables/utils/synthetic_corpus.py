@@ -0,0 +1,427 @@
+"""
+Synthetic, self-consistent Icarus game data for tests and benchmarks.
+
+The generated tables follow the row schemas that IcarusDataLoader.load_all_data
+returns and that the services read (names, RowName references, gameplay tags,
+NSLOCTEXT strings, stat keys and tag-query token streams), so the full pipeline
+runs against them unchanged. Counts scale linearly with the scale factor.
+
+Usage:
+    python -m icarus_consumables.utils.synthetic_corpus --scale 10 --out-dir benchmarks/corpus/10x
+"""
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any
+from icarus_consumables.services.data_loader import IcarusDataLoader
+
+# Base (1x) row counts, roughly the size of the real consumables catalog
+BASE_COUNTS = {
+    "crops": 40,
+    "meats": 20,
+    "fish": 12,
+    "materials": 60,
+    "foods": 220,
+    "drinks": 40,
+    "medicines": 60,
+    "orbital": 20,
+    "modifiers": 160,
+    "talents_per_anchor": 20,
+}
+
+ANCHORS = ["Character", "Crafting_Bench", "Machine_Bench", "Fabricator"]
+
+# Bench -> anchor talent it is unlocked under (None: implicitly unlocked)
+BENCHES = {
+    "Character": None,
+    "Campfire": None,
+    "Drying_Rack": None,
+    "Crafting_Bench": "Character",
+    "Cooking_Station": None,
+    "Mortar_And_Pestle": "Crafting_Bench",
+    "Machine_Bench": "Crafting_Bench",
+    "Kitchen_Stove": "Machine_Bench",
+    "Kitchen_Bench": "Machine_Bench",
+    "Fabricator": "Machine_Bench",
+    "Electric_Stove": "Fabricator",
+}
+
+BENCHES_BY_TIER = {
+    1: ["Character", "Campfire", "Drying_Rack"],
+    2: ["Cooking_Station", "Mortar_And_Pestle", "Crafting_Bench"],
+    3: ["Kitchen_Stove", "Kitchen_Bench", "Machine_Bench"],
+    4: ["Electric_Stove", "Fabricator"],
+}
+
+RAW_KINDS = {
+    "crops": ("Crop", ["Item.Plant.Vegetable", "Item.Plant.Fruit", "Item.Plant.Grain"]),
+    "meats": ("Meat", ["Item.Creature.Loot.Meat"]),
+    "fish": ("Fish", ["NPC.Fish"]),
+}
+
+TAG_QUERIES = {
+    "Any_Vegetable": ("ANY", ["Item.Plant.Vegetable"]),
+    "Any_Fruit": ("ANY", ["Item.Plant.Fruit"]),
+    "Any_Grain": ("ANY", ["Item.Plant.Grain"]),
+    "Any_Meat": ("ANY", ["Item.Creature.Loot.Meat"]),
+    "Any_Fish": ("ANY", ["NPC.Fish"]),
+    "Any_Plant": ("ANY", ["Item.Plant"]),
+    "Any_Raw_Food": ("ALL", ["Item.Consumable.Food.Raw", "Item.Plant"]),
+}
+
+QUERY_OPS = {"ANY": 1, "ALL": 2, "NONE": 3}
+
+MODIFIER_STATS = [
+    ("BaseMaximumStamina", "_+"),
+    ("BaseStaminaRegen", "_+%"),
+    ("BaseMaximumHealth", "_+"),
+    ("BaseHealthRegen", "_+%"),
+    ("BaseMovementSpeed", "_+%"),
+    ("BaseCarryWeight", "_+"),
+    ("BaseExperienceGained", "_+%"),
+    ("BaseMiningYield", "_+%"),
+    ("BaseCraftingSpeed", "_+%"),
+    ("BaseFoodConsumption", "_%"),
+    ("BaseWaterConsumption", "_%"),
+    ("BaseOxygenConsumption", "_%"),
+    ("BaseHeatResistance", "_+"),
+    ("BaseColdResistance", "_+"),
+    ("BaseImmuneToFoodPoisoning", "_?"),
+]
+
+def _ref(name: str) -> dict[str, str]:
+    """Builds a DataTable row handle."""
+    return {"RowName": name}
+
+def _loc(table: str, key: str, text: str) -> str:
+    """Builds an NSLOCTEXT localized string."""
+    return f'NSLOCTEXT("{table}", "{key}", "{text}")'
+
+def _tags(*tags: str) -> dict[str, list[dict[str, str]]]:
+    """Builds a gameplay tag container."""
+    return {"GameplayTags": [{"TagName": t} for t in tags]}
+
+def _scaled(key: str, scale: float) -> int:
+    """Returns the row count for a category at the given scale (at least 1)."""
+    return max(1, int(round(BASE_COUNTS[key] * scale)))
+
+class SyntheticCorpusBuilder:
+    """
+    Builds one synthetic dataset. Items are created in dependency order
+    (raw -> materials -> dishes), and recipes only reference earlier items,
+    apart from a few deliberate two-item cycles, so cross-references always resolve.
+    """
+
+    def __init__(self, scale: float = 1.0, seed: int = 0):
+        """
+        Initializes an empty corpus for the given scale factor and random seed.
+        """
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.tables: dict[str, list[dict[str, Any]]] = {key: [] for key in IcarusDataLoader.TABLE_PATHS}
+        self.raw_items: list[str] = []
+        self.materials: list[tuple[str, int]] = []
+        self.dishes: list[tuple[str, int]] = []
+        self.talents_by_anchor: dict[str, list[str]] = {anchor: [] for anchor in ANCHORS}
+        self.modifier_ids: list[str] = []
+
+    def build(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Generates every table and returns them keyed like IcarusDataLoader.load_all_data.
+        """
+        self._build_benches_and_talents()
+        self._build_tag_queries()
+        self._build_modifiers()
+        self._build_raw_items()
+        self._build_materials()
+        self._build_dishes("foods", "Food", "Item.Consumable.Food")
+        self._build_dishes("drinks", "Drink", "Item.Consumable.Drink")
+        self._build_dishes("medicines", "Medicine", "Item.Consumable.Medicine")
+        self._build_orbital_items()
+        self._build_cycles()
+        self._build_misc()
+        return self.tables
+
+    def _add_item(self, name: str, tags: list[str], consumable: bool, display: str, extra: dict[str, Any] = None):
+        """
+        Adds a D_ItemsStatic row with its D_Itemable entry.
+        """
+        row = {
+            "Name": name,
+            "Itemable": _ref(f"Item_{name}"),
+            "Consumable": _ref(name if consumable else "None"),
+            "Manual_Tags": _tags(*tags),
+            "Generated_Tags": _tags()
+        }
+        row.update(extra or {})
+        self.tables["items_static"].append(row)
+        self.tables["itemable"].append({
+            "Name": f"Item_{name}",
+            "DisplayName": _loc("D_Itemable", f"Item_{name}-DisplayName", display),
+            "Description": _loc("D_Itemable", f"Item_{name}-Description", f"A synthetic {display.lower()}.")
+        })
+
+    def _add_consumable(self, name: str, stats: dict[str, float], modifier: str = "None", lifetime: int = 0):
+        """
+        Adds a D_Consumable row with recovery stats and an optional modifier.
+        """
+        self.tables["consumables"].append({
+            "Name": name,
+            "Stats": {f'(Value="Base{stat}Recovery_+")': value for stat, value in stats.items()},
+            "Modifier": {"Modifier": _ref(modifier), "ModifierLifetime": lifetime}
+        })
+
+    def _add_recipe(self, name: str, output: str, count: int, tier: int, inputs: list[tuple[str, int]], query_inputs: list[tuple[str, int]]):
+        """
+        Adds a D_ProcessorRecipes row crafted at one or two benches of the given tier.
+        """
+        benches = self.rng.sample(BENCHES_BY_TIER[tier], k=min(len(BENCHES_BY_TIER[tier]), self.rng.randint(1, 2)))
+        anchor = ANCHORS[tier - 1]
+        talents = self.talents_by_anchor[anchor]
+        requirement = self.rng.choice(talents) if talents and self.rng.random() < 0.7 else "None"
+
+        row = {
+            "Name": name,
+            "Requirement": _ref(requirement),
+            "RecipeSets": [_ref(b) for b in benches],
+            "Inputs": [{"Element": _ref(n), "Count": c} for n, c in inputs],
+            "QueryInputs": [{"Query": _ref(q), "Count": c} for q, c in query_inputs],
+            "Outputs": [{"Element": _ref(output), "Count": count}],
+            "RequiredMillijoules": self.rng.choice([0, 0, 500, 1000, 2500, 5000]) * tier
+        }
+        # Character and session requirements are row handles on a few recipes
+        # (by position, so the random draws and the rest of the corpus stay the same)
+        position = len(self.tables["recipes"])
+        if position % 7 == 3:
+            row["CharacterRequirement"] = _ref(f"Character_Level_{tier * 10}")
+        if position % 11 == 5:
+            row["SessionRequirement"] = {"RowName": "DLC_Farming", "DataTableName": "D_SessionRequirements"}
+        self.tables["recipes"].append(row)
+
+    def _build_benches_and_talents(self):
+        """
+        Builds D_RecipeSets plus a talent tree rooted at the four anchors, with
+        bench-unlock talents and chains of recipe talents under each anchor.
+        """
+        for bench in BENCHES:
+            self.tables["recipe_sets"].append({"Name": bench})
+
+        talents = self.tables["talents"]
+        previous = None
+        for anchor in ANCHORS:
+            talents.append({
+                "Name": anchor,
+                "RequiredTalents": [_ref(previous)] if previous else [],
+                "ExtraData": _ref(f"Item_{anchor}")
+            })
+            previous = anchor
+
+        for bench, parent in BENCHES.items():
+            if parent and bench not in ANCHORS:
+                talents.append({"Name": f"Unlock_{bench}", "RequiredTalents": [_ref(parent)], "ExtraData": _ref(f"Item_{bench}")})
+
+        per_anchor = _scaled("talents_per_anchor", self.scale)
+        for anchor in ANCHORS:
+            chain = [anchor]
+            for i in range(per_anchor):
+                name = f"{anchor}_Talent_{i}"
+                parent = self.rng.choice(chain[-4:])
+                talents.append({"Name": name, "RequiredTalents": [_ref(parent)], "ExtraData": _ref("None")})
+                chain.append(name)
+                self.talents_by_anchor[anchor].append(name)
+
+    def _build_tag_queries(self):
+        """
+        Builds D_TagQueries (with Unreal token streams) and matching D_CraftingTags rows.
+        """
+        for name, (op, tags) in TAG_QUERIES.items():
+            stream = [0, 1, QUERY_OPS[op], len(tags)] + list(range(len(tags)))
+            self.tables["tag_queries"].append({
+                "Name": name,
+                "Query": {
+                    "TokenStreamVersion": 0,
+                    "TagDictionary": [{"TagName": t} for t in tags],
+                    "QueryTokenStream": stream,
+                    "UserDescription": "",
+                    "AutoDescription": f" {op}( {', '.join(tags)} )"
+                }
+            })
+            self.tables["crafting_tags"].append({
+                "Name": name,
+                "TagName": _loc("D_CraftingTags", f"{name}-TagName", name.replace("Any_", "").replace("_", " ")),
+                "Query": _ref(name)
+            })
+
+    def _build_modifiers(self):
+        """
+        Builds D_ModifierStates rows granting one to three stats each.
+        """
+        for i in range(_scaled("modifiers", self.scale)):
+            name = f"Buff_{i}"
+            granted = {}
+            for stat, suffix in self.rng.sample(MODIFIER_STATS, k=self.rng.randint(1, 3)):
+                value = 1 if suffix == "_?" else self.rng.choice([5, 10, 15, 20, 25, 50, -10])
+                granted[f'(Value="{stat}{suffix}")'] = value
+            self.tables["modifiers"].append({
+                "Name": name,
+                "ModifierName": _loc("D_ModifierStates", f"{name}-ModifierName", f"Buff {i}"),
+                "ModifierDescription": _loc("D_ModifierStates", f"{name}-ModifierDescription", f"Synthetic buff {i}."),
+                "GrantedStats": granted
+            })
+            self.modifier_ids.append(name)
+
+    def _build_raw_items(self):
+        """
+        Builds harvestable crops, meats and fish, with farming data for crops.
+        """
+        for key, (label, tag_pool) in RAW_KINDS.items():
+            for i in range(_scaled(key, self.scale)):
+                name = f"{label}_{i}"
+                tags = [self.rng.choice(tag_pool), "Item.Consumable.Food.Raw"]
+                self._add_item(name, tags, consumable=True, display=f"{label} {i}")
+                self._add_consumable(name, {"Food": float(self.rng.randint(5, 20))})
+                self.raw_items.append(name)
+                if key == "crops":
+                    self._add_farming(name)
+
+    def _add_farming(self, crop: str):
+        """
+        Adds a seed, its four growth states and the crop reward table.
+        """
+        states = []
+        for stage in range(1, 5):
+            state = f"Growth_{crop}_{stage}"
+            self.tables["farming_growth_states"].append({"Name": state, "TimeToNextState": self.rng.randint(60, 600)})
+            states.append(state)
+
+        reward_id = f"Crop_Reward_{crop}"
+        minimum = self.rng.randint(1, 4)
+        self.tables["item_rewards"].append({
+            "Name": reward_id,
+            "Rewards": [{"Item": _ref(crop), "MinRandomStackCount": minimum, "MaxRandomStackCount": minimum + self.rng.randint(0, 3)}]
+        })
+
+        seed_row = {"Name": f"Seed_{crop}", "CropRewards": _ref(reward_id)}
+        for stage, state in enumerate(states, start=1):
+            seed_row[f"Stage{stage}"] = _ref(state)
+        self.tables["farming_seeds"].append(seed_row)
+
+    def _build_materials(self):
+        """
+        Builds non-consumable intermediates (flour, dough, pastes) crafted from raw items.
+        """
+        for i in range(_scaled("materials", self.scale)):
+            name = f"Material_{i}"
+            tier = self.rng.randint(1, 3)
+            self._add_item(name, ["Item.Resource.Cooking"], consumable=False, display=f"Material {i}")
+            inputs = [(n, self.rng.randint(1, 3)) for n in self.rng.sample(self.raw_items, k=self.rng.randint(1, 2))]
+            query_inputs = []
+            if self.rng.random() < 0.3:
+                query_inputs.append((self.rng.choice(list(TAG_QUERIES)), self.rng.randint(1, 2)))
+            self._add_recipe(name, name, self.rng.randint(1, 2), tier, inputs, query_inputs)
+            self.materials.append((name, tier))
+
+    def _build_dishes(self, key: str, prefix: str, tag: str):
+        """
+        Builds crafted consumables whose recipes draw on raw items, materials and earlier dishes.
+        """
+        for i in range(_scaled(key, self.scale)):
+            name = f"{prefix}_Dish_{i}" if prefix == "Food" else f"{prefix}_{i}"
+            display = f"{prefix} {i}"
+            tier = self.rng.choice([1, 1, 2, 2, 3, 3, 4])
+            self._add_item(name, [tag], consumable=True, display=display)
+
+            if prefix == "Food":
+                stats = {"Food": float(self.rng.randint(20, 80)), "Health": float(self.rng.randint(0, 30))}
+            elif prefix == "Drink":
+                stats = {"Water": float(self.rng.randint(20, 80))}
+            else:
+                stats = {"Health": float(self.rng.randint(10, 60))}
+            modifier = self.rng.choice(self.modifier_ids) if self.rng.random() < 0.9 else "None"
+            self._add_consumable(name, stats, modifier, self.rng.choice([300, 600, 900, 1200, 1800]))
+
+            pool = self.raw_items + [m for m, t in self.materials if t <= tier] + [d for d, t in self.dishes if t <= tier]
+            for variant in range(self.rng.choice([1, 1, 1, 2])):
+                inputs = [(n, self.rng.randint(1, 3)) for n in self.rng.sample(pool, k=min(len(pool), self.rng.randint(1, 4)))]
+                query_inputs = []
+                if self.rng.random() < 0.25:
+                    query_inputs.append((self.rng.choice(list(TAG_QUERIES)), self.rng.randint(1, 3)))
+                suffix = "" if variant == 0 else f"_Alt{variant}"
+                self._add_recipe(f"{name}{suffix}", name, self.rng.randint(1, 2), tier, inputs, query_inputs)
+
+            self.dishes.append((name, tier))
+            if self.rng.random() < 0.3:
+                spoiled = "Spoiled_Meat" if prefix == "Food" else "Spoiled_Plants"
+                self.tables["decayable"].append({"Name": name, "SpoiledItem": _ref(spoiled)})
+
+    def _build_orbital_items(self):
+        """
+        Builds workshop (orbital) consumables with their item templates.
+        """
+        for i in range(_scaled("orbital", self.scale)):
+            name = f"Meta_Ration_{i}"
+            self._add_item(name, ["Item.Consumable.Medicine"], consumable=True, display=f"Orbital Ration {i}")
+            self._add_consumable(name, {"Health": 25.0}, self.rng.choice(self.modifier_ids), 900)
+            self.tables["item_templates"].append({"Name": name})
+            self.tables["workshop_items"].append({"Name": f"Workshop_{name}", "Item": _ref(name)})
+
+    def _build_cycles(self):
+        """
+        Adds a few two-item recipe cycles (e.g., water <-> ice) among materials.
+        """
+        for i in range(max(1, int(round(2 * self.scale)))):
+            a, b = f"Cycle_Liquid_{i}", f"Cycle_Solid_{i}"
+            self._add_item(a, ["Item.Resource.Fluid"], consumable=False, display=f"Liquid {i}")
+            self._add_item(b, ["Item.Resource.Solid"], consumable=False, display=f"Solid {i}")
+            self._add_recipe(f"Freeze_{i}", b, 1, 1, [(a, 1)], [])
+            self._add_recipe(f"Melt_{i}", a, 1, 1, [(b, 1)], [])
+            self.materials.extend([(a, 1), (b, 1)])
+
+    def _build_misc(self):
+        """
+        Adds spoiled products, a fillable container and character flags.
+        """
+        for spoiled in ("Spoiled_Meat", "Spoiled_Plants"):
+            self._add_item(spoiled, ["Item.Consumable.Food"], consumable=True, display=spoiled.replace("_", " "))
+            self._add_consumable(spoiled, {"Food": 2.0})
+
+        self._add_item("Canteen", ["Item.Consumable.Drink"], consumable=True, display="Canteen", extra={"Fillable": _ref("Canteen")})
+        self._add_consumable("Canteen", {"Water": 30.0})
+
+        for i in range(5):
+            self.tables["character_flags"].append({"Name": f"Flag_{i}"})
+
+def build_corpus(scale: float = 1.0, seed: int = 0) -> dict[str, list[dict[str, Any]]]:
+    """
+    Builds a synthetic dataset keyed like IcarusDataLoader.load_all_data.
+    """
+    return SyntheticCorpusBuilder(scale, seed).build()
+
+def write_corpus(out_dir: Path, scale: float = 1.0, seed: int = 0) -> Path:
+    """
+    Writes a synthetic dataset to out_dir using the game's file layout, ready
+    to be read by IcarusDataLoader(pak_dir=out_dir).
+    """
+    out_dir = Path(out_dir)
+    tables = build_corpus(scale, seed)
+    for key, relative_path in IcarusDataLoader.TABLE_PATHS.items():
+        path = out_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"Rows": tables[key]}, f)
+    return out_dir
+
+def main():
+    """Command-line entry point for writing a synthetic corpus."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Icarus game data corpus")
+    parser.add_argument("--scale", type=float, default=1.0, help="Scale factor relative to the real catalog (e.g. 1, 10, 100)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for reproducible corpora")
+    parser.add_argument("--out-dir", type=str, required=True, help="Directory to write the corpus into")
+    args = parser.parse_args()
+
+    out_dir = write_corpus(Path(args.out_dir), args.scale, args.seed)
+    print(f"✅ Synthetic corpus ({args.scale}x, seed {args.seed}) written to {out_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+from icarus_consumables.parser import IcarusFoodParserApp
+
+class PipelineWatcher:
+    """
+    Long-running incremental rebuild loop. Keeps the raw tables, the item
+    index, every service and the parsed items in memory, polls the game
+    data, override and config files for changes, and rebuilds only the
+    services whose declared inputs changed before re-parsing and regenerating.
+    """
+
+    def __init__(
+        self,
+        app: IcarusFoodParserApp,
+        config_path: Path,
+        interval: float = 1.0,
+        load_config: Optional[Callable[[], dict[str, Any]]] = None,
+        create_generators: Optional[Callable[[dict[str, Any]], list[Any]]] = None
+    ):
+        """
+        Initializes the watcher around a configured app (generators already registered).
+        load_config re-reads the config when it changes (default: the plain
+        file, so pass the CLI's loader to keep command-line overrides);
+        create_generators rebuilds the generator set from the new config
+        (default: keep the registered generators).
+        """
+        self.app = app
+        self.config_path = Path(config_path)
+        self.interval = interval
+        self.load_config = load_config
+        self.create_generators = create_generators
+        self.data: dict[str, Any] = {}
+        self.item_index: Any = None
+        self.services: dict[str, Any] = {}
+        self.processed_data: list[Any] = []
+        self._snapshot: dict[str, Any] = {}
+        self._pending: set[str] = set()  # Inputs of a failed rebuild, retried with the next change
+
+    def _watched_paths(self) -> dict[str, list[Path]]:
+        """
+        Returns input name -> files: one entry per raw table, plus "config" and "overrides".
+        """
+        pak_dir = self.app.data_loader.pak_dir
+        paths = {key: [pak_dir / rel] for key, rel in self.app.data_loader.TABLE_PATHS.items()}
+        paths["config"] = [self.config_path]
+        overrides_dir = Path(self.app.config.get("OVERRIDES_DIR", "data/overrides"))
+        paths["overrides"] = sorted(overrides_dir.glob("*.json")) if overrides_dir.exists() else []
+        return paths
+
+    def _take_snapshot(self) -> dict[str, Any]:
+        """
+        Records (name, mtime, size) for every watched file, grouped by input name.
+        """
+        snapshot = {}
+        for key, paths in self._watched_paths().items():
+            entries = []
+            for path in paths:
+                try:
+                    stat = path.stat()
+                    entries.append((path.name, stat.st_mtime_ns, stat.st_size))
+                except FileNotFoundError:
+                    entries.append((path.name, None, None))
+            snapshot[key] = tuple(entries)
+        return snapshot
+
+    def _latest_mtime(self, changed: set[str]) -> Optional[float]:
+        """
+        Returns the newest modification time (epoch seconds) among the changed inputs' files.
+        """
+        mtimes = [mtime for key in changed for _, mtime, _ in self._snapshot.get(key, ()) if mtime is not None]
+        return max(mtimes) / 1e9 if mtimes else None
+
+    def build(self):
+        """
+        Runs the full pipeline once and keeps every intermediate result.
+        """
+        app = self.app
+        self._snapshot = self._take_snapshot()
+        self.data = app.data_loader.load_all_data()
+        self.item_index = app._build_item_index(self.data)
+        self.services = app._build_services(self.data, self.item_index)
+        self.processed_data = app._parse(self.data, self.services, self.item_index)
+        app._generate(self.processed_data, self.item_index)
+
+    def rebuild(self, changed: set[str]) -> list[str]:
+        """
+        Reloads changed inputs, rebuilds the item index and the services that
+        (transitively) depend on them, then re-parses and regenerates output.
+        Returns the names of the rebuilt stages. Inputs of an earlier rebuild
+        that failed part-way are rebuilt again here, since their tables or
+        services may be half-updated; they are only dropped once a rebuild succeeds.
+        """
+        app = self.app
+        rebuilt = []
+        changed = changed | self._pending
+        self._pending = changed
+
+        if "config" in changed:
+            if self.load_config:
+                app.config = self.load_config()
+            else:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    app.config = json.load(f)
+            if self.create_generators:
+                app.generators = self.create_generators(app.config)
+                rebuilt.append("generators")
+
+        for key in changed:
+            if key in app.data_loader.TABLE_PATHS:
+                self.data[key] = app.data_loader.load_json(app.data_loader.TABLE_PATHS[key])
+
+        dirty = set(changed)
+        if dirty & set(app.ITEM_INDEX_TABLES):
+            self.item_index = app._build_item_index(self.data)
+            dirty.add("item_index")
+            rebuilt.append("item_index")
+
+        for name, inputs in app.SERVICE_DEPENDENCIES.items():
+            if dirty & set(inputs):
+                app._build_service(name, self.data, self.item_index, self.services)
+                dirty.add(name)
+                rebuilt.append(name)
+
+        self.processed_data = app._parse(self.data, self.services, self.item_index)
+        app._generate(self.processed_data, self.item_index)
+        rebuilt.extend(["parse", "generate"])
+        self._pending = set()
+        return rebuilt
+
+    def poll(self) -> set[str]:
+        """
+        Returns the inputs that changed since the last snapshot, waiting until
+        the files stop changing so a multi-file re-extract triggers one rebuild.
+        """
+        current = self._take_snapshot()
+        changed = {key for key, entries in current.items() if entries != self._snapshot.get(key)}
+        if not changed:
+            return changed
+
+        while True:
+            time.sleep(self.interval)
+            settled = self._take_snapshot()
+            if settled == current:
+                break
+            changed |= {key for key, entries in settled.items() if entries != current.get(key)}
+            current = settled
+
+        self._snapshot = current
+        return changed
+
+    def run(self):
+        """
+        Builds once, then polls and rebuilds until interrupted.
+        """
+        print("👀 Watch mode: building initial state...")
+        start = time.perf_counter()
+        self.build()
+        print(f"✅ Initial build: {len(self.processed_data)} items in {(time.perf_counter() - start) * 1000:.0f} ms.")
+        print(f"   Watching {self.app.data_loader.pak_dir}, overrides and {self.config_path.name} (Ctrl+C to stop)")
+
+        try:
+            while True:
+                changed = self.poll()
+                if not changed:
+                    time.sleep(self.interval)
+                    continue
+
+                print(f"🔄 Changed: {', '.join(sorted(changed))}")
+                start = time.perf_counter()
+                try:
+                    rebuilt = self.rebuild(changed)
+                except Exception as e:
+                    # Keep watching; a half-written file will usually be fixed by the next
+                    # save, which also rebuilds everything this attempt left pending
+                    print(f"❌ Rebuild failed: {e}")
+                    continue
+
+                rebuild_ms = (time.perf_counter() - start) * 1000
+                saved_at = self._latest_mtime(changed)
+                latency = f", {time.time() - saved_at:.2f} s from save to refreshed output" if saved_at else ""
+                print(f"✅ Rebuilt {', '.join(rebuilt)} in {rebuild_ms:.0f} ms{latency}.")
+        except KeyboardInterrupt:
+            print("👋 Watch mode stopped.")
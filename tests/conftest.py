@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the test suite.
+"""
+import pytest
+from icarus_consumables.models.consumable import ConsumableData
+from icarus_consumables.models.item import IcarusItem
+from icarus_consumables.models.modifier import ModifierEffect, StatEffect
+from icarus_consumables.models.recipe import Ingredient, Recipe
+from icarus_consumables.models.tier import TierInfo
+
+def _make_item(name, tier=0.0, stats=None, effects=(), *, category="Food", modifier=None, lifetime=600,
+               anchor="Character", benches=(), inputs=(), visible=True):
+    """
+    Builds a ConsumableData for hand-written test catalogs. effects are
+    (stat, StatType, value) triples granted by one modifier (named modifier,
+    or "<name>_Buff"); benches or inputs add a recipe producing the item.
+    """
+    modifiers = []
+    if effects or modifier:
+        modifier = modifier or f"{name}_Buff"
+        modifiers.append(ModifierEffect(modifier, modifier, "", lifetime, [StatEffect(n, t, v) for n, t, v in effects]))
+    recipes = []
+    if benches or inputs:
+        recipes.append(Recipe(
+            id=f"R_{name}",
+            benches=list(benches),
+            inputs=[Ingredient(item=IcarusItem(i, i, "")) for i in inputs],
+            outputs=[Ingredient(item=IcarusItem(name, name, ""))]
+        ))
+    return ConsumableData(
+        name=name, display_name=name, description="", category=category, is_visible=visible,
+        base_stats=stats or {}, modifiers=modifiers, recipes=recipes,
+        tier_info=TierInfo(int(tier), tier - int(tier), tier, anchor, tier == 0)
+    )
+
+@pytest.fixture
+def make_item():
+    """Returns the ConsumableData builder for hand-written test catalogs."""
+    return _make_item
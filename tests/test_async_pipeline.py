@@ -0,0 +1,52 @@
+"""
+Tests for the asyncio pipeline mode over a small synthetic corpus.
+"""
+import filecmp
+from icarus_consumables.async_pipeline import AsyncPipeline
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.profiler import PipelineProfiler
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+def _app(corpus_dir, out_dir):
+    app = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {})
+    app.ITEM_INDEX_PATH = str(out_dir / "item_index_mapping.json")
+    generator = JsonGenerator("consumables_data.json")
+    generator.output_path = out_dir / "consumables_data.json"
+    app.add_generator(generator)
+    return app
+
+def test_async_output_matches_sequential(tmp_path):
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    sequential, concurrent = tmp_path / "sequential", tmp_path / "async"
+    sequential.mkdir()
+    concurrent.mkdir()
+
+    _app(corpus_dir, sequential).run()
+    pipeline = AsyncPipeline(_app(corpus_dir, concurrent))
+    items, _ = pipeline.run()
+
+    assert items
+    comparison = filecmp.dircmp(sequential, concurrent)
+    assert comparison.left_list == comparison.right_list
+    assert not comparison.diff_files
+
+    # Stages never start before their dependencies finish
+    for stage, deps in pipeline.dependencies.items():
+        for dep in deps:
+            assert pipeline.spans[dep][1] <= pipeline.spans[stage][0]
+    path, _ = pipeline.critical_path()
+    assert path[-1].startswith("generate:") and "parse" in path
+
+def test_async_stages_nest_under_the_pipeline_span(tmp_path):
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    app = _app(corpus_dir, tmp_path)
+    app.profiler = PipelineProfiler(enabled=True)
+    with app.profiler.stage("async_pipeline"):
+        AsyncPipeline(app).run()
+
+    rows = app.profiler.get_breakdown()
+    assert [name for name, _, depth, _ in rows if depth == 0] == ["async_pipeline"]
+    # Each view is recorded once, directly under the pipeline
+    assert [(name, depth) for name, _, depth, _ in rows if name == "view:payload"] == [("view:payload", 1)]
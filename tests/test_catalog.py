@@ -0,0 +1,54 @@
+"""
+Tests for the indexed ConsumableCatalog query API.
+"""
+import pytest
+from icarus_consumables.models.modifier import StatType
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.catalog import ConsumableCatalog
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+BUFF = [("BaseStaminaRegen", StatType.PERCENTAGE, 10)]
+
+@pytest.fixture
+def items(make_item):
+    return [
+        make_item("Wheat", 0.0, {"BaseFoodRecovery": 5}),
+        make_item("Bread", 1.2, {"BaseFoodRecovery": 40}, BUFF, modifier="Bread_Buff", benches=["Campfire"], inputs=["Wheat"]),
+        make_item("Tea", 2.1, {"BaseWaterRecovery": 30}, BUFF, category="Drink", modifier="Tea_Buff", anchor="Crafting_Bench",
+                  benches=["Kitchen_Stove"], inputs=["Water", "Herb"]),
+        make_item("Juice", 3.0, {"BaseWaterRecovery": 50}, BUFF, category="Drink", modifier="Bread_Buff", anchor="Machine_Bench",
+                  benches=["Kitchen_Stove"], inputs=["Water"]),
+        make_item("Secret", 2.5, category="Drink", visible=False),
+    ]
+
+def test_single_indexes(items):
+    catalog = ConsumableCatalog(items)
+    assert len(catalog) == 4
+    assert catalog.get("tea").name == "Tea"
+    assert catalog.get("Secret") is None
+    assert [i.name for i in catalog.tier_range(1.0, 2.1)] == ["Bread", "Tea"]
+    assert [i.name for i in catalog.query(modifiers=["bread_buff"])] == ["Bread", "Juice"]
+    assert [i.name for i in catalog.query(stats=["BaseStaminaRegen"])] == ["Bread", "Tea", "Juice"]
+
+def test_combined_queries_intersect(items):
+    catalog = ConsumableCatalog(items)
+    assert [i.name for i in catalog.query(categories=["Drink"], min_tier=2.5)] == ["Juice"]
+    assert [i.name for i in catalog.query(benches=["Kitchen_Stove"], ingredients=["Water", "Herb"])] == ["Tea"]
+    assert [i.name for i in catalog.query(categories=["Food", "Drink"], anchor_benches=["Character"], max_tier=1.5)] == ["Wheat", "Bread"]
+    assert catalog.query(categories=["Medicine"], min_tier=0) == []
+    assert len(catalog.query()) == 4
+
+def test_bench_filter_over_parsed_items(tmp_path):
+    # Parsed recipes carry display names in benches and row names in bench_ids
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    items, _ = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {}).process()
+    catalog = ConsumableCatalog(items)
+    row_name, display_name = next(
+        (row, shown) for item in catalog.items for r in item.recipes
+        for row, shown in zip(r.bench_ids, r.benches) if row != shown
+    )
+
+    by_row = catalog.query(benches=[row_name])
+    assert by_row and by_row == catalog.query(benches=[display_name])
+    assert all(display_name in [b for r in item.recipes for b in r.benches] for item in by_row)
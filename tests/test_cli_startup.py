@@ -0,0 +1,34 @@
+"""
+Tests that lightweight CLI paths do not import the pipeline.
+"""
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+PROBE = """
+import json
+import sys
+from icarus_consumables.app import main
+try:
+    main({argv!r})
+except SystemExit:
+    pass
+print(json.dumps(sorted(m for m in sys.modules if m.startswith("icarus_consumables."))))
+"""
+
+def _loaded_modules(argv):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(argv=argv)], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip().splitlines()
+
+@pytest.mark.parametrize("argv", [["--help"], ["serve", "--help"], ["--version"]])
+def test_lightweight_commands_skip_pipeline_imports(argv):
+    lines = _loaded_modules(argv)
+    loaded = json.loads(lines[-1])
+    assert not [m for m in loaded if m.startswith(("icarus_consumables.parser", "icarus_consumables.services.", "icarus_consumables.generators."))]
+    if argv == ["--version"]:
+        assert lines[0].startswith("icarus-consumables ")
@@ -0,0 +1,54 @@
+"""
+Tests for the grow-ratio farming planner.
+"""
+from icarus_consumables.services.bill_of_materials import BillOfMaterials
+from icarus_consumables.services.farming_planner import FarmingPlanner
+from icarus_consumables.services.farming_service import FarmingService
+from icarus_consumables.services.item_index import ItemIndexService
+
+class _StubBom:
+    def __init__(self, results):
+        self.results = results
+
+    def get_bill_of_materials(self, item):
+        return self.results.get(item)
+
+def _planner():
+    # Wheat: 3-5 per 1800 s -> 8 units per plot-hour; Corn: 2 per 3600 s -> 2 per plot-hour
+    farming = FarmingService(
+        [
+            {"Name": "Seed_Wheat", "CropRewards": {"RowName": "R_Wheat"}, "Stage1": {"RowName": "G_Wheat"}},
+            {"Name": "Seed_Corn", "CropRewards": {"RowName": "R_Corn"}, "Stage1": {"RowName": "G_Corn"}},
+        ],
+        [{"Name": "G_Wheat", "TimeToNextState": 1800}, {"Name": "G_Corn", "TimeToNextState": 3600}],
+        [
+            {"Name": "R_Wheat", "Rewards": [{"Item": {"RowName": "Wheat"}, "MinRandomStackCount": 3, "MaxRandomStackCount": 5}]},
+            {"Name": "R_Corn", "Rewards": [{"Item": {"RowName": "Corn"}, "MinRandomStackCount": 2, "MaxRandomStackCount": 2}]},
+        ]
+    )
+    item_index = ItemIndexService()
+    for name in ("Wheat", "Corn", "Bread", "Meat_Pie", "Meat"):
+        item_index.add_entry("D_ItemsStatic", name)
+    norm = lambda n: item_index.get_normalized_id("D_ItemsStatic", n)
+    bom = _StubBom({
+        norm("Bread"): BillOfMaterials({norm("Wheat"): 4.0}, 0.0, "Bread"),
+        norm("Meat_Pie"): BillOfMaterials({norm("Wheat"): 2.0, norm("Corn"): 1.0, norm("Meat"): 1.0}, 0.0, "Meat_Pie"),
+        norm("Wheat"): BillOfMaterials({norm("Wheat"): 1.0}),
+    })
+    return FarmingPlanner(bom, farming, item_index), norm
+
+def test_plot_hours_per_unit():
+    planner, norm = _planner()
+    assert planner.get_crop_rate(norm("Wheat")) == 8.0
+    assert planner.get_plot_hours(norm("Bread")) == {norm("Wheat"): 0.5}
+    assert planner.get_plot_hours(norm("Meat_Pie")) == {norm("Wheat"): 0.25, norm("Corn"): 0.5}
+
+def test_plan_combines_targets():
+    planner, norm = _planner()
+    plan = planner.plan({norm("Bread"): 3.0, norm("Meat_Pie"): 2.0})
+    wheat = plan.crops[norm("Wheat")]
+    assert wheat.units_per_hour == 16.0
+    assert wheat.plots == 2.0 and wheat.plots_rounded == 2
+    assert plan.crops[norm("Corn")].plots_rounded == 1
+    assert plan.other_raw == {norm("Meat"): 2.0}
+    assert plan.total_plots == 3
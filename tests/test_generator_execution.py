@@ -0,0 +1,87 @@
+"""
+Tests for concurrent generator execution with per-generator error isolation.
+"""
+import copy
+import importlib.util
+import threading
+import pytest
+from icarus_consumables.generators.base import BaseGenerator
+from icarus_consumables.generators.registry import GENERATORS, create_generator
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.profiler import PipelineProfiler
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+class _ItemIndex:
+    def export_to_json(self, path):
+        pass
+
+class _RecordingGenerator(BaseGenerator):
+    def __init__(self, filename, barrier=None, fail=False):
+        super().__init__(filename)
+        self.barrier = barrier
+        self.fail = fail
+        self.received = None
+
+    def generate(self, data):
+        self.received = data
+        if self.barrier:
+            # Only passes if every generator is running at the same time
+            self.barrier.wait(timeout=5)
+        if self.fail:
+            raise ValueError("boom")
+        self.output_path.write_text("ok", encoding="utf-8")
+
+def _app(tmp_path, workers, generators):
+    app = IcarusFoodParserApp(IcarusDataLoader(str(tmp_path)), {"GENERATOR_WORKERS": workers})
+    for gen in generators:
+        gen.output_path = tmp_path / gen.output_path.name
+        app.add_generator(gen)
+    return app
+
+def test_generators_run_concurrently_on_a_snapshot(tmp_path):
+    barrier = threading.Barrier(3)
+    generators = [_RecordingGenerator(f"out{i}.txt", barrier) for i in range(3)]
+    items = ["a", "b"]
+    _app(tmp_path, 3, generators)._generate(items, _ItemIndex())
+
+    assert all(gen.received == ("a", "b") for gen in generators)
+    assert all(gen.output_path.read_text(encoding="utf-8") == "ok" for gen in generators)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failing_generator_does_not_lose_other_artifacts(tmp_path, workers):
+    good = _RecordingGenerator("good.txt")
+    bad = _RecordingGenerator("bad.txt", fail=True)
+    app = _app(tmp_path, workers, [bad, good])
+
+    with pytest.raises(RuntimeError, match="bad.txt"):
+        app._generate([], _ItemIndex())
+    assert good.output_path.exists()
+    assert not bad.output_path.exists()
+
+def test_generator_spans_nest_under_the_generate_stage(tmp_path):
+    generators = [_RecordingGenerator(f"out{i}.txt") for i in range(3)]
+    app = _app(tmp_path, 3, generators)
+    app.profiler = PipelineProfiler(enabled=True)
+    with app.profiler.stage("generate"):
+        app._generate([], _ItemIndex())
+
+    rows = app.profiler.get_breakdown()
+    assert [name for name, _, depth, _ in rows if depth == 0] == ["generate"]
+    assert all(depth == 1 for name, _, depth, _ in rows if name == "_RecordingGenerator")
+
+def test_generators_do_not_mutate_items(tmp_path):
+    # Generators share the parsed items across threads, so none may modify them
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    app = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {"GENERATOR_WORKERS": 1})
+    items, _ = app.process()
+    before = copy.deepcopy(items)
+
+    names = [name for name in GENERATORS if name != "similar_items" or importlib.util.find_spec("numpy")]
+    for name in names:
+        gen = create_generator(name, app.config)
+        gen.output_path = tmp_path / gen.output_path.name
+        app.add_generator(gen)
+    app._generate(items, _ItemIndex())
+
+    assert items == before
@@ -0,0 +1,71 @@
+"""
+Tests for the generator registry and the shared data views.
+"""
+import json
+import os
+import subprocess
+import sys
+import pytest
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.generators.registry import DEFAULT_GENERATORS, create_generators, selected_generators
+from icarus_consumables.generators.views import DataViews
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+class _ItemIndex:
+    def export_to_json(self, path):
+        pass
+
+def test_selection_defaults_and_rejects_unknown_names():
+    assert selected_generators({}) == list(DEFAULT_GENERATORS)
+    assert selected_generators({"GENERATORS": ["binary", "json", "binary"]}) == ["binary", "json"]
+    with pytest.raises(ValueError, match="nope"):
+        selected_generators({"GENERATORS": ["json", "nope"]})
+
+def test_only_selected_generator_modules_are_imported():
+    probe = (
+        "import json, sys\n"
+        "from icarus_consumables.generators.registry import create_generators\n"
+        "create_generators({'GENERATORS': ['binary']})\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('icarus_consumables.generators.'))))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True)
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    # BinaryGenerator composes a JsonGenerator as its payload builder
+    assert "icarus_consumables.generators.binary" in loaded
+    assert not {"icarus_consumables.generators.sqlite", "icarus_consumables.generators.search_index",
+                "icarus_consumables.generators.similar_items"} & set(loaded)
+
+def test_payload_view_is_built_once_for_all_generators(tmp_path, monkeypatch):
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    app = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {"GENERATORS": ["json", "sqlite", "search_index", "binary"]})
+    items, _ = app.process()
+    for gen in create_generators(app.config):
+        gen.output_path = tmp_path / gen.output_path.name
+        app.add_generator(gen)
+    assert app.required_views() == ["payload"]
+
+    calls = []
+    build_payload = JsonGenerator.build_payload
+    monkeypatch.setattr(JsonGenerator, "build_payload", lambda self, data: calls.append(self) or build_payload(self, data))
+    app._generate(items, _ItemIndex())
+
+    assert len(calls) == 1
+    with open(tmp_path / "consumables_items.json", encoding="utf-8") as f:
+        assert len(json.load(f)["items"]) == len(build_payload(app.generators[0], items)["items"])
+    assert (tmp_path / "consumables.db").exists() and (tmp_path / "consumables.icb").exists()
+
+def test_payload_view_is_read_only(tmp_path):
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    app = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {})
+    items, _ = app.process()
+    payload = DataViews(tuple(items), JsonGenerator("consumables_data.json")).get("payload")
+
+    with pytest.raises(TypeError, match="read-only"):
+        payload["items"][0]["name"] = "Changed"
+    with pytest.raises(TypeError, match="read-only"):
+        payload["items"].append({})
+    # Still plain JSON to the encoder
+    assert json.loads(json.dumps(payload))["items"][0] == payload["items"][0]
@@ -0,0 +1,51 @@
+"""
+Tests for the branch-and-bound loadout optimizer, checked against brute force.
+"""
+from itertools import combinations
+import pytest
+from icarus_consumables.models.modifier import StatType
+from icarus_consumables.services.loadout_optimizer import LoadoutOptimizer
+
+pytest.importorskip("numpy")
+
+@pytest.fixture
+def items(make_item):
+    def item(name, category, tier, modifier, stamina, health=0):
+        effects = [("BaseStaminaRegen", StatType.FLAT, stamina), ("BaseMaximumHealth", StatType.FLAT, health)]
+        return make_item(name, tier, effects=effects, category=category, modifier=modifier)
+    return [
+        item("Pie", "Food", 3.0, "Pie_Buff", 30, 10),
+        item("Pie_Large", "Food", 3.5, "Pie_Buff", 35, 10),
+        item("Stew", "Food", 2.0, "Stew_Buff", 20, 40),
+        item("Bread", "Food", 1.0, "Bread_Buff", 10, 5),
+        item("Salad", "Food", 1.0, "Salad_Buff", 15, 0),
+        item("Tea", "Drink", 2.0, "Tea_Buff", 25, 0),
+        item("Water", "Drink", 0.0, "Water_Buff", 1, 1),
+    ]
+
+WEIGHTS = {"BaseStaminaRegen": 1.0, "BaseMaximumHealth": 0.5}
+
+def _brute_force(items, size, max_tier=None):
+    results = []
+    for combo in combinations(items, size):
+        mods = [i.modifiers[0].id for i in combo]
+        if len(set(mods)) < len(mods) or (max_tier is not None and any(i.tier_info.total_tier > max_tier for i in combo)):
+            continue
+        score = sum(e.value * WEIGHTS[e.name] for i in combo for e in i.modifiers[0].effects)
+        results.append(score)
+    return sorted(results, reverse=True)
+
+def test_matches_brute_force(items):
+    optimizer = LoadoutOptimizer(items)
+    loadouts = optimizer.optimize(WEIGHTS, size=3, top_k=4)
+    assert [l.score for l in loadouts] == _brute_force(items, 3)[:4]
+    assert all(not ({"Pie", "Pie_Large"} <= set(l.items)) for l in loadouts)
+    assert loadouts[0].stats["BaseStaminaRegen"] == 35 + 20 + 25
+
+def test_constraints(items):
+    optimizer = LoadoutOptimizer(items)
+    best = optimizer.optimize(WEIGHTS, category_mix={"Food": 2, "Drink": 1}, max_tier=2.0, top_k=1)[0]
+    assert sorted(best.items) == ["Salad", "Stew", "Tea"]
+    assert optimizer.optimize(WEIGHTS, category_mix={"Drink": 3}) == []
+    with_duplicates = optimizer.optimize(WEIGHTS, size=2, top_k=1, allow_duplicate_modifiers=True)[0]
+    assert sorted(with_duplicates.items) == ["Pie_Large", "Stew"]
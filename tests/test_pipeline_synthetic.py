@@ -0,0 +1,58 @@
+"""
+End-to-end pipeline test over a small synthetic corpus written in the game's file layout.
+"""
+import json
+import pytest
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.models.consumable import ConsumableData
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.path_resolver import resolve_path
+from icarus_consumables.utils.synthetic_corpus import build_corpus, write_corpus
+
+def _load_config():
+    with open(resolve_path("src/icarus_consumables/config/processing_config.json"), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def test_corpus_is_deterministic_and_scales():
+    small = build_corpus(scale=0.1, seed=3)
+    assert small == build_corpus(scale=0.1, seed=3)
+    assert set(small) == set(IcarusDataLoader.TABLE_PATHS)
+    assert len(build_corpus(scale=0.5)["consumables"]) > len(small["consumables"])
+
+def test_pipeline_runs_on_synthetic_corpus(tmp_path):
+    out_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    app = IcarusFoodParserApp(IcarusDataLoader(str(out_dir)), _load_config())
+
+    data = app.data_loader.load_all_data()
+    item_index = app._build_item_index(data)
+    services = app._build_services(data, item_index)
+    items = app._parse(data, services, item_index)
+
+    assert items
+    crafted = [i for i in items if i.recipes]
+    assert crafted
+    assert all(i.raw_materials for i in crafted if i.energy_cost is not None)
+    assert any(i.tier_info.is_orbital for i in items)
+    assert services["recipe_graph"].get_cyclic_components()
+
+def test_bench_view_inverts_grouped_recipes(tmp_path):
+    out_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    items, _ = IcarusFoodParserApp(IcarusDataLoader(str(out_dir)), _load_config()).process()
+    payload = JsonGenerator("consumables_data.json").build_payload(items)
+
+    benches = payload["benches"]
+    assert [(b["rank"], b["name"]) for b in benches] == sorted((b["rank"], b["name"]) for b in benches)
+    for bench in benches:
+        for entry in bench["items"]:
+            recipe = payload["recipes"][entry["recipe"]]
+            assert bench["name"] in recipe["benches"]
+            assert entry["talent"] == recipe["requirements"]["talent"]
+
+def test_shared_empty_containers_are_read_only():
+    first, second = ConsumableData("a", "A", ""), ConsumableData("b", "B", "")
+    assert first.used_in is second.used_in and first.used_in == []
+    with pytest.raises(TypeError):
+        first.used_in.append("c")
+    first.used_in = ["c"]
+    assert second.used_in == [] and json.dumps(second.plot_hours) == "{}"
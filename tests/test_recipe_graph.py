@@ -0,0 +1,141 @@
+"""
+Unit tests for the recipe graph and the passes built on top of it.
+Uses small inline fixtures shaped like D_ProcessorRecipes rows.
+"""
+import pytest
+from dataclasses import FrozenInstanceError
+from icarus_consumables.services.item_index import ItemIndexService
+from icarus_consumables.services.tag_service import IcarusTagService
+from icarus_consumables.services.recipe_service import RecipeService
+from icarus_consumables.services.recipe_graph import RecipeGraph
+from icarus_consumables.services.bill_of_materials import BillOfMaterialsService
+from icarus_consumables.services.tier_mapper import IcarusTierMapper
+from icarus_consumables.services.tier_propagation import TierPropagationService
+
+def _ref(name, count=1):
+    return {"Element": {"RowName": name}, "Count": count}
+
+def _recipe(name, inputs, outputs, benches=("Character",), query_inputs=(), energy=0, talent="None"):
+    return {
+        "Name": name,
+        "Inputs": [_ref(n, c) for n, c in inputs],
+        "QueryInputs": [{"Query": {"RowName": q}, "Count": c} for q, c in query_inputs],
+        "Outputs": [_ref(n, c) for n, c in outputs],
+        "RecipeSets": [{"RowName": b} for b in benches],
+        "Requirement": {"RowName": talent},
+        "RequiredMillijoules": energy
+    }
+
+ITEMS_STATIC = [
+    {"Name": "Wheat", "Manual_Tags": {"GameplayTags": [{"TagName": "Item.Plant.Crop"}]}},
+    {"Name": "Corn", "Manual_Tags": {"GameplayTags": [{"TagName": "Item.Plant.Crop"}]}},
+    {"Name": "Flour"},
+    {"Name": "Dough"},
+    {"Name": "Bread"},
+    {"Name": "Water"},
+    {"Name": "Ice"},
+    {"Name": "Jam"},
+    {"Name": "Jam_Toast"},
+]
+
+TAG_QUERIES = [{
+    "Name": "Any_Crop",
+    "Query": {"TagDictionary": [{"TagName": "Item.Plant.Crop"}], "QueryTokenStream": [0, 1, 1, 1, 0]}
+}]
+
+RECIPES = [
+    _recipe("Flour", [], [("Flour", 1)], query_inputs=[("Any_Crop", 2)], energy=1000),
+    _recipe("Dough", [("Flour", 2), ("Water", 1)], [("Dough", 1)]),
+    _recipe("Bread", [("Dough", 1)], [("Bread", 2)], benches=("Kitchen_Stove",), energy=4000),
+    _recipe("Bread_Rustic", [("Flour", 3)], [("Bread", 1)]),
+    _recipe("Jam", [("Corn", 2)], [("Jam", 1)], benches=("Kitchen_Stove",)),
+    _recipe("Jam_Toast", [("Jam", 1), ("Bread", 1)], [("Jam_Toast", 1)]),
+    _recipe("Melt_Ice", [("Ice", 1)], [("Water", 1)]),
+    _recipe("Freeze_Water", [("Water", 1)], [("Ice", 1)]),
+]
+
+def _services():
+    item_index = ItemIndexService()
+    for row in ITEMS_STATIC:
+        item_index.add_entry("D_ItemsStatic", row["Name"])
+    tag_service = IcarusTagService([], TAG_QUERIES, ITEMS_STATIC)
+    recipe_service = RecipeService(RECIPES, ITEMS_STATIC, tag_service, item_index)
+    return recipe_service, RecipeGraph(RECIPES, recipe_service), item_index
+
+def test_producers_and_consumers():
+    _, graph, _ = _services()
+    assert graph.get_producers("bread") == ["Bread", "Bread_Rustic"]
+    assert graph.get_consumers("flour") == ["Dough", "Bread_Rustic"]
+    # Generic tag inputs are expanded to their satisfying items
+    assert graph.get_consumers("wheat") == ["Flour"]
+    assert graph.get_consumers("corn") == ["Flour", "Jam"]
+
+def test_used_in_index():
+    _, graph, _ = _services()
+    assert graph.get_used_in("dough") == ["bread"]
+    assert graph.get_used_in("water") == ["dough", "ice"]
+    assert graph.get_used_in("flour") == ["bread", "dough"]
+    assert graph.get_used_in("bread") == ["jamtoast"]
+    assert graph.get_used_in("jamtoast") == []
+
+def test_cycles_and_topological_order():
+    _, graph, _ = _services()
+    assert graph.get_cyclic_components() == [["ice", "water"]]
+    assert graph.is_cyclic("water") and not graph.is_cyclic("bread")
+
+    order = graph.topological_order()
+    for before, after in [("wheat", "flour"), ("flour", "dough"), ("water", "dough"), ("dough", "bread")]:
+        assert order.index(before) < order.index(after)
+
+def test_bill_of_materials():
+    _, graph, _ = _services()
+    boms = BillOfMaterialsService(graph)
+
+    flour = boms.get_bill_of_materials("flour")
+    assert flour.raw_inputs == {"corn": 2.0} and flour.energy_cost == 1000.0
+
+    # Cheapest of the two bread recipes, split across the two loaves produced
+    bread = boms.get_bill_of_materials("bread")
+    assert bread.recipe_id == "Bread"
+    assert bread.raw_inputs == {"corn": 2.0, "water": 0.5}
+    assert bread.energy_cost == 3000.0
+
+    # The water/ice cycle is broken by treating its members as raw
+    assert boms.get_bill_of_materials("water").recipe_id is None
+
+def test_bill_of_materials_raw_items():
+    _, graph, _ = _services()
+    boms = BillOfMaterialsService(graph, raw_items={"flour"})
+    assert boms.get_bill_of_materials("flour").raw_inputs == {"flour": 1.0}
+    assert boms.get_bill_of_materials("dough").raw_inputs == {"flour": 2.0, "water": 1.0}
+
+def test_tier_propagation():
+    recipe_service, graph, item_index = _services()
+    static_items = {row["Name"]: row for row in ITEMS_STATIC}
+    tier_mapper = IcarusTierMapper(static_items, [], recipe_service, [], [], [], item_index)
+    tiers = TierPropagationService(graph, tier_mapper, item_index)
+
+    assert tiers.item_tiers["wheat"].total_tier == 0.0
+    assert tiers.item_tiers["flour"].total_tier == 1.0
+    # Cheapest bread recipe stays at the Character bench
+    assert tiers.item_tiers["bread"].total_tier == 1.0
+    # Made at the Character bench, but its jam needs a Tier 4 bench
+    jam_toast = tiers.item_tiers["jamtoast"]
+    assert tier_mapper.calculate_recipe_tier(graph.recipes["Jam_Toast"]).total_tier == 1.0
+    assert jam_toast.total_tier == 4.0 and jam_toast.anchor_bench == "Fabricator"
+
+    resolved = tiers.get_item_tier("Jam_Toast", [graph.recipes["Jam_Toast"]])
+    assert resolved.total_tier == 4.0 and not resolved.is_harvested
+    # Shared precomputed tiers are frozen, so an override cannot leak into them
+    with pytest.raises(FrozenInstanceError):
+        resolved.total_tier = 9.0
+    assert tiers.item_tiers["jamtoast"].total_tier == 4.0
+
+if __name__ == "__main__":
+    test_producers_and_consumers()
+    test_used_in_index()
+    test_cycles_and_topological_order()
+    test_bill_of_materials()
+    test_bill_of_materials_raw_items()
+    test_tier_propagation()
+    print("Recipe graph tests passed.")
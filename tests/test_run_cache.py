@@ -0,0 +1,41 @@
+"""
+Unit tests for the whole-run result cache.
+"""
+from icarus_consumables.utils.run_cache import RunCache
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return path
+
+def test_fingerprint_tracks_inputs(tmp_path):
+    cache = RunCache(tmp_path / "cache")
+    table = _write(tmp_path / "data" / "D_Consumable.json", '{"Rows": []}')
+    overrides = tmp_path / "overrides"
+    _write(overrides / "a.json", "{}")
+    config = {"PARSER_VERSION": "v1", "PROFILE_DIR": "x"}
+
+    base = cache.compute_fingerprint([table], config, overrides_dir=overrides)
+    assert base == cache.compute_fingerprint([table], dict(config, PROFILE_DIR="y"), overrides_dir=overrides)
+    assert base != cache.compute_fingerprint([table], dict(config, PARSER_VERSION="v2"), overrides_dir=overrides)
+
+    _write(overrides / "a.json", '{"Bread": {"is_visible": false}}')
+    changed = cache.compute_fingerprint([table], config, overrides_dir=overrides)
+    assert changed != base
+
+    _write(table, '{"Rows": [{"Name": "Bread"}]}')
+    assert cache.compute_fingerprint([table], config, overrides_dir=overrides) != changed
+
+def test_store_and_restore_artifacts(tmp_path):
+    cache = RunCache(tmp_path / "cache", max_entries=1)
+    artifact = _write(tmp_path / "out" / "items.json", "[1, 2, 3]")
+
+    assert cache.restore("abc") is None
+    cache.store("abc", [artifact])
+    artifact.unlink()
+
+    assert cache.restore("abc") == [artifact.resolve()]
+    assert artifact.read_text(encoding='utf-8') == "[1, 2, 3]"
+
+    cache.store("def", [artifact])
+    assert cache.restore("abc") is None
@@ -0,0 +1,44 @@
+"""
+Tests for the full-text search index generator.
+"""
+import json
+from icarus_consumables.generators.search_index import SearchIndex, SearchIndexGenerator, tokenize
+
+def _payload() -> dict:
+    item = {"base_stats": {}, "description": None, "modifiers": [], "category": "Food"}
+    return {
+        "metadata": {"parser_version": "test", "game_version": "test"},
+        "items": [
+            {**item, "name": "berry_pie", "display_name": "Berry Pie", "description": "A sweet pie.", "base_stats": {"Food": 40.0}},
+            {**item, "name": "stamina_stew", "display_name": "Stamina Stew", "modifiers": ["Stew_Buff"]},
+            {**item, "name": "water", "display_name": "Purified Water", "category": "Drink"}
+        ],
+        "recipes": {},
+        "modifiers": {
+            "Stew_Buff": {"id": "Stew_Buff", "display_name": "Well Fed", "effects": {"BaseStaminaRegen%": 0.2}, "lifetime": 600, "description": None}
+        },
+        "stat_metadata": {}
+    }
+
+def test_tokenize_splits_camel_case_and_drops_stop_words():
+    assert tokenize("BaseStaminaRegen of the Bear's Den 2") == ["base", "stamina", "regen", "bear", "den", "2"]
+
+def test_index_ranks_and_matches_prefixes(tmp_path):
+    generator = SearchIndexGenerator("consumables_search.json")
+    generator.payload_builder.stat_metadata_map = {"BaseStaminaRegen": {"label": "Stamina Regen", "categories": []}}
+    generator.output_path = tmp_path / "consumables_search.json"
+    index = generator.build_index(_payload())
+
+    assert index["terms"] == sorted(index["terms"])
+    assert index["documents"][0] == ["berry_pie", "Berry Pie", "Food"]
+
+    with open(generator.output_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    search = SearchIndex.load(generator.output_path)
+
+    # Prefixes match partially typed words; modifier names are indexed; all words must match
+    assert [name for name, _ in search.search("stam")] == ["stamina_stew"]
+    assert [name for name, _ in search.search("fed")] == ["stamina_stew"]
+    assert [name for name, _ in search.search("pie sweet")] == ["berry_pie"]
+    assert search.search("pie water") == []
+    assert search.search("the") == []
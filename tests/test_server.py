@@ -0,0 +1,73 @@
+"""
+Tests for the catalog query server over a small synthetic corpus.
+"""
+import http.client
+import json
+import threading
+import pytest
+from icarus_consumables.generators.json import JsonGenerator
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.server import CatalogHTTPServer, CatalogQueryService
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+@pytest.fixture(scope="module")
+def query_service(tmp_path_factory):
+    corpus_dir = write_corpus(tmp_path_factory.mktemp("corpus"), scale=0.2)
+    app = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {})
+    items, _ = app.process()
+    return CatalogQueryService(items, JsonGenerator("consumables_data.json"))
+
+def test_filters_combine(query_service):
+    status, body = query_service.handle("/items", {"category": ["Drink"], "min_tier": ["2"]})
+    assert status == 200
+    assert body["count"] == len(body["items"]) > 0
+    assert all(i["category"] == "Drink" and i["tier"]["total"] >= 2 for i in body["items"])
+
+    # Row names (as in the README example) and display names select the same items
+    status, body = query_service.handle("/items", {"bench": ["Kitchen_Stove"]})
+    assert status == 200 and body["count"] > 0
+    assert query_service.handle("/items", {"bench": ["Kitchen Stove"]})[1] == body
+    recipes = query_service.payload["recipes"]
+    assert all(any("Kitchen Stove" in recipes[r]["benches"] for r in i["recipes"]) for i in body["items"])
+
+    status, body = query_service.handle("/items", {"min_tier": ["abc"]})
+    assert status == 400
+
+def test_paging_parameters(query_service):
+    status, body = query_service.handle("/items", {"offset": ["1"], "limit": ["2"]})
+    assert status == 200
+    assert [i["name"] for i in body["items"]] == [i["name"] for i in query_service.handle("/items", {})[1]["items"][1:3]]
+    assert query_service.handle("/items", {"limit": ["0"]})[1]["items"] == []
+
+    for name in ("limit", "offset"):
+        for value in ("inf", "nan", "-1", "1.5", "abc"):
+            status, body = query_service.handle("/items", {name: [value]})
+            assert status == 400 and name in body["error"]
+
+def test_item_lookup(query_service):
+    name = query_service.payload["items"][0]["name"]
+    status, body = query_service.handle(f"/items/{name.upper()}", {})
+    assert status == 200
+    assert body["item"]["name"] == name
+    assert query_service.handle("/items/does_not_exist", {})[0] == 404
+
+def test_etag_revalidation(query_service):
+    server = CatalogHTTPServer(("127.0.0.1", 0), query_service)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        conn = http.client.HTTPConnection(*server.server_address[:2])
+        conn.request("GET", "/items?category=Food")
+        response = conn.getresponse()
+        body = json.loads(response.read())
+        etag = response.getheader("ETag")
+        assert response.status == 200 and etag and body["count"] > 0
+
+        conn.request("GET", "/items?category=Food", headers={"If-None-Match": etag})
+        response = conn.getresponse()
+        response.read()
+        assert response.status == 304
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,51 @@
+"""
+Tests for the nearest-neighbour similarity index.
+"""
+import json
+import pytest
+from icarus_consumables.generators.similar_items import SimilarItemsGenerator
+from icarus_consumables.models.modifier import StatType
+from icarus_consumables.services.similarity import SimilarityIndex
+from icarus_consumables.services.stat_matrix import StatMatrix
+
+np = pytest.importorskip("numpy")
+
+@pytest.fixture
+def items(make_item):
+    def item(name, tier, stats, effects=()):
+        return make_item(name, tier, stats, [(n, StatType.FLAT, v) for n, v in effects])
+    return [
+        item("Bread", 1.0, {"Food": 40.0}, [("BaseMaximumStamina", 50)]),
+        item("Cake", 3.0, {"Food": 80.0}, [("BaseMaximumStamina", 100)]),
+        item("Stew", 2.0, {"Food": 60.0}, [("BaseMaximumStamina", 60), ("BaseMaximumHealth", 10)]),
+        item("Tea", 1.0, {"Water": 30.0}, [("BaseHealthRegen", 5)]),
+        item("Rock", 0.0, {}),
+    ]
+
+def test_neighbours_are_ranked_by_cosine_similarity(items):
+    index = SimilarityIndex(StatMatrix.from_items(items), batch_size=2)
+    neighbours = index.neighbours(k=2)
+
+    # Cake is Bread scaled up: identical direction
+    assert neighbours["Bread"][0] == ("Cake", 1.0)
+    assert [name for name, _ in neighbours["Stew"]] == ["Bread", "Cake"]
+    # No shared stats -> no neighbours; items without stats never appear
+    assert neighbours["Tea"] == []
+    assert neighbours["Rock"] == []
+    assert index.similar_to("Stew", k=2) == neighbours["Stew"]
+    assert index.similar_to("Missing") is None
+
+def test_lower_tier_only(items):
+    index = SimilarityIndex(StatMatrix.from_items(items))
+    assert [name for name, _ in index.similar_to("Stew", lower_tier_only=True)] == ["Bread"]
+    assert index.similar_to("Bread", lower_tier_only=True) == []
+
+def test_generator_writes_output_atomically(items, tmp_path):
+    generator = SimilarItemsGenerator("consumables_similar.json", "v9", "g1", top_k=2)
+    generator.output_path = tmp_path / "consumables_similar.json"
+    generator.generate(items)
+
+    output = json.loads(generator.output_path.read_text(encoding="utf-8"))
+    assert output["metadata"] == {"parser_version": "v9", "game_version": "g1", "top_k": 2, "lower_tier_only": False}
+    assert [n["name"] for n in output["items"]["Bread"]][0] == "Cake"
+    assert [p.name for p in tmp_path.iterdir()] == ["consumables_similar.json"]
@@ -0,0 +1,65 @@
+"""
+Tests for the SQLite generator over a small synthetic corpus.
+"""
+import sqlite3
+from icarus_consumables.generators.binary import BinaryCatalogReader, BinaryGenerator
+from icarus_consumables.generators.sqlite import SqliteGenerator
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+
+def test_database_matches_payload(tmp_path):
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    items, _ = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {}).process()
+
+    generator = SqliteGenerator("consumables.db")
+    generator.output_path = tmp_path / "consumables.db"
+    generator.generate(items)
+    payload = generator.payload_builder.build_payload(items)
+
+    conn = sqlite3.connect(generator.output_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == len(payload["items"])
+        assert conn.execute("SELECT COUNT(*) FROM recipes").fetchone()[0] == len(payload["recipes"])
+        assert conn.execute("SELECT COUNT(*) FROM modifiers").fetchone()[0] == len(payload["modifiers"])
+
+        item = next(i for i in payload["items"] if i["recipes"])
+        recipe_ids = [r for (r,) in conn.execute(
+            "SELECT recipe_id FROM item_recipes WHERE item_name = ? ORDER BY position", (item["name"],)
+        )]
+        assert recipe_ids == list(dict.fromkeys(item["recipes"]))
+
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT name FROM items WHERE category = ? AND tier_total >= ?", ("Food", 2.0)
+        ).fetchall()
+        assert "COVERING INDEX idx_items_category_tier" in plan[0][-1]
+    finally:
+        conn.close()
+
+def test_requirement_handles_are_stored_as_strings(tmp_path):
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    items, _ = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), {}).process()
+
+    generator = SqliteGenerator("consumables.db")
+    generator.output_path = tmp_path / "consumables.db"
+    generator.generate(items)
+    binary = BinaryGenerator("consumables.icb")
+    binary.output_path = tmp_path / "consumables.icb"
+    binary.generate(items)
+    recipes = generator.payload_builder.build_payload(items)["recipes"]
+
+    character = next(rid for rid, r in recipes.items() if r["requirements"]["character"])
+    session = next(rid for rid, r in recipes.items() if r["requirements"]["session"])
+    assert recipes[character]["requirements"]["character"].startswith("Character_Level_")
+    assert recipes[session]["requirements"]["session"] == "DLC_Farming"
+
+    conn = sqlite3.connect(generator.output_path)
+    try:
+        for rid in (character, session):
+            row = conn.execute("SELECT character_req, session_req FROM recipes WHERE id = ?", (rid,)).fetchone()
+            assert row == (recipes[rid]["requirements"]["character"], recipes[rid]["requirements"]["session"])
+    finally:
+        conn.close()
+    with BinaryCatalogReader(binary.output_path) as reader:
+        assert reader.get_recipe(character) == recipes[character]
+        assert reader.get_recipe(session) == recipes[session]
@@ -0,0 +1,46 @@
+"""
+Tests for the columnar NumPy stat matrix.
+"""
+import pytest
+from icarus_consumables.models.modifier import StatType
+from icarus_consumables.services.stat_matrix import StatMatrix
+
+np = pytest.importorskip("numpy")
+
+@pytest.fixture
+def items(make_item):
+    return [
+        make_item("Bread", 1.0, {"Food": 40.0}, [("BaseStaminaRegen", StatType.PERCENTAGE, 10)], lifetime=600),
+        make_item("Stew", 2.0, {"Food": 60.0, "Health": 10.0},
+                  [("BaseStaminaRegen", StatType.PERCENTAGE, 30), ("BaseMaximumHealth", StatType.FLAT, 25)], lifetime=1800),
+        make_item("Tea", 2.0, {"Water": 30.0}, [("BaseStaminaRegen", StatType.PERCENTAGE, 20)], category="Drink", lifetime=300),
+        make_item("Berry", 0.0, {"Food": 5.0}),
+        make_item("Hidden", 1.0, {"Food": 99.0}, visible=False),
+    ]
+
+def test_matrix_layout(items):
+    matrix = StatMatrix.from_items(items)
+    assert matrix.names == ["Bread", "Stew", "Tea", "Berry"]
+    assert "BaseStaminaRegen%" in matrix.stat_names
+    assert matrix.values.shape == (4, len(matrix.stat_names))
+    assert matrix.column("BaseStaminaRegen%").tolist() == [0.1, 0.3, 0.2, 0.0]
+    assert matrix.lifetimes.tolist() == [600, 1800, 300, 0]
+
+def test_ranking_and_scoring(items):
+    matrix = StatMatrix.from_items(items)
+    assert [n for n, _ in matrix.rank("BaseStaminaRegen%", top=2)] == ["Stew", "Tea"]
+    assert [n for n, _ in matrix.rank("BaseStaminaRegen%", top=1, per_second=True)] == ["Tea"]
+    foods = matrix.mask(categories=["Food"], max_tier=1.5)
+    assert [n for n, _ in matrix.top({"Food": 1.0}, k=5, mask=foods)] == ["Bread", "Berry"]
+    scores = matrix.score({"Food": 1.0, "BaseMaximumHealth": 2.0})
+    assert scores.tolist() == [40.0, 110.0, 0.0, 5.0]
+
+def test_save_and_load(items, tmp_path):
+    matrix = StatMatrix.from_items(items)
+    path = tmp_path / "stats.npz"
+    matrix.save(path)
+    loaded = StatMatrix.load(path)
+    assert loaded.names == matrix.names
+    assert loaded.stat_names == matrix.stat_names
+    assert np.array_equal(loaded.values, matrix.values)
+    assert loaded.categories.tolist() == matrix.categories.tolist()
@@ -0,0 +1,77 @@
+"""
+Unit tests for compiled tag-query evaluation in IcarusTagService.
+Uses small inline fixtures shaped like D_ItemsStatic / D_TagQueries rows.
+"""
+from icarus_consumables.services.tag_service import IcarusTagService
+
+def _item(name, *tags):
+    return {"Name": name, "Manual_Tags": {"GameplayTags": [{"TagName": t} for t in tags]}}
+
+def _query(name, tags, stream=None, description=""):
+    return {
+        "Name": name,
+        "Query": {
+            "TagDictionary": [{"TagName": t} for t in tags],
+            "QueryTokenStream": stream or [],
+            "AutoDescription": description
+        }
+    }
+
+ITEMS = [
+    _item("Carrot", "Item.Plant.Vegetable", "Item.Consumable.Food.Raw"),
+    _item("Squash", "Item.Plant.Vegetable"),
+    _item("Berry", "Item.Plant.Fruit"),
+    _item("Raw_Meat", "Item.Creature.Loot.Meat", "Item.Consumable.Food.Raw"),
+]
+
+QUERIES = [
+    # version 0, has root, ANY(1 tag: 0)
+    _query("Any_Vegetable", ["Item.Plant.Vegetable"], [0, 1, 1, 1, 0]),
+    # ALL(Raw, Plant) - hierarchical parent tag match on Item.Plant
+    _query("Raw_Plant", ["Item.Consumable.Food.Raw", "Item.Plant"], [0, 1, 2, 2, 0, 1]),
+    # NONE(Plant)
+    _query("Not_Plant", ["Item.Plant"], [0, 1, 3, 1, 0]),
+    # ANY_EXPR( ANY(Fruit), ALL(Meat) )
+    _query("Fruit_Or_Meat", ["Item.Plant.Fruit", "Item.Creature.Loot.Meat"], [0, 1, 4, 2, 1, 1, 0, 2, 1, 1]),
+    # No token stream: falls back to the auto description
+    _query("Legacy_All", ["Item.Plant", "Item.Consumable.Food.Raw"], description=" ALL( Item.Plant, Item.Consumable.Food.Raw )"),
+]
+
+CRAFTING_TAGS = [
+    {"Name": "Any_Veg", "TagName": 'NSLOCTEXT("", "x", "Vegetable")', "Query": {"RowName": "Any_Vegetable"}},
+]
+
+def _service():
+    return IcarusTagService(CRAFTING_TAGS, QUERIES, ITEMS)
+
+def test_any_query_via_crafting_tag():
+    service = _service()
+    assert service.get_items_for_tag("Any_Veg") == ["Carrot", "Squash"]
+    assert service.get_tag_display_name("Any_Veg") == "Vegetable"
+
+def test_all_and_none_queries():
+    service = _service()
+    assert service.get_items_for_tag("Raw_Plant") == ["Carrot"]
+    assert service.get_items_for_tag("Not_Plant") == ["Raw_Meat"]
+
+def test_nested_expression_query():
+    service = _service()
+    assert service.get_items_for_tag("Fruit_Or_Meat") == ["Berry", "Raw_Meat"]
+
+def test_auto_description_fallback():
+    service = _service()
+    assert service.compile_query("Legacy_All") == ("ALL", ("Item.Plant", "Item.Consumable.Food.Raw"))
+    assert service.get_items_for_tag("Legacy_All") == ["Carrot"]
+
+def test_unknown_tag_resolves_empty():
+    service = _service()
+    assert service.get_items_for_tag("Any_Unknown") == []
+    assert IcarusTagService(CRAFTING_TAGS, QUERIES).get_items_for_tag("Any_Veg") == []
+
+if __name__ == "__main__":
+    test_any_query_via_crafting_tag()
+    test_all_and_none_queries()
+    test_nested_expression_query()
+    test_auto_description_fallback()
+    test_unknown_tag_resolves_empty()
+    print("Tag service tests passed.")
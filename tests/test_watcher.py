@@ -0,0 +1,102 @@
+"""
+Tests for incremental rebuilds in watch mode over a synthetic corpus.
+"""
+import json
+import pytest
+from icarus_consumables.parser import IcarusFoodParserApp
+from icarus_consumables.services.data_loader import IcarusDataLoader
+from icarus_consumables.utils.synthetic_corpus import write_corpus
+from icarus_consumables.watcher import PipelineWatcher
+
+def _watcher(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    corpus_dir = write_corpus(tmp_path / "corpus", scale=0.1)
+    config_path = tmp_path / "config.json"
+    config = {"OVERRIDES_DIR": str(tmp_path / "overrides"), "DEFAULT_VISIBILITY": True}
+    config_path.write_text(json.dumps(config), encoding='utf-8')
+    app = IcarusFoodParserApp(IcarusDataLoader(str(corpus_dir)), config)
+    watcher = PipelineWatcher(app, config_path, interval=0.01)
+    watcher.build()
+    return watcher, corpus_dir
+
+def test_rebuilds_only_dependent_services(tmp_path, monkeypatch):
+    watcher, corpus_dir = _watcher(tmp_path, monkeypatch)
+    recipe_service = watcher.services["recipe"]
+    assert watcher.poll() == set()
+
+    modifiers_path = corpus_dir / IcarusDataLoader.TABLE_PATHS["modifiers"]
+    rows = json.loads(modifiers_path.read_text(encoding='utf-8'))["Rows"]
+    modifiers_path.write_text(json.dumps({"Rows": rows[:1]}), encoding='utf-8')
+
+    changed = watcher.poll()
+    assert changed == {"modifiers"}
+    assert watcher.rebuild(changed) == ["modifier", "parse", "generate"]
+    assert watcher.services["recipe"] is recipe_service
+    assert len(watcher.services["modifier"].modifiers) == 1
+
+def test_override_change_is_detected(tmp_path, monkeypatch):
+    watcher, _ = _watcher(tmp_path, monkeypatch)
+    overrides_dir = tmp_path / "overrides"
+    overrides_dir.mkdir()
+    (overrides_dir / "hide.json").write_text(json.dumps({"Canteen": {"is_visible": False}}), encoding='utf-8')
+
+    changed = watcher.poll()
+    assert changed == {"overrides"}
+    assert watcher.rebuild(changed) == ["override", "parse", "generate"]
+
+def test_config_change_keeps_overrides_and_rebuilds_generators(tmp_path, monkeypatch):
+    watcher, _ = _watcher(tmp_path, monkeypatch)
+    created = []
+
+    def load_config():
+        config = json.loads(watcher.config_path.read_text(encoding='utf-8'))
+        config["GENERATORS"] = ["json"]  # Stands in for a --generators override
+        return config
+
+    def create_generators(config):
+        created.append(config["GENERATORS"])
+        return []
+
+    watcher.load_config = load_config
+    watcher.create_generators = create_generators
+    config = json.loads(watcher.config_path.read_text(encoding='utf-8'))
+    config["DEFAULT_VISIBILITY"] = False
+    watcher.config_path.write_text(json.dumps(config, indent=2), encoding='utf-8')
+
+    changed = watcher.poll()
+    assert changed == {"config"}
+    rebuilt = watcher.rebuild(changed)
+    assert rebuilt[0] == "generators" and "category" in rebuilt
+    assert watcher.app.config["GENERATORS"] == ["json"] and watcher.app.config["DEFAULT_VISIBILITY"] is False
+    assert created == [["json"]]
+
+def test_failed_rebuild_is_retried_with_the_next_change(tmp_path, monkeypatch):
+    watcher, corpus_dir = _watcher(tmp_path, monkeypatch)
+    loader = watcher.app.data_loader
+    modifiers_path = corpus_dir / IcarusDataLoader.TABLE_PATHS["modifiers"]
+    recipes_path = corpus_dir / IcarusDataLoader.TABLE_PATHS["recipes"]
+    rows = json.loads(modifiers_path.read_text(encoding='utf-8'))["Rows"]
+    modifiers_path.write_text(json.dumps({"Rows": rows[:1]}), encoding='utf-8')
+    recipes_path.write_text(recipes_path.read_text(encoding='utf-8') + " ", encoding='utf-8')
+
+    # The recipes table fails to load after the modifiers table was already replaced
+    load_json = loader.load_json
+    def failing_load(relative_path):
+        if relative_path == IcarusDataLoader.TABLE_PATHS["recipes"]:
+            raise ValueError("truncated file")
+        return load_json(relative_path)
+    monkeypatch.setattr(loader, "load_json", failing_load)
+    changed = watcher.poll()
+    assert changed == {"modifiers", "recipes"}
+    with pytest.raises(ValueError):
+        watcher.rebuild(changed)
+
+    # Re-saving only the failed table also rebuilds the modifier service left stale
+    monkeypatch.setattr(loader, "load_json", load_json)
+    recipes_path.write_text(recipes_path.read_text(encoding='utf-8') + " ", encoding='utf-8')
+    changed = watcher.poll()
+    assert changed == {"recipes"}
+    rebuilt = watcher.rebuild(changed)
+    assert "modifier" in rebuilt and "recipe" in rebuilt
+    assert len(watcher.services["modifier"].modifiers) == 1
+    assert watcher.poll() == set() and watcher._pending == set()